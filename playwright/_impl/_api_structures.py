@@ -363,3 +363,21 @@ class ScreencastFrame(TypedDict):
     timestamp: float
     viewportWidth: int
     viewportHeight: int
+
+
+class LatencySnapshot(TypedDict):
+    min: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class ScreencastStats(TypedDict):
+    received: int
+    delivered: int
+    dropped: int
+    queue_depth: int
+    fps: float
+    latency: LatencySnapshot
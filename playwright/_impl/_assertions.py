@@ -12,21 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import collections.abc
+import contextvars
+import os
 from contextlib import contextmanager
-from typing import Any, Iterator, List, Literal, Optional, Pattern, Sequence, Union
+from itertools import chain, repeat
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Sequence,
+    Tuple,
+    Union,
+)
 from urllib.parse import urljoin
 
 from playwright._impl._api_structures import (
     AriaRole,
     ExpectedTextValue,
+    FloatRect,
     FrameExpectOptions,
     FrameExpectResult,
 )
 from playwright._impl._connection import format_call_log
 from playwright._impl._errors import Error
 from playwright._impl._fetch import APIResponse
-from playwright._impl._helper import is_textual_mime_type
+from playwright._impl._helper import (
+    async_readfile,
+    async_writefile,
+    is_textual_mime_type,
+    make_dirs_for_file,
+)
+from playwright._impl._image import (
+    RawImage,
+    compare_images,
+    decode_image,
+    encode_png,
+)
 from playwright._impl._js_handle import parse_value
 from playwright._impl._locator import Locator
 from playwright._impl._page import Page
@@ -60,6 +89,63 @@ def _record_soft_or_raise(error: AssertionError, is_soft: bool) -> None:
     raise error
 
 
+# The batch of the expect.all() block the current task is in. Other tasks on
+# the same loop are not affected.
+_expect_batch: contextvars.ContextVar[Optional["ExpectBatch"]] = contextvars.ContextVar(
+    "ExpectBatch", default=None
+)
+
+
+# While a batch is active, matchers record their expectation instead of sending
+# it. run() then sends all of them at once, so that they are polled concurrently
+# and the whole batch costs a single polling window instead of one per matcher.
+class ExpectBatch:
+    def __init__(self) -> None:
+        self._pending: List[Callable[[], Awaitable[None]]] = []
+        # The first recorded assertion, its loop runs the batch.
+        self._assertion: Optional["AssertionsBase"] = None
+        self._token: Optional[contextvars.Token] = None
+
+    def _start(self) -> None:
+        assert (
+            _expect_batch.get() is None
+        ), "nested expect.all() blocks are not supported"
+        self._token = _expect_batch.set(self)
+
+    def _stop(self) -> None:
+        if self._token:
+            _expect_batch.reset(self._token)
+            self._token = None
+
+    def _add(
+        self, assertion: "AssertionsBase", expect: Callable[[], Awaitable[None]]
+    ) -> None:
+        if not self._assertion:
+            self._assertion = assertion
+        self._pending.append(expect)
+
+    async def run(self) -> None:
+        __tracebackhide__ = True
+        pending, self._pending = self._pending, []
+        results = await asyncio.gather(
+            *[expect() for expect in pending], return_exceptions=True
+        )
+        errors: List[AssertionError] = []
+        for result in results:
+            if isinstance(result, AssertionError):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+        if errors:
+            _record_soft_or_raise(
+                AssertionError(
+                    f"{len(errors)} of {len(results)} expectations failed:\n\n"
+                    + "\n\n".join(str(error) for error in errors)
+                ),
+                False,
+            )
+
+
 class AssertionsBase:
     def __init__(
         self,
@@ -93,6 +179,15 @@ class AssertionsBase:
         title: str = None,
     ) -> None:
         __tracebackhide__ = True
+        batch = _expect_batch.get()
+        if batch is not None:
+            batch._add(
+                self,
+                lambda: self._expect_impl(
+                    expression, expect_options, expected, message, title
+                ),
+            )
+            return
         expect_options["isNot"] = self._is_not
         if expect_options.get("timeout") is None:
             expect_options["timeout"] = self._timeout or 5_000
@@ -132,6 +227,135 @@ class AssertionsBase:
                 self._is_soft,
             )
 
+    async def _expect_screenshot(
+        self,
+        page: Page,
+        take_screenshot: Callable[[float], Awaitable[RawImage]],
+        name: str,
+        timeout: Optional[float],
+        threshold: Optional[float],
+        max_diff_pixels: Optional[int],
+        max_diff_pixel_ratio: Optional[float],
+        snapshot_dir: Union[str, Path, None],
+    ) -> None:
+        __tracebackhide__ = True
+        batch = _expect_batch.get()
+        if batch is not None:
+            batch._add(
+                self,
+                lambda: self._expect_screenshot(
+                    page,
+                    take_screenshot,
+                    name,
+                    timeout,
+                    threshold,
+                    max_diff_pixels,
+                    max_diff_pixel_ratio,
+                    snapshot_dir,
+                ),
+            )
+            return
+        if timeout is None:
+            timeout = self._timeout or 5_000
+        if threshold is None:
+            threshold = 0.2
+        golden_path = _golden_path(page, snapshot_dir, name)
+        update = bool(os.environ.get("PLAYWRIGHT_UPDATE_SNAPSHOTS"))
+        expected: Optional[RawImage] = None
+        if not update and golden_path.exists():
+            expected = decode_image(await async_readfile(golden_path))
+
+        def diff_pixels(actual: RawImage) -> Optional[Tuple[int, RawImage]]:
+            assert expected
+            if (actual.width, actual.height) != (expected.width, expected.height):
+                return None
+            return compare_images(actual, expected, threshold or 0)
+
+        def is_acceptable(diff: Optional[Tuple[int, RawImage]]) -> bool:
+            if diff is None:
+                return False
+            count = diff[0]
+            assert expected
+            if max_diff_pixels is None and max_diff_pixel_ratio is None:
+                return count == 0
+            if max_diff_pixels is not None and count > max_diff_pixels:
+                return False
+            ratio = count / (expected.width * expected.height)
+            return max_diff_pixel_ratio is None or ratio <= max_diff_pixel_ratio
+
+        # Take screenshots until two consecutive ones are identical, so that
+        # animations and late layout do not cause flaky comparisons.
+        deadline = self._loop.time() + timeout / 1000
+        previous: Optional[RawImage] = None
+        stable = False
+        diff: Optional[Tuple[int, RawImage]] = None
+        for interval in chain([0, 100, 250, 500], repeat(1000)):
+            remaining = max(deadline - self._loop.time(), 0.001)
+            actual = await take_screenshot(remaining * 1000)
+            if expected:
+                diff = diff_pixels(actual)
+                if is_acceptable(diff):
+                    return
+            if previous and previous.data == actual.data:
+                stable = True
+                break
+            previous = actual
+            remaining = deadline - self._loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval / 1000, remaining))
+
+        if not expected:
+            if not stable:
+                message = f"Timeout {timeout}ms exceeded while generating screenshot because the page kept changing"
+            else:
+                make_dirs_for_file(golden_path)
+                await async_writefile(golden_path, encode_png(actual))
+                if update:
+                    return
+                message = f"A snapshot doesn't exist at {golden_path}, writing actual."
+            _record_soft_or_raise(AssertionError(message), self._is_soft)
+            return
+
+        actual_path = golden_path.with_name(f"{golden_path.stem}-actual.png")
+        make_dirs_for_file(actual_path)
+        await async_writefile(actual_path, encode_png(actual))
+        if diff is None:
+            message = (
+                f"Expected an image {expected.width}px by {expected.height}px, "
+                f"received {actual.width}px by {actual.height}px."
+            )
+        else:
+            diff_path = golden_path.with_name(f"{golden_path.stem}-diff.png")
+            await async_writefile(diff_path, encode_png(diff[1]))
+            ratio = diff[0] / (expected.width * expected.height)
+            message = (
+                f"{diff[0]} pixels (ratio {ratio:.2f} of all image pixels) are different."
+                f"\nDiff: {diff_path}"
+            )
+        if self._custom_message:
+            message = f"{self._custom_message}\n{message}"
+        _record_soft_or_raise(
+            AssertionError(
+                f"Screenshot comparison failed:\n{message}\nExpected: {golden_path}\nReceived: {actual_path}"
+            ),
+            self._is_soft,
+        )
+
+
+def _golden_path(page: Page, snapshot_dir: Union[str, Path, None], name: str) -> Path:
+    # Goldens are kept per browser engine.
+    browser = page.context.browser
+    browser_type = browser._browser_type if browser else None
+    if not browser_type:
+        raise Error(
+            "to_match_screenshot() needs a page of a browser launched or connected "
+            "through a BrowserType, the browser engine of this page is unknown"
+        )
+    return (
+        Path(snapshot_dir or "__screenshots__") / f"golden-{browser_type.name}" / name
+    )
+
 
 class PageAssertions(AssertionsBase):
     def __init__(
@@ -230,6 +454,47 @@ class PageAssertions(AssertionsBase):
         __tracebackhide__ = True
         await self._not.to_match_aria_snapshot(expected, timeout)
 
+    async def to_match_screenshot(
+        self,
+        name: str,
+        timeout: float = None,
+        threshold: float = None,
+        maxDiffPixels: int = None,
+        maxDiffPixelRatio: float = None,
+        snapshotDir: Union[str, Path] = None,
+        fullPage: bool = None,
+        clip: FloatRect = None,
+        mask: Sequence[Locator] = None,
+        maskColor: str = None,
+        omitBackground: bool = None,
+        animations: Literal["allow", "disabled"] = None,
+        caret: Literal["hide", "initial"] = None,
+        scale: Literal["css", "device"] = None,
+        style: str = None,
+    ) -> None:
+        __tracebackhide__ = True
+        await self._expect_screenshot(
+            self._actual_page,
+            lambda timeout: self._actual_page.screenshot_raw(
+                timeout=timeout,
+                fullPage=fullPage,
+                clip=clip,
+                mask=mask,
+                maskColor=maskColor,
+                omitBackground=omitBackground,
+                animations=animations or "disabled",
+                caret=caret or "hide",
+                scale=scale or "css",
+                style=style,
+            ),
+            name,
+            timeout,
+            threshold,
+            maxDiffPixels,
+            maxDiffPixelRatio,
+            snapshotDir,
+        )
+
 
 class LocatorAssertions(AssertionsBase):
     def __init__(
@@ -1023,6 +1288,43 @@ class LocatorAssertions(AssertionsBase):
         __tracebackhide__ = True
         await self._not.to_match_aria_snapshot(expected, timeout)
 
+    async def to_match_screenshot(
+        self,
+        name: str,
+        timeout: float = None,
+        threshold: float = None,
+        maxDiffPixels: int = None,
+        maxDiffPixelRatio: float = None,
+        snapshotDir: Union[str, Path] = None,
+        mask: Sequence[Locator] = None,
+        maskColor: str = None,
+        omitBackground: bool = None,
+        animations: Literal["allow", "disabled"] = None,
+        caret: Literal["hide", "initial"] = None,
+        scale: Literal["css", "device"] = None,
+        style: str = None,
+    ) -> None:
+        __tracebackhide__ = True
+        await self._expect_screenshot(
+            self._actual_locator.page,
+            lambda timeout: self._actual_locator.screenshot_raw(
+                timeout=timeout,
+                mask=mask,
+                maskColor=maskColor,
+                omitBackground=omitBackground,
+                animations=animations or "disabled",
+                caret=caret or "hide",
+                scale=scale or "css",
+                style=style,
+            ),
+            name,
+            timeout,
+            threshold,
+            maxDiffPixels,
+            maxDiffPixelRatio,
+            snapshotDir,
+        )
+
 
 class APIResponseAssertions:
     def __init__(
@@ -15,7 +15,7 @@
 import asyncio
 from contextlib import AbstractAsyncContextManager
 from types import TracebackType
-from typing import Any, Callable, Generic, Optional, Type, TypeVar, Union
+from typing import Any, Callable, Dict, Generic, List, Optional, Type, TypeVar, Union
 
 from playwright._impl._impl_to_api_mapping import ImplToApiMapping, ImplWrapper
 
@@ -103,3 +103,16 @@ class AsyncContextManager(AsyncBase):
         await self.close()
 
     async def close(self) -> None: ...
+
+
+class AsyncEventStream(AsyncContextManager):
+    # Iterates the batches of an impl stream, whose _next_batch() returns
+    # None once the stream is closed.
+    def __aiter__(self: Self) -> Self:
+        return self
+
+    async def __anext__(self) -> List[Dict[str, Any]]:
+        batch = await self._impl_obj._next_batch()
+        if batch is None:
+            raise StopAsyncIteration
+        return batch
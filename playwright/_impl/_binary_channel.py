@@ -0,0 +1,74 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+import os
+import uuid
+from typing import Dict, Optional
+
+from playwright._impl._errors import Error
+
+# Binary protocol fields are base64 strings. With the binary channel, a large
+# payload is written to a file in a directory shared with the local driver
+# and the field holds "oob:<file name>" instead. ":" is not part of the
+# base64 alphabet, so both forms can not be confused.
+OOB_PREFIX = "oob:"
+
+# Opt-in: drivers validate the initialize parameters and released ones do not
+# know "binaryChannel" yet, so it is only requested when the driver in use is
+# known to support it.
+BINARY_CHANNEL_ENABLED = os.environ.get("PLAYWRIGHT_BINARY_CHANNEL") == "1"
+# Smaller payloads are cheaper to inline than to write to a file.
+DEFAULT_BINARY_CHANNEL_THRESHOLD = 256 * 1024
+
+
+class BinaryChannel:
+    def __init__(self, directory: str, threshold: int) -> None:
+        self._directory = directory
+        self.threshold = threshold
+
+    @staticmethod
+    def from_capability(capability: Optional[Dict]) -> Optional["BinaryChannel"]:
+        # The driver answers the "binaryChannel" request of initialize with the
+        # directory to use. Drivers that do not support it leave it out.
+        if not capability or not capability.get("directory"):
+            return None
+        return BinaryChannel(
+            capability["directory"],
+            capability.get("threshold", DEFAULT_BINARY_CHANNEL_THRESHOLD),
+        )
+
+    def _path(self, name: str) -> str:
+        if os.path.basename(name) != name or name in ("", ".", ".."):
+            raise Error(f"Invalid binary channel payload: {name}")
+        return os.path.join(self._directory, name)
+
+    def decode(self, value: str) -> bytes:
+        if not value.startswith(OOB_PREFIX):
+            return base64.b64decode(value)
+        # The receiving side owns the file once the message has arrived.
+        path = self._path(value.split(":", 1)[1])
+        try:
+            with open(path, "rb") as file:
+                return file.read()
+        finally:
+            os.unlink(path)
+
+    def encode(self, data: bytes) -> str:
+        if len(data) < self.threshold:
+            return base64.b64encode(data).decode()
+        name = uuid.uuid4().hex
+        with open(self._path(name), "wb") as file:
+            file.write(data)
+        return OOB_PREFIX + name
@@ -38,7 +38,7 @@ from playwright._impl._api_structures import (
 from playwright._impl._artifact import Artifact
 from playwright._impl._browser_context import BrowserContext
 from playwright._impl._cdp_session import CDPSession
-from playwright._impl._connection import ChannelOwner, from_channel
+from playwright._impl._connection import ChannelOwner, from_channel, protocol_event
 from playwright._impl._errors import is_target_closed_error
 from playwright._impl._helper import (
     ColorScheme,
@@ -74,18 +74,19 @@ class Browser(ChannelOwner):
 
         self._contexts: Set[BrowserContext] = set()
         self._traces_dir: Optional[str] = None
-        self._channel.on(
-            "context",
-            lambda params: self._did_create_context(
-                cast(BrowserContext, from_channel(params["context"]))
-            ),
-        )
-        self._channel.on("close", lambda _: self._on_close())
         self._close_reason: Optional[str] = None
 
     def __repr__(self) -> str:
         return f"<Browser type={self._browser_type} version={self.version}>"
 
+    @protocol_event("context")
+    def _on_context_event(self, params: Dict) -> None:
+        self._did_create_context(cast(BrowserContext, from_channel(params["context"])))
+
+    @protocol_event("close")
+    def _on_close_event(self, params: Dict) -> None:
+        self._on_close()
+
     def _connect_to_browser_type(
         self,
         browser_type: "BrowserType",
@@ -234,6 +235,8 @@ class Browser(ChannelOwner):
 
     async def close(self, reason: str = None) -> None:
         self._close_reason = reason
+        for context in list(self._contexts):
+            await context._tracing._finish_background_work()
         try:
             if self._should_close_connection_on_close:
                 await self._connection.stop_async()
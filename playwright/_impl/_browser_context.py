@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import asyncio
+import collections
 import json
 from pathlib import Path
 from types import SimpleNamespace
@@ -20,6 +21,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     List,
     Literal,
@@ -27,6 +29,7 @@ from typing import (
     Pattern,
     Sequence,
     Set,
+    Tuple,
     Union,
     cast,
 )
@@ -44,6 +47,7 @@ from playwright._impl._connection import (
     ChannelOwner,
     from_channel,
     from_nullable_channel,
+    protocol_event,
 )
 from playwright._impl._console_message import ConsoleMessage
 from playwright._impl._credentials import Credentials
@@ -71,6 +75,10 @@ from playwright._impl._helper import (
     parse_error,
     to_impl,
 )
+from playwright._impl._js_handle import (
+    register_function_script,
+    registered_function_id,
+)
 from playwright._impl._network import (
     Request,
     Response,
@@ -124,6 +132,8 @@ class BrowserContext(ChannelOwner):
         self._routes: List[RouteHandler] = []
         self._web_socket_routes: List[WebSocketRouteHandler] = []
         self._bindings: Dict[str, Any] = {}
+        # Registered function id to its source and the init script installing it.
+        self._registered_functions: Dict[str, Tuple[str, Disposable]] = {}
         self._timeout_settings = TimeoutSettings(None)
         self._owner_page: Optional[Page] = None
         self._options: Dict[str, Any] = initializer["options"]
@@ -136,86 +146,6 @@ class BrowserContext(ChannelOwner):
         self._request._timeout_settings = self._timeout_settings
         self._clock = Clock(self)
         self._credentials = Credentials(self)
-        self._channel.on(
-            "bindingCall",
-            lambda params: self._on_binding(from_channel(params["binding"])),
-        )
-        self._channel.on("close", lambda _: self._on_close())
-        self._channel.on(
-            "page", lambda params: self._on_page(from_channel(params["page"]))
-        )
-        self._channel.on(
-            "route",
-            lambda params: self._loop.create_task(
-                self._on_route(
-                    from_channel(params.get("route")),
-                )
-            ),
-        )
-        self._channel.on(
-            "webSocketRoute",
-            lambda params: self._loop.create_task(
-                self._on_web_socket_route(
-                    from_channel(params["webSocketRoute"]),
-                )
-            ),
-        )
-
-        self._channel.on(
-            "serviceWorker",
-            lambda params: self._on_service_worker(from_channel(params["worker"])),
-        )
-        self._channel.on(
-            "console",
-            lambda event: self._on_console_message(event),
-        )
-
-        self._channel.on(
-            "dialog", lambda params: self._on_dialog(from_channel(params["dialog"]))
-        )
-        self._channel.on(
-            "pageError",
-            lambda params: self._on_page_error(
-                parse_error(params["error"]["error"]),
-                from_nullable_channel(params["page"]),
-                cast(
-                    WebErrorLocation,
-                    params.get("location") or {"url": "", "line": 0, "column": 0},
-                ),
-            ),
-        )
-        self._channel.on(
-            "request",
-            lambda params: self._on_request(
-                from_channel(params["request"]),
-                from_nullable_channel(params.get("page")),
-            ),
-        )
-        self._channel.on(
-            "response",
-            lambda params: self._on_response(
-                from_channel(params["response"]),
-                from_nullable_channel(params.get("page")),
-            ),
-        )
-        self._channel.on(
-            "requestFailed",
-            lambda params: self._on_request_failed(
-                from_channel(params["request"]),
-                params["responseEndTiming"],
-                params.get("failureText"),
-                from_nullable_channel(params.get("page")),
-            ),
-        )
-        self._channel.on(
-            "requestFinished",
-            lambda params: self._on_request_finished(
-                from_channel(params["request"]),
-                from_nullable_channel(params.get("response")),
-                params["responseEndTiming"],
-                from_nullable_channel(params.get("page")),
-            ),
-        )
         self._closed_future: asyncio.Future = asyncio.Future()
         self.once(
             self.Events.Close, lambda context: self._closed_future.set_result(True)
@@ -233,10 +163,84 @@ class BrowserContext(ChannelOwner):
             }
         )
         self._closing_or_closed = False
+        self._retained_console_messages: Deque[ConsoleMessage] = collections.deque()
 
     def __repr__(self) -> str:
         return f"<BrowserContext browser={self.browser}>"
 
+    @protocol_event("bindingCall")
+    def _on_binding_call_event(self, params: Dict) -> None:
+        self._on_binding(from_channel(params["binding"]))
+
+    @protocol_event("close")
+    def _on_close_event(self, params: Dict) -> None:
+        self._on_close()
+
+    @protocol_event("page")
+    def _on_page_event(self, params: Dict) -> None:
+        self._on_page(from_channel(params["page"]))
+
+    @protocol_event("route")
+    def _on_route_event(self, params: Dict) -> asyncio.Task:
+        return self._loop.create_task(self._on_route(from_channel(params["route"])))
+
+    @protocol_event("webSocketRoute")
+    def _on_web_socket_route_event(self, params: Dict) -> asyncio.Task:
+        return self._loop.create_task(
+            self._on_web_socket_route(from_channel(params["webSocketRoute"]))
+        )
+
+    @protocol_event("serviceWorker")
+    def _on_service_worker_event(self, params: Dict) -> None:
+        self._on_service_worker(from_channel(params["worker"]))
+
+    @protocol_event("dialog")
+    def _on_dialog_event(self, params: Dict) -> None:
+        self._on_dialog(from_channel(params["dialog"]))
+
+    @protocol_event("pageError")
+    def _on_page_error_event(self, params: Dict) -> None:
+        self._on_page_error(
+            parse_error(params["error"]["error"]),
+            from_nullable_channel(params["page"]),
+            cast(
+                WebErrorLocation,
+                params.get("location") or {"url": "", "line": 0, "column": 0},
+            ),
+        )
+
+    @protocol_event("request")
+    def _on_request_event(self, params: Dict) -> None:
+        self._on_request(
+            from_channel(params["request"]),
+            from_nullable_channel(params.get("page")),
+        )
+
+    @protocol_event("response")
+    def _on_response_event(self, params: Dict) -> None:
+        self._on_response(
+            from_channel(params["response"]),
+            from_nullable_channel(params.get("page")),
+        )
+
+    @protocol_event("requestFailed")
+    def _on_request_failed_event(self, params: Dict) -> None:
+        self._on_request_failed(
+            from_channel(params["request"]),
+            params["responseEndTiming"],
+            params.get("failureText"),
+            from_nullable_channel(params.get("page")),
+        )
+
+    @protocol_event("requestFinished")
+    def _on_request_finished_event(self, params: Dict) -> None:
+        self._on_request_finished(
+            from_channel(params["request"]),
+            from_nullable_channel(params.get("response")),
+            params["responseEndTiming"],
+            from_nullable_channel(params.get("page")),
+        )
+
     def _on_page(self, page: Page) -> None:
         self._pages.append(page)
         self.emit(BrowserContext.Events.Page, page)
@@ -416,6 +420,22 @@ class BrowserContext(ChannelOwner):
             await self._channel.send("addInitScript", None, dict(source=script))
         )
 
+    async def register_function(self, source: str) -> str:
+        id = registered_function_id(source)
+        if id not in self._registered_functions:
+            init_script = await self.add_init_script(
+                register_function_script(id, source)
+            )
+            self._registered_functions[id] = (source, init_script)
+        return id
+
+    async def unregister_function(self, fn: str) -> None:
+        # Documents that installed the function already keep it until they
+        # navigate.
+        registration = self._registered_functions.pop(fn, None)
+        if registration:
+            await registration[1].dispose()
+
     async def expose_binding(self, name: str, callback: Callable) -> Disposable:
         for page in self._pages:
             if name in page._bindings:
@@ -582,6 +602,7 @@ class BrowserContext(ChannelOwner):
 
         async def _inner_close() -> None:
             await self._tracing._export_all_hars()
+            await self._tracing._finish_background_work()
 
         await self._channel._connection.wrap_api_call(_inner_close, True)
         await self._channel.send("close", None, {"reason": reason})
@@ -654,6 +675,7 @@ class BrowserContext(ChannelOwner):
         self.emit(BrowserContext.Events.RequestFailed, request)
         if page:
             page.emit(Page.Events.RequestFailed, request)
+        request._mark_finished()
 
     def _on_request_finished(
         self,
@@ -668,9 +690,15 @@ class BrowserContext(ChannelOwner):
             page.emit(Page.Events.RequestFinished, request)
         if response:
             response._finished_future.set_result(True)
+        request._mark_finished()
 
+    @protocol_event("console")
     def _on_console_message(self, event: Dict) -> None:
         message = ConsoleMessage(event, self._loop, self._dispatcher_fiber)
+        # With a memory budget, argument handles may have been evicted and
+        # collected before the event arrived.
+        message._check_released_args()
+        self._retain_console_message(message)
         worker = message.worker
         if worker:
             worker.emit(Worker.Events.Console, message)
@@ -679,6 +707,17 @@ class BrowserContext(ChannelOwner):
             page.emit(Page.Events.Console, message)
         self.emit(BrowserContext.Events.Console, message)
 
+    def _retain_console_message(self, message: ConsoleMessage) -> None:
+        # Chatty pages would otherwise grow the handles held by the driver and
+        # the object registry without bound.
+        retention = self._connection._console_message_retention
+        if retention is None or not message._event["args"]:
+            return
+        retained = self._retained_console_messages
+        retained.append(message)
+        while len(retained) > retention:
+            retained.popleft()._release_args()
+
     def _on_dialog(self, dialog: Dialog) -> None:
         has_listeners = self.emit(BrowserContext.Events.Dialog, dialog)
         page = dialog.page
@@ -13,10 +13,19 @@
 # limitations under the License.
 
 import asyncio
-import json
 import pathlib
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional, Pattern, Sequence, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Pattern,
+    Sequence,
+    Union,
+    cast,
+)
 
 from playwright._impl._api_structures import (
     ClientCertificate,
@@ -40,12 +49,14 @@ from playwright._impl._helper import (
     ReducedMotion,
     ServiceWorkersPolicy,
     TimeoutSettings,
-    async_readfile,
+    async_readfile_cached,
     locals_to_params,
+    parse_json_bytes,
 )
 from playwright._impl._json_pipe import JsonPipeTransport
 from playwright._impl._network import serialize_headers, to_client_certificates_protocol
 from playwright._impl._waiter import throw_on_timeout
+from playwright._impl._websocket_transport import WebSocketTransport
 
 if TYPE_CHECKING:
     from playwright._impl._playwright import Playwright
@@ -217,6 +228,7 @@ class BrowserType(ChannelOwner):
         slowMo: float = None,
         headers: Dict[str, str] = None,
         exposeNetwork: str = None,
+        transport: Literal["driver", "websocket"] = None,
     ) -> Browser:
         if slowMo is None:
             slowMo = 0
@@ -224,30 +236,43 @@ class BrowserType(ChannelOwner):
             timeout = 0
 
         headers = {**(headers if headers else {}), "x-playwright-browser": self.name}
-        local_utils = self._connection.local_utils
-        pipe_channel = (
-            await local_utils._channel.send_return_as_dict(
-                "connect",
-                lambda t: t or 0,
-                {
-                    "endpoint": endpoint,
-                    "headers": headers,
-                    "slowMo": slowMo,
-                    "timeout": timeout,
-                    "exposeNetwork": exposeNetwork,
-                },
+        if transport == "websocket":
+            if exposeNetwork is not None:
+                raise Error('exposeNetwork is not supported with transport="websocket"')
+            connection_transport: Union[JsonPipeTransport, WebSocketTransport] = (
+                await self._open_web_socket_transport(
+                    endpoint, headers, slowMo, timeout
+                )
+            )
+        else:
+            local_utils = self._connection.local_utils
+            pipe_channel = (
+                await local_utils._channel.send_return_as_dict(
+                    "connect",
+                    lambda t: t or 0,
+                    {
+                        "endpoint": endpoint,
+                        "headers": headers,
+                        "slowMo": slowMo,
+                        "timeout": timeout,
+                        "exposeNetwork": exposeNetwork,
+                    },
+                )
+            )["pipe"]
+            connection_transport = JsonPipeTransport(
+                self._connection._loop, pipe_channel
             )
-        )["pipe"]
-        transport = JsonPipeTransport(self._connection._loop, pipe_channel)
 
         connection = Connection(
             self._connection._dispatcher_fiber,
             self._connection._object_factory,
-            transport,
+            connection_transport,
             self._connection._loop,
             local_utils=self._connection.local_utils,
         )
         connection.mark_as_remote()
+        connection.set_metrics_collector(self._connection._metrics_collector)
+        connection._stall_monitor = self._connection._stall_monitor
 
         browser = None
 
@@ -267,7 +292,10 @@ class BrowserType(ChannelOwner):
             if browser:
                 connection._loop.call_soon(browser._on_close)
 
-        transport.once("close", handle_transport_close)
+        if isinstance(connection_transport, WebSocketTransport):
+            connection_transport.on_close = handle_transport_close
+        else:
+            connection_transport.once("close", handle_transport_close)
 
         connection._is_sync = self._connection._is_sync
         connection._loop.create_task(connection.run())
@@ -278,7 +306,7 @@ class BrowserType(ChannelOwner):
             Error("Connection timed out"),
         )
         done, pending = await asyncio.wait(
-            {transport.on_error_future, playwright_future, timeout_future},
+            {connection_transport.on_error_future, playwright_future, timeout_future},
             return_when=asyncio.FIRST_COMPLETED,
         )
         if not playwright_future.done():
@@ -296,6 +324,24 @@ class BrowserType(ChannelOwner):
 
         return browser
 
+    async def _open_web_socket_transport(
+        self, endpoint: str, headers: Dict[str, str], slow_mo: float, timeout: float
+    ) -> WebSocketTransport:
+        transport = WebSocketTransport(
+            self._connection._loop, endpoint, headers, slow_mo
+        )
+        try:
+            await asyncio.wait_for(
+                transport.open(), timeout / 1000 if timeout else None
+            )
+        except asyncio.TimeoutError:
+            transport.dispose()
+            raise Error(f"Timeout {timeout}ms exceeded while connecting to {endpoint}")
+        except OSError as exc:
+            transport.dispose()
+            raise Error(f"WebSocket error: {endpoint} {exc}")
+        return transport
+
     async def _prepare_browser_context_params(self, params: Dict) -> None:
         if params.get("noViewport"):
             del params["noViewport"]
@@ -313,8 +359,8 @@ class BrowserType(ChannelOwner):
         if "storageState" in params:
             storageState = params["storageState"]
             if not isinstance(storageState, dict):
-                params["storageState"] = json.loads(
-                    (await async_readfile(storageState)).decode()
+                params["storageState"] = await async_readfile_cached(
+                    storageState, parse_json_bytes
                 )
         if params.get("colorScheme", None) == "null":
             params["colorScheme"] = "no-override"
@@ -12,13 +12,77 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+from collections import deque
 from types import SimpleNamespace
-from typing import Any, Dict
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
 
-from playwright._impl._connection import ChannelOwner
+from playwright._impl._connection import ChannelOwner, protocol_event
+from playwright._impl._errors import Error
 from playwright._impl._helper import locals_to_params
 
 
+class CDPEventStream:
+    # Batches of {"method", "params"} CDP events, iterated with "async for"
+    # in the async API and with "for" in the sync API, see AsyncEventStream
+    # and SyncEventStream. When the consumer falls behind by more than
+    # max_queue events, the oldest ones are dropped and counted in `dropped`.
+    def __init__(
+        self,
+        session: "CDPSession",
+        methods: Optional[Sequence[str]],
+        max_batch: int,
+        max_queue: int,
+        translate_guids: bool,
+    ) -> None:
+        self._session = session
+        self._loop = session._loop
+        self._dispatcher_fiber = session._dispatcher_fiber
+        self._methods = frozenset(methods) if methods is not None else None
+        self._max_batch = max_batch
+        self._max_queue = max_queue
+        self._translate_guids = translate_guids
+        self._queue: Deque[Dict] = deque()
+        self._waiter: Optional[asyncio.Future] = None
+        self._closed = False
+        self._dropped = 0
+
+    @property
+    def dropped(self) -> int:
+        return self._dropped
+
+    def _push(self, event: Dict) -> None:
+        if len(self._queue) >= self._max_queue:
+            self._queue.popleft()
+            self._dropped += 1
+        self._queue.append(event)
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def close(self) -> None:
+        self._close()
+
+    def _close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._session._remove_stream(self)
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _next_batch(self) -> Optional[List[Dict]]:
+        while not self._queue:
+            if self._closed:
+                return None
+            self._waiter = self._loop.create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        queue = self._queue
+        return [queue.popleft() for _ in range(min(self._max_batch, len(queue)))]
+
+
 class CDPSession(ChannelOwner):
     Events = SimpleNamespace(
         Event="event",
@@ -29,16 +93,117 @@ class CDPSession(ChannelOwner):
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
     ) -> None:
         super().__init__(parent, type, guid, initializer)
-        self._channel.on("event", lambda params: self._on_event(params))
-        self._channel.on("close", lambda _: self.emit(CDPSession.Events.Close, self))
+        self._streams: List[CDPEventStream] = []
+        # Events arrive untranslated, guids are only replaced with channels
+        # when a listener or a translating stream wants the event.
+        self._raw_payloads = True
 
+    @protocol_event("event")
     def _on_event(self, params: Any) -> None:
-        self.emit(params["method"], params.get("params"))
-        self.emit(CDPSession.Events.Event, params)
+        method = params["method"]
+        translated = None
+        for stream in self._streams:
+            if stream._methods is not None and method not in stream._methods:
+                continue
+            if not stream._translate_guids:
+                stream._push(params)
+                continue
+            if translated is None:
+                translated = self._connection._replace_guids_with_channels(params)
+            stream._push(translated)
+        has_method_listeners = bool(self.listeners(method))
+        has_event_listeners = bool(self.listeners(CDPSession.Events.Event))
+        if not has_method_listeners and not has_event_listeners:
+            return
+        if translated is None:
+            translated = self._connection._replace_guids_with_channels(params)
+        if has_method_listeners:
+            self.emit(method, translated.get("params"))
+        if has_event_listeners:
+            self.emit(CDPSession.Events.Event, translated)
+
+    @protocol_event("close")
+    def _on_close_event(self, params: Dict) -> None:
+        self._on_close()
+
+    def _on_close(self) -> None:
+        self._close_streams()
+        self.emit(CDPSession.Events.Close, self)
+
+    def _dispose(self, reason: Optional[str]) -> None:
+        self._close_streams()
+        super()._dispose(reason)
+
+    def _close_streams(self) -> None:
+        for stream in list(self._streams):
+            stream._close()
 
     async def send(self, method: str, params: Dict = None) -> Dict:
         return await self._channel.send("send", None, locals_to_params(locals()))
 
+    async def send_many(
+        self, commands: Sequence[Tuple[str, Optional[Dict]]], concurrency: int = None
+    ) -> List[Any]:
+        # Keeps up to `concurrency` commands in flight on the connection and
+        # returns the results in order. A failed command yields its Error in
+        # place of the result instead of failing the whole batch.
+        if concurrency is not None and concurrency < 1:
+            raise Error("concurrency must be a positive number")
+        results: List[Any] = [None] * len(commands)
+        pending = iter(enumerate(commands))
+
+        async def worker() -> None:
+            for index, (method, params) in pending:
+                try:
+                    results[index] = await self._channel._inner_send(
+                        "send",
+                        None,
+                        (
+                            {"method": method, "params": params}
+                            if params is not None
+                            else {"method": method}
+                        ),
+                        False,
+                    )
+                except Error as error:
+                    results[index] = error
+
+        async def run() -> None:
+            count = min(concurrency or len(commands), len(commands))
+            workers = [self._loop.create_task(worker()) for _ in range(count)]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # Cancellation or a transport failure: stop the other workers
+                # and collect their outcome so that none is left unobserved.
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+
+        await self._connection.wrap_api_call(run)
+        return results
+
+    def stream(
+        self,
+        methods: Sequence[str] = None,
+        maxBatch: int = None,
+        maxQueue: int = None,
+        translateGuids: bool = None,
+    ) -> CDPEventStream:
+        stream = CDPEventStream(
+            self,
+            methods,
+            maxBatch or 1000,
+            maxQueue or 100_000,
+            translateGuids is not False,
+        )
+        self._streams.append(stream)
+        return stream
+
+    def _remove_stream(self, stream: CDPEventStream) -> None:
+        self._streams.remove(stream)
+
     async def detach(self) -> None:
         await self._channel.send(
             "detach",
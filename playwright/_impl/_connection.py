@@ -13,33 +13,42 @@
 # limitations under the License.
 
 import asyncio
+import base64
 import collections.abc
 import contextvars
 import datetime
+import functools
 import inspect
+import random
 import sys
+import time
 import traceback
+import weakref
 from pathlib import Path
+from types import FrameType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Deque,
     Dict,
     List,
     Mapping,
     Optional,
+    Sequence,
+    Set,
     Tuple,
     TypedDict,
+    TypeVar,
     Union,
     cast,
 )
 
-from pyee import EventEmitter
-from pyee.asyncio import AsyncIOEventEmitter
-
 import playwright
 import playwright._impl._impl_to_api_mapping
+from playwright._impl._binary_channel import BINARY_CHANNEL_ENABLED, BinaryChannel
 from playwright._impl._errors import TargetClosedError, rewrite_error
+from playwright._impl._event_emitter import EventEmitter
 from playwright._impl._greenlets import EventGreenlet
 from playwright._impl._helper import (
     Error,
@@ -47,6 +56,8 @@ from playwright._impl._helper import (
     create_task_and_ignore_exception,
     parse_error,
 )
+from playwright._impl._memory_budget import MemoryBudget
+from playwright._impl._metrics import ApiCallMetric, MetricsCollector, StallMonitor
 from playwright._impl._transport import Transport
 
 if TYPE_CHECKING:
@@ -55,15 +66,19 @@ if TYPE_CHECKING:
 
 TimeoutCalculator = Optional[Callable[[Optional[float]], float]]
 _PLAYWRIGHT_MODULE_PATH = str(Path(playwright.__file__).parents[0])
+# Parameter types that are sent as they are.
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool))
 
 
-class Channel(AsyncIOEventEmitter):
+class Channel(EventEmitter):
     def __init__(self, connection: "Connection", object: "ChannelOwner") -> None:
-        super().__init__()
+        super().__init__(connection._loop)
         self._connection = connection
         self._guid = object._guid
         self._object = object
-        self.on("error", lambda exc: self._connection._on_event_listener_error(exc))
+
+    def _on_listener_error(self, exc: BaseException) -> None:
+        self._connection._on_event_listener_error(exc)
 
     async def send(
         self,
@@ -139,18 +154,17 @@ class Channel(AsyncIOEventEmitter):
             error = self._connection._error
             self._connection._error = None
             raise error
+        transport_error = self._connection._transport.on_error_future
+        if transport_error.done():
+            return transport_error.result()
         augmented_params, timeout = _augment_params(params, timeout_calculator)
         callback = self._connection._send_message_to_server(
             self._object, method, augmented_params, timeout
         )
+        # Transport errors fail all pending callbacks, see
+        # Connection._on_transport_error, so the reply is all we wait for.
         try:
-            done, _ = await asyncio.wait(
-                {
-                    self._connection._transport.on_error_future,
-                    callback.future,
-                },
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+            result = await callback.future
         except asyncio.CancelledError as exc:
             await self._connection._abort(
                 self._object,
@@ -158,9 +172,6 @@ class Channel(AsyncIOEventEmitter):
                 str(exc) or "Task was cancelled",
             )
             raise
-        if not callback.future.done():
-            callback.future.cancel()
-        result = next(iter(done)).result()
         # Protocol now has named return values, assume result is one level deeper unless
         # there is explicit ambiguity.
         if not result:
@@ -175,7 +186,45 @@ class Channel(AsyncIOEventEmitter):
         return result[key]
 
 
-class ChannelOwner(AsyncIOEventEmitter):
+ProtocolEventHandler = TypeVar("ProtocolEventHandler", bound=Callable[[Any, Any], Any])
+
+
+def protocol_event(
+    event: str,
+) -> Callable[[ProtocolEventHandler], ProtocolEventHandler]:
+    """Makes the decorated ChannelOwner method handle the protocol event
+    `event`. The method is called with the event params.
+
+    Handlers are collected into a per-class table when the class is created,
+    so constructing an object does not register any listeners.
+    """
+
+    def decorator(handler: ProtocolEventHandler) -> ProtocolEventHandler:
+        handler._protocol_event = event  # type: ignore[attr-defined]
+        return handler
+
+    return decorator
+
+
+class ChannelOwner(EventEmitter):
+    # Event payloads of objects that set this are delivered as received,
+    # without replacing guids with channels.
+    _raw_payloads = False
+    # Protocol event name to the handler declared with @protocol_event,
+    # including the handlers of base classes.
+    _protocol_event_handlers: Dict[str, Callable[[Any, Any], Any]] = {}
+    # Children the memory budget may evict, oldest first.
+    _evictable: Optional["collections.OrderedDict[str, ChannelOwner]"] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        handlers = dict(cls._protocol_event_handlers)
+        for value in cls.__dict__.values():
+            event = getattr(value, "_protocol_event", None)
+            if event:
+                handlers[event] = value
+        cls._protocol_event_handlers = handlers
+
     def __init__(
         self,
         parent: Union["ChannelOwner", "Connection"],
@@ -183,8 +232,7 @@ class ChannelOwner(AsyncIOEventEmitter):
         guid: str,
         initializer: Dict,
     ) -> None:
-        super().__init__(loop=parent._loop)
-        self._loop: asyncio.AbstractEventLoop = parent._loop
+        super().__init__(parent._loop)
         self._dispatcher_fiber: Any = parent._dispatcher_fiber
         self._type = type
         self._guid: str = guid
@@ -206,10 +254,14 @@ class ChannelOwner(AsyncIOEventEmitter):
         self._event_to_subscription_mapping: Dict[str, str] = {}
 
     def _dispose(self, reason: Optional[str]) -> None:
-        # Clean up from parent and connection.
-        if self._parent:
-            del self._parent._objects[self._guid]
-        del self._connection._objects[self._guid]
+        # Clean up from parent and connection. Evicted objects are no longer
+        # registered with either.
+        parent = self._parent
+        if parent:
+            parent._objects.pop(self._guid, None)
+            if parent._evictable and parent._evictable.pop(self._guid, None):
+                self._connection._untrack_evictable()
+        self._connection._forget_object(self._guid)
         self._was_collected = reason == "gc"
 
         # Dispose all children.
@@ -218,10 +270,48 @@ class ChannelOwner(AsyncIOEventEmitter):
         self._objects.clear()
 
     def _adopt(self, child: "ChannelOwner") -> None:
-        del cast("ChannelOwner", child._parent)._objects[child._guid]
+        parent = cast("ChannelOwner", child._parent)
+        parent._objects.pop(child._guid, None)
+        if parent._evictable and parent._evictable.pop(child._guid, None):
+            self._connection._untrack_evictable()
         self._objects[child._guid] = child
         child._parent = self
 
+    def _mark_evictable(self) -> None:
+        # Called once the object is of no further use to Playwright itself,
+        # e.g. a request that finished. With a memory budget, the parent
+        # evicts its oldest such children beyond the budget.
+        budget = self._connection._memory_budget
+        parent = self._parent
+        if not budget or not parent or parent._objects.get(self._guid) is not self:
+            return
+        evictable = parent._evictable
+        if evictable is None:
+            evictable = parent._evictable = collections.OrderedDict()
+        elif self._guid in evictable:
+            return
+        evictable[self._guid] = self
+        budget._tracked += 1
+        while len(evictable) > budget.max_objects:
+            _, object = evictable.popitem(last=False)
+            budget._tracked -= 1
+            del parent._objects[object._guid]
+            self._connection._evict_object(object, parent)
+
+    def _emit_run(
+        self,
+        f: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        monitor = self._connection._stall_monitor
+        if not monitor:
+            super()._emit_run(f, args, kwargs)
+            return
+        token = monitor._listener_started(f)
+        super()._emit_run(f, args, kwargs)
+        monitor._listener_finished(f, token)
+
     def _set_event_to_subscription_mapping(self, mapping: Dict[str, str]) -> None:
         self._event_to_subscription_mapping = mapping
 
@@ -249,31 +339,26 @@ class ChannelOwner(AsyncIOEventEmitter):
 
 
 class ProtocolCallback:
+    __slots__ = ("id", "object", "stack_trace", "no_reply", "metric", "future")
+
     def __init__(
-        self, loop: asyncio.AbstractEventLoop, id: int, no_reply: bool = False
+        self,
+        loop: asyncio.AbstractEventLoop,
+        id: int,
+        object: ChannelOwner,
+        no_reply: bool = False,
     ) -> None:
         self.id = id
-        self.stack_trace: traceback.StackSummary
+        self.object = object
+        # Frames of the call site, formatted only if the call fails.
+        self.stack_trace: Sequence[Any] = ()
         self.no_reply = no_reply
+        self.metric: Optional[ApiCallMetric] = None
+        # Awaited directly by the calling task, so cancelling that task
+        # cancels the future as well.
         self.future = loop.create_future()
         if no_reply:
             self.future.set_result(None)
-        # The outer task can get cancelled by the user, this forwards the cancellation to the inner task.
-        current_task = asyncio.current_task()
-
-        def cb(task: asyncio.Task) -> None:
-            if current_task:
-                current_task.remove_done_callback(cb)
-            if task.cancelled():
-                self.future.cancel()
-
-        if current_task:
-            current_task.add_done_callback(cb)
-            self.future.add_done_callback(
-                lambda _: (
-                    current_task.remove_done_callback(cb) if current_task else None
-                )
-            )
 
 
 class RootChannelOwner(ChannelOwner):
@@ -281,15 +366,19 @@ class RootChannelOwner(ChannelOwner):
         super().__init__(connection, "Root", "", {})
 
     async def initialize(self) -> "Playwright":
-        return from_channel(
-            await self._channel.send(
-                "initialize",
-                None,
-                {
-                    "sdkLanguage": "python",
-                },
-            )
+        params: Dict[str, Any] = {"sdkLanguage": "python"}
+        # Large binaries can only be exchanged out of band with a local driver.
+        negotiate_binary_channel = (
+            BINARY_CHANNEL_ENABLED and not self._connection.is_remote
         )
+        if negotiate_binary_channel:
+            params["binaryChannel"] = True
+        result = await self._channel.send_return_as_dict("initialize", None, params)
+        if negotiate_binary_channel:
+            self._connection._binary_channel = BinaryChannel.from_capability(
+                result.get("binaryChannel")
+            )
+        return from_channel(result["playwright"])
 
 
 class Connection(EventEmitter):
@@ -301,17 +390,32 @@ class Connection(EventEmitter):
         loop: asyncio.AbstractEventLoop,
         local_utils: Optional["LocalUtils"] = None,
     ) -> None:
-        super().__init__()
+        super().__init__(loop)
         self._dispatcher_fiber = dispatcher_fiber
         self._transport = transport
-        self._transport.on_message = lambda msg: self.dispatch(msg)
+        self._transport.on_message = self.dispatch
+        self._transport.on_error_future.add_done_callback(self._on_transport_error)
         self._last_id = 0
         self._objects: Dict[str, ChannelOwner] = {}
+        # Objects evicted by the memory budget that are still alive.
+        self._evicted_objects: "weakref.WeakValueDictionary[str, ChannelOwner]" = (
+            weakref.WeakValueDictionary()
+        )
+        # Objects evicted while calls were in flight, as (last call id, objects).
+        # The replies to these calls may still return them, so they are held
+        # until the calls complete.
+        self._evicted_in_flight: Deque[Tuple[int, List[ChannelOwner]]] = (
+            collections.deque()
+        )
+        # Guids of evicted objects that were garbage collected before the
+        # driver disposed them, to the guid of the owner they were evicted
+        # from, and the reverse. Disposing the owner disposes them as well.
+        self._collected_guids: Dict[str, str] = {}
+        self._collected_by_owner: Dict[str, Set[str]] = {}
         self._callbacks: Dict[int, ProtocolCallback] = {}
         self._object_factory = object_factory
         self._is_sync = False
         self._child_ws_connections: List["Connection"] = []
-        self._loop = loop
         self.playwright_future: asyncio.Future["Playwright"] = loop.create_future()
         self._error: Optional[BaseException] = None
         self.is_remote = False
@@ -321,7 +425,21 @@ class Connection(EventEmitter):
         )
         self._local_utils: Optional["LocalUtils"] = local_utils
         self._tracing_count = 0
+        # Probability of shipping a call stack to an active trace, the highest
+        # rate requested by any of the active tracings wins.
+        # Stack sample rate of each active tracing, keyed by its token.
+        self._stack_sample_rates: Dict[object, float] = {}
+        self._stack_sample_rate = 1.0
+        # Called with failed calls made on the key object or its descendants.
+        self._api_error_listeners: Dict[ChannelOwner, Callable[[Exception], None]] = {}
         self._closed_error: Optional[Exception] = None
+        self._metrics_collector: Optional[MetricsCollector] = None
+        self._stall_monitor: Optional[StallMonitor] = None
+        self._memory_budget: Optional[MemoryBudget] = None
+        # Console messages per context whose argument handles are kept, see
+        # BrowserContext._retain_console_message.
+        self._console_message_retention: Optional[int] = None
+        self._binary_channel: Optional[BinaryChannel] = None
 
     @property
     def local_utils(self) -> "LocalUtils":
@@ -331,6 +449,16 @@ class Connection(EventEmitter):
     def mark_as_remote(self) -> None:
         self.is_remote = True
 
+    def decode_binary(self, value: str) -> bytes:
+        if self._binary_channel:
+            return self._binary_channel.decode(value)
+        return base64.b64decode(value)
+
+    def encode_binary(self, data: bytes) -> str:
+        if self._binary_channel:
+            return self._binary_channel.encode(data)
+        return base64.b64encode(data).decode()
+
     async def run_as_sync(self) -> None:
         self._is_sync = True
         await self.run()
@@ -368,6 +496,8 @@ class Connection(EventEmitter):
 
     def cleanup(self, cause: str = None) -> None:
         self._closed_error = TargetClosedError(cause) if cause else TargetClosedError()
+        if self._stall_monitor and not self.is_remote:
+            self._stall_monitor._stop()
         if self._init_task and not self._init_task.done():
             self._init_task.cancel()
         for ws_connection in self._child_ws_connections:
@@ -378,15 +508,139 @@ class Connection(EventEmitter):
                 continue
             if callback.future.cancelled():
                 continue
+            if callback.metric:
+                self._record_metric(callback.metric, 0, self._closed_error)
             callback.future.set_exception(self._closed_error)
         self._callbacks.clear()
         self.emit("close")
 
-    def set_is_tracing(self, is_tracing: bool) -> None:
+    def set_metrics_collector(self, collector: Optional[MetricsCollector]) -> None:
+        self._metrics_collector = collector
+        for ws_connection in self._child_ws_connections:
+            ws_connection.set_metrics_collector(collector)
+
+    def set_stall_monitor(self, monitor: Optional[StallMonitor]) -> None:
+        if self._stall_monitor:
+            self._stall_monitor._stop()
+        self._stall_monitor = monitor
+        for ws_connection in self._child_ws_connections:
+            ws_connection._stall_monitor = monitor
+        # The loop only runs during API calls in sync mode, so its lag is
+        # meaningless there. Listener and queue depth tracking still applies.
+        if monitor and not self._is_sync:
+            monitor._start(self._loop)
+
+    def set_memory_budget(self, budget: Optional[MemoryBudget]) -> None:
+        # Objects tracked by the previous budget stay registered.
+        for object in self._objects.values():
+            if object._evictable is not None:
+                object._evictable = None
+        if self._memory_budget:
+            self._memory_budget._tracked = 0
+        self._memory_budget = budget
+        for ws_connection in self._child_ws_connections:
+            ws_connection.set_memory_budget(budget)
+
+    def set_console_message_retention(self, limit: Optional[int]) -> None:
+        self._console_message_retention = limit
+        for ws_connection in self._child_ws_connections:
+            ws_connection.set_console_message_retention(limit)
+
+    def _untrack_evictable(self) -> None:
+        if self._memory_budget:
+            self._memory_budget._tracked -= 1
+
+    def _evict_object(self, object: ChannelOwner, owner: ChannelOwner) -> None:
+        # The object and its children are only referenced weakly from now on.
+        # Whatever the caller still holds keeps working, the rest is garbage
+        # collected.
+        budget = cast(MemoryBudget, self._memory_budget)
+        evicted = []
+        stack = [object]
+        while stack:
+            object = stack.pop()
+            stack.extend(object._objects.values())
+            self._objects.pop(object._guid, None)
+            self._evicted_objects[object._guid] = object
+            weakref.finalize(
+                object,
+                self._on_evicted_object_collected,
+                object._guid,
+                owner._guid,
+                budget,
+            )
+            budget._evicted += 1
+            evicted.append(object)
+        if self._callbacks:
+            self._evicted_in_flight.append((self._last_id, evicted))
+
+    def _release_evicted_in_flight(self) -> None:
+        # Calls complete in any order, objects are held until every call that
+        # was in flight when they were evicted has completed.
+        oldest_id = next(iter(self._callbacks), None)
+        evicted = self._evicted_in_flight
+        while evicted and (oldest_id is None or evicted[0][0] < oldest_id):
+            evicted.popleft()
+
+    def _on_evicted_object_collected(
+        self, guid: str, owner_guid: str, budget: MemoryBudget
+    ) -> None:
+        budget._collected += 1
+        if owner_guid not in self._objects:
+            # The owner was disposed, and everything below it with it.
+            return
+        # The driver may still send messages for the object until it
+        # disposes it.
+        self._collected_guids[guid] = owner_guid
+        self._collected_by_owner.setdefault(owner_guid, set()).add(guid)
+
+    def _forget_collected(self, guid: str) -> None:
+        owner_guid = self._collected_guids.pop(guid)
+        collected = self._collected_by_owner[owner_guid]
+        collected.discard(guid)
+        if not collected:
+            del self._collected_by_owner[owner_guid]
+
+    def _get_object(self, guid: str) -> Optional[ChannelOwner]:
+        object = self._objects.get(guid)
+        if object is None and self._evicted_objects:
+            object = self._evicted_objects.get(guid)
+        return object
+
+    def _forget_object(self, guid: str) -> None:
+        if self._objects.pop(guid, None) is None:
+            self._evicted_objects.pop(guid, None)
+        if self._collected_by_owner:
+            for collected_guid in self._collected_by_owner.pop(guid, ()):
+                del self._collected_guids[collected_guid]
+
+    def _record_metric(
+        self,
+        metric: ApiCallMetric,
+        response_bytes: int,
+        error: Optional[BaseException],
+    ) -> None:
+        collector = self._metrics_collector
+        if not collector:
+            return
+        metric.duration = (time.perf_counter() - metric.start_time) * 1000
+        metric.response_bytes = response_bytes
+        metric.error = error
+        try:
+            collector.record(metric)
+        except Exception as exc:
+            self._on_event_listener_error(exc)
+
+    def set_is_tracing(
+        self, is_tracing: bool, token: object, stack_sample_rate: float = 1
+    ) -> None:
         if is_tracing:
             self._tracing_count += 1
+            self._stack_sample_rates[token] = stack_sample_rate
         else:
             self._tracing_count -= 1
+            del self._stack_sample_rates[token]
+        self._stack_sample_rate = max(self._stack_sample_rates.values(), default=1.0)
 
     def _send_message_to_server(
         self,
@@ -404,14 +658,11 @@ class Connection(EventEmitter):
             )
         self._last_id += 1
         id = self._last_id
-        callback = ProtocolCallback(self._loop, id, no_reply=no_reply)
+        callback = ProtocolCallback(self._loop, id, object, no_reply=no_reply)
         task = asyncio.current_task(self._loop)
-        callback.stack_trace = cast(
-            traceback.StackSummary,
-            getattr(task, "__pw_stack_trace__", None)
-            or traceback.extract_stack(limit=10),
-        )
-        callback.no_reply = no_reply
+        callback.stack_trace = getattr(
+            task, "__pw_stack_trace__", None
+        ) or _capture_call_site(10)
         stack_trace_information = cast(ParsedStackTrace, self._api_zone.get())
         frames = stack_trace_information.get("frames", [])
         location = (
@@ -423,8 +674,9 @@ class Connection(EventEmitter):
             if frames
             else None
         )
+        wall_time = int(datetime.datetime.now().timestamp() * 1000)
         metadata = {
-            "wallTime": int(datetime.datetime.now().timestamp() * 1000),
+            "wallTime": wall_time,
             "apiName": stack_trace_information["apiName"],
             "internal": not stack_trace_information["apiName"],
             "timeout": timeout,
@@ -438,14 +690,30 @@ class Connection(EventEmitter):
             "id": id,
             "guid": object._guid,
             "method": method,
-            "params": self._replace_channels_with_guids(params),
+            "params": self._serialize_params(params),
             "metadata": metadata,
         }
-        if self._tracing_count > 0 and frames and object._guid != "localUtils":
+        if (
+            self._tracing_count > 0
+            and frames
+            and object._guid != "localUtils"
+            and (
+                self._stack_sample_rate >= 1
+                or random.random() < self._stack_sample_rate
+            )
+        ):
             self.local_utils.add_stack_to_tracing_no_reply(id, frames)
 
         self._transport.send(message)
         self._callbacks[id] = callback
+        if self._metrics_collector and not no_reply:
+            callback.metric = ApiCallMetric(
+                f"{object._type}.{method}",
+                stack_trace_information["apiName"] or None,
+                wall_time,
+                time.perf_counter(),
+                self._transport.last_sent_bytes,
+            )
 
         return callback
 
@@ -462,67 +730,99 @@ class Connection(EventEmitter):
             )
         except (Error, OSError):
             pass
+        # Cancelling the caller cancelled its future, wait for the reply to
+        # the aborted call on a fresh one.
+        if callback.future.cancelled() and self._callbacks.get(callback.id):
+            callback.future = self._loop.create_future()
         try:
-            done, _ = await asyncio.wait(
-                {
-                    self._transport.on_error_future,
-                    callback.future,
-                },
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+            await callback.future
+        except Exception:
+            pass
         finally:
             if not callback.future.done():
                 callback.future.cancel()
-        for future in done:
-            if not future.cancelled():
-                future.exception()
 
-    def dispatch(self, msg: ParsedMessagePayload) -> None:
+    def _on_transport_error(self, error: asyncio.Future) -> None:
+        for id, callback in list(self._callbacks.items()):
+            if callback.no_reply or callback.future.done():
+                continue
+            del self._callbacks[id]
+            if error.cancelled():
+                callback.future.cancel()
+            else:
+                callback.future.set_exception(cast(BaseException, error.exception()))
+
+    def _dispatch_reply(self, id: int, msg: ParsedMessagePayload, size: int) -> None:
+        callback = self._callbacks.pop(id, None)
+        if not callback:
+            # Already failed by a transport error.
+            return
+        if callback.future.cancelled():
+            if callback.metric:
+                self._record_metric(callback.metric, size, asyncio.CancelledError())
+            return
+        # No reply messages are used to e.g. __waitInfo__(after) which returns exceptions on page close.
+        # To prevent 'Future exception was never retrieved' we just ignore such messages.
+        if callback.no_reply:
+            return
+        error = msg.get("error")
+        if error and not msg.get("result"):
+            parsed_error = parse_error(
+                error["error"], format_call_log(msg.get("log"))  # type: ignore
+            )
+            parsed_error._log = msg.get("log")
+            parsed_error._details = self._replace_guids_with_channels(
+                msg.get("errorDetails")
+            )
+            parsed_error._stack = "".join(
+                traceback.StackSummary.from_list(callback.stack_trace).format()
+            )
+            if self._api_error_listeners:
+                self._notify_api_error(callback.object, parsed_error)
+            if callback.metric:
+                self._record_metric(callback.metric, size, parsed_error)
+            callback.future.set_exception(parsed_error)
+        else:
+            result = self._replace_guids_with_channels(msg.get("result"))
+            if callback.metric:
+                self._record_metric(callback.metric, size, None)
+            callback.future.set_result(result)
+
+    def dispatch(self, msg: ParsedMessagePayload, size: int = 0) -> None:
         if self._closed_error:
             return
+        monitor = self._stall_monitor
+        if monitor:
+            monitor._record_queue_depth(self._transport.pending_bytes())
         id = msg.get("id")
         if id:
-            callback = self._callbacks.pop(id)
-            if callback.future.cancelled():
-                return
-            # No reply messages are used to e.g. __waitInfo__(after) which returns exceptions on page close.
-            # To prevent 'Future exception was never retrieved' we just ignore such messages.
-            if callback.no_reply:
-                return
-            error = msg.get("error")
-            if error and not msg.get("result"):
-                parsed_error = parse_error(
-                    error["error"], format_call_log(msg.get("log"))  # type: ignore
-                )
-                parsed_error._log = msg.get("log")
-                parsed_error._details = self._replace_guids_with_channels(
-                    msg.get("errorDetails")
-                )
-                parsed_error._stack = "".join(callback.stack_trace.format())
-                callback.future.set_exception(parsed_error)
-            else:
-                result = self._replace_guids_with_channels(msg.get("result"))
-                callback.future.set_result(result)
+            self._dispatch_reply(id, msg, size)
+            if self._evicted_in_flight:
+                self._release_evicted_in_flight()
             return
 
         guid = msg["guid"]
         method = msg["method"]
         params = msg.get("params")
+        object = self._get_object(guid)
+        if not object:
+            if guid in self._collected_guids:
+                # Evicted by the memory budget and garbage collected.
+                if method == "__dispose__":
+                    self._forget_collected(guid)
+                return
+            raise Exception(f'Cannot find object to "{method}": {guid}')
+
         if method == "__create__":
             assert params
-            parent = self._objects[guid]
             self._create_remote_object(
-                parent, params["type"], params["guid"], params["initializer"]
+                object, params["type"], params["guid"], params["initializer"]
             )
             return
 
-        object = self._objects.get(guid)
-        if not object:
-            raise Exception(f'Cannot find object to "{method}": {guid}')
-
         if method == "__adopt__":
             child_guid = cast(Dict[str, str], params)["guid"]
-            child = self._objects.get(child_guid)
+            child = self._get_object(child_guid)
             if not child:
                 raise Exception(f"Unknown new child: {child_guid}")
             object._adopt(child)
@@ -530,13 +830,20 @@ class Connection(EventEmitter):
 
         if method == "__dispose__":
             assert isinstance(params, dict)
-            self._objects[guid]._dispose(cast(Optional[str], params.get("reason")))
+            object._dispose(cast(Optional[str], params.get("reason")))
             return
-        object = self._objects[guid]
-        should_replace_guids_with_channels = "jsonPipe@" not in guid
+        should_replace_guids_with_channels = (
+            "jsonPipe@" not in guid and not object._raw_payloads
+        )
+        event = f"{object._type}.{method}"
+        # Handlers declared with @protocol_event run before Channel listeners.
+        handler = object._protocol_event_handlers.get(method)
         try:
             if self._is_sync:
-                for listener in object._channel.listeners(method):
+                listeners = object._channel.listeners(method)
+                if handler:
+                    listeners.insert(0, functools.partial(handler, object))
+                for listener in listeners:
                     # Event handlers like route/locatorHandlerTriggered require us to perform async work.
                     # In order to report their potential errors to the user, we need to catch it and store it in the connection
                     def _done_callback(future: asyncio.Future) -> None:
@@ -553,20 +860,36 @@ class Connection(EventEmitter):
                     # and switch to them in order, until they block inside and pass control to each
                     # other and then eventually back to dispatcher as listener functions return.
                     g = EventGreenlet(_listener_with_error_handler_attached)
+                    start = monitor._handler_started() if monitor else 0
                     if should_replace_guids_with_channels:
                         g.switch(self._replace_guids_with_channels(params))
                     else:
                         g.switch(params)
+                    if monitor:
+                        monitor._handler_finished(event, start)
             else:
+                start = monitor._handler_started() if monitor else 0
                 if should_replace_guids_with_channels:
-                    object._channel.emit(
-                        method, self._replace_guids_with_channels(params)
-                    )
-                else:
-                    object._channel.emit(method, params)
+                    params = self._replace_guids_with_channels(params)
+                if handler:
+                    object._channel._emit_run(handler, (object, params), {})
+                object._channel.emit(method, params)
+                if monitor:
+                    monitor._handler_finished(event, start)
         except BaseException as exc:
             self._on_event_listener_error(exc)
 
+    def _notify_api_error(self, object: ChannelOwner, error: Exception) -> None:
+        owner: Optional[ChannelOwner] = object
+        while owner:
+            listener = self._api_error_listeners.get(owner)
+            if listener:
+                try:
+                    listener(error)
+                except Exception as exc:
+                    self._on_event_listener_error(exc)
+            owner = owner._parent
+
     def _on_event_listener_error(self, exc: BaseException) -> None:
         print("Error occurred in event listener", file=sys.stderr)
         traceback.print_exception(type(exc), exc, exc.__traceback__, file=sys.stderr)
@@ -579,25 +902,41 @@ class Connection(EventEmitter):
         initializer = self._replace_guids_with_channels(initializer)
         return self._object_factory(parent, type, guid, initializer)
 
+    def _serialize_params(self, params: Mapping) -> Dict:
+        # Drops None values from params and nested dicts and replaces channels
+        # with guids in a single pass. Most values are strings, numbers and
+        # booleans, which are copied without further checks.
+        result = {}
+        for key, value in params.items():
+            if value is None:
+                continue
+            if type(value) in _PRIMITIVE_TYPES:
+                result[key] = value
+            elif isinstance(value, dict):
+                result[key] = self._serialize_params(value)
+            else:
+                result[key] = self._replace_channels_with_guids(value)
+        return result
+
     def _replace_channels_with_guids(
         self,
         payload: Any,
     ) -> Any:
-        if payload is None:
+        if payload is None or type(payload) in _PRIMITIVE_TYPES:
             return payload
+        if isinstance(payload, dict):
+            result = {}
+            for key, value in payload.items():
+                result[key] = self._replace_channels_with_guids(value)
+            return result
+        if isinstance(payload, Channel):
+            return dict(guid=payload._guid)
         if isinstance(payload, Path):
             return str(payload)
         if isinstance(payload, collections.abc.Sequence) and not isinstance(
             payload, str
         ):
             return list(map(self._replace_channels_with_guids, payload))
-        if isinstance(payload, Channel):
-            return dict(guid=payload._guid)
-        if isinstance(payload, dict):
-            result = {}
-            for key, value in payload.items():
-                result[key] = self._replace_channels_with_guids(value)
-            return result
         return payload
 
     def _replace_guids_with_channels(self, payload: Any) -> Any:
@@ -606,8 +945,11 @@ class Connection(EventEmitter):
         if isinstance(payload, list):
             return list(map(self._replace_guids_with_channels, payload))
         if isinstance(payload, dict):
-            if payload.get("guid") in self._objects:
-                return self._objects[payload["guid"]]._channel
+            guid = payload.get("guid")
+            if guid:
+                object = self._get_object(guid)
+                if object:
+                    return object._channel
             result = {}
             for key, value in payload.items():
                 result[key] = self._replace_guids_with_channels(value)
@@ -674,6 +1016,20 @@ class ParsedStackTrace(TypedDict):
     title: Optional[str]
 
 
+def _capture_call_site(limit: int) -> List[Tuple[str, int, str, None]]:
+    # A cheap traceback.extract_stack(): source lines are looked up only when
+    # the stack is formatted.
+    frames: List[Tuple[str, int, str, None]] = []
+    frame: Optional[FrameType] = sys._getframe(1)
+    while frame and len(frames) < limit:
+        frames.append(
+            (frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name, None)
+        )
+        frame = frame.f_back
+    frames.reverse()
+    return frames
+
+
 def _capture_stack_trace() -> ParsedStackTrace:
     frame = inspect.currentframe()
     # Skip this helper and the caller that only captures the stack.
@@ -744,16 +1100,8 @@ def _augment_params(
     timeout: float = 0
     if timeout_calculator:
         timeout = timeout_calculator(timeout_param)
-    return _filter_none(params), timeout
-
-
-def _filter_none(d: Mapping) -> Dict:
-    result = {}
-    for k, v in d.items():
-        if v is None:
-            continue
-        result[k] = _filter_none(v) if isinstance(v, dict) else v
-    return result
+    # None values are dropped by Connection._serialize_params.
+    return params, timeout
 
 
 def format_call_log(log: Optional[List[str]]) -> str:
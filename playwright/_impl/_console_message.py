@@ -13,10 +13,15 @@
 # limitations under the License.
 
 from asyncio import AbstractEventLoop
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, Union, cast
 
 from playwright._impl._api_structures import SourceLocation
-from playwright._impl._connection import from_channel, from_nullable_channel
+from playwright._impl._connection import (
+    Channel,
+    from_channel,
+    from_nullable_channel,
+)
+from playwright._impl._errors import Error
 from playwright._impl._js_handle import JSHandle
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -31,6 +36,7 @@ class ConsoleMessage:
         self._event = event
         self._loop = loop
         self._dispatcher_fiber = dispatcher_fiber
+        self._args_released = False
         self._page: Optional["Page"] = from_nullable_channel(event.get("page"))
         self._worker: Optional["Worker"] = from_nullable_channel(event.get("worker"))
 
@@ -70,8 +76,29 @@ class ConsoleMessage:
 
     @property
     def args(self) -> List[JSHandle]:
+        if self._args_released:
+            raise Error(
+                "Arguments of this console message were released, "
+                "raise the limit of playwright.set_console_message_retention() "
+                "to keep them longer"
+            )
         return list(map(from_channel, self._event["args"]))
 
+    def _release_args(self) -> None:
+        # The driver creates a JSHandle for every console argument, which
+        # otherwise stays alive until its execution context goes away.
+        self._args_released = True
+        for channel in self._event["args"]:
+            from_channel(channel)._release()
+
+    def _check_released_args(self) -> None:
+        # Messages listed by Page.console_messages() share the argument
+        # handles of the console events, which may have been released.
+        self._args_released = any(
+            not isinstance(arg, Channel) or cast(JSHandle, arg._object)._released
+            for arg in self._event["args"]
+        )
+
     @property
     def location(self) -> SourceLocation:
         # Wire format uses `lineNumber`/`columnNumber`; docs expose both `line`/`column`
@@ -16,7 +16,7 @@ from types import SimpleNamespace
 from typing import Any, Dict, Optional
 
 from playwright._impl._api_structures import DebuggerLocation, DebuggerPausedDetails
-from playwright._impl._connection import ChannelOwner
+from playwright._impl._connection import ChannelOwner, protocol_event
 
 
 class Debugger(ChannelOwner):
@@ -29,10 +29,8 @@ class Debugger(ChannelOwner):
     ) -> None:
         super().__init__(parent, type, guid, initializer)
         self._paused_details: Optional[DebuggerPausedDetails] = None
-        self._channel.on(
-            "pausedStateChanged", lambda params: self._on_paused_state_changed(params)
-        )
 
+    @protocol_event("pausedStateChanged")
     def _on_paused_state_changed(self, params: Dict[str, Any]) -> None:
         self._paused_details = params.get("pausedDetails")
         self.emit(Debugger.Events.PausedStateChanged)
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -37,6 +36,7 @@ from playwright._impl._helper import (
     locals_to_params,
     make_dirs_for_file,
 )
+from playwright._impl._image import RawImage, decode_image
 from playwright._impl._js_handle import (
     JSHandle,
     Serializable,
@@ -352,12 +352,27 @@ class ElementHandle(JSHandle):
         encoded_binary = await self._channel.send(
             "screenshot", self._frame._timeout, params
         )
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = self._connection.decode_binary(encoded_binary)
         if path:
             make_dirs_for_file(path)
             await async_writefile(path, decoded_binary)
         return decoded_binary
 
+    async def screenshot_raw(
+        self,
+        timeout: float = None,
+        omitBackground: bool = None,
+        animations: Literal["allow", "disabled"] = None,
+        caret: Literal["hide", "initial"] = None,
+        scale: Literal["css", "device"] = None,
+        mask: Sequence["Locator"] = None,
+        maskColor: str = None,
+        style: str = None,
+    ) -> RawImage:
+        return decode_image(
+            await self.screenshot(type="png", **locals_to_params(locals()))
+        )
+
     async def query_selector(self, selector: str) -> Optional["ElementHandle"]:
         return from_nullable_channel(
             await self._channel.send("querySelector", None, dict(selector=selector))
@@ -0,0 +1,139 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+class EventEmitter:
+    """Event emitter for protocol objects, compatible with pyee's
+    AsyncIOEventEmitter as far as Playwright uses it.
+
+    Most objects never get a listener, so nothing is allocated until the
+    first subscription. Coroutines returned by listeners are scheduled as
+    tasks, and errors raised by listeners are reported through
+    _on_listener_error.
+    """
+
+    # Event name to {listener: callable invoked on emit}. The two differ for
+    # once() listeners only.
+    _events: Optional[Dict[str, Dict[Callable, Callable]]] = None
+    # Strong references to the tasks of coroutine listeners.
+    _waiting: Optional[Set[asyncio.Future]] = None
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._loop = loop
+
+    def on(self, event: str, f: Callable) -> Callable:
+        self._add_event_handler(event, f, f)
+        return f
+
+    add_listener = on
+
+    def once(self, event: str, f: Callable) -> Callable:
+        def once_handler(*args: Any, **kwargs: Any) -> Any:
+            handlers = self._events and self._events.get(event)
+            # A listener that was removed while the event was being
+            # dispatched must not run.
+            if not handlers or handlers.get(f) is not once_handler:
+                return None
+            self._remove_event_handler(event, f)
+            return f(*args, **kwargs)
+
+        self._add_event_handler(event, f, once_handler)
+        return f
+
+    def _add_event_handler(self, event: str, k: Callable, v: Callable) -> None:
+        events = self._events
+        if events is None:
+            events = self._events = {}
+        handlers = events.get(event)
+        if handlers is None:
+            events[event] = {k: v}
+        else:
+            handlers[k] = v
+
+    def _remove_event_handler(self, event: str, f: Callable) -> None:
+        events = self._events
+        handlers = events.get(event) if events else None
+        if handlers is None:
+            return
+        handlers.pop(f, None)
+        if not handlers:
+            del events[event]  # type: ignore[union-attr]
+
+    def remove_listener(self, event: str, f: Callable) -> None:
+        self._remove_event_handler(event, f)
+
+    def remove_all_listeners(self, event: Optional[str] = None) -> None:
+        if event is None:
+            self._events = None
+        elif self._events:
+            self._events.pop(event, None)
+
+    def listeners(self, event: str) -> List[Callable]:
+        handlers = self._events and self._events.get(event)
+        return list(handlers) if handlers else []
+
+    def emit(self, event: str, *args: Any, **kwargs: Any) -> bool:
+        handlers = self._events and self._events.get(event)
+        if not handlers:
+            return False
+        if len(handlers) == 1:
+            self._emit_run(next(iter(handlers.values())), args, kwargs)
+            return True
+        # Listeners may subscribe or unsubscribe while being called.
+        for f in list(handlers.values()):
+            self._emit_run(f, args, kwargs)
+        return True
+
+    def _emit_run(
+        self,
+        f: Callable,
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> None:
+        try:
+            result = f(*args, **kwargs)
+        except Exception as exc:
+            self._on_listener_error(exc)
+            return
+        if result is None:
+            return
+        if asyncio.iscoroutine(result):
+            future: asyncio.Future = asyncio.ensure_future(result, loop=self._loop)
+        elif isinstance(result, asyncio.Future):
+            future = result
+        else:
+            return
+        waiting = self._waiting
+        if waiting is None:
+            waiting = self._waiting = set()
+        waiting.add(future)
+        future.add_done_callback(self._on_listener_done)
+
+    def _on_listener_done(self, future: asyncio.Future) -> None:
+        if self._waiting:
+            self._waiting.discard(future)
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc:
+            self._on_listener_error(exc)
+
+    def _on_listener_error(self, exc: BaseException) -> None:
+        # Like pyee, errors go to "error" listeners and are raised if there
+        # are none.
+        if not self.emit("error", exc):
+            raise exc
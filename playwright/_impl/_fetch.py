@@ -43,10 +43,12 @@ from playwright._impl._helper import (
     TargetClosedError,
     TimeoutSettings,
     async_readfile,
+    async_readfile_cached,
     async_writefile,
     is_file_payload,
     locals_to_params,
     object_to_array,
+    parse_json_bytes,
     to_impl,
 )
 from playwright._impl._network import serialize_headers, to_client_certificates_protocol
@@ -86,8 +88,8 @@ class APIRequest:
         if "storageState" in params:
             storage_state = params["storageState"]
             if not isinstance(storage_state, dict) and storage_state:
-                params["storageState"] = json.loads(
-                    (await async_readfile(storage_state)).decode()
+                params["storageState"] = await async_readfile_cached(
+                    storage_state, parse_json_bytes
                 )
         if "extraHTTPHeaders" in params:
             params["extraHTTPHeaders"] = serialize_headers(params["extraHTTPHeaders"])
@@ -564,7 +566,7 @@ class APIResponse:
             )
             if result is None:
                 raise Error("Response has been disposed")
-            return base64.b64decode(result["binary"])
+            return self._request._connection.decode_binary(result["binary"])
         except Error as exc:
             if is_target_closed_error(exc):
                 raise Error("Response has been disposed")
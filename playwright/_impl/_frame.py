@@ -28,8 +28,6 @@ from typing import (
     cast,
 )
 
-from pyee import EventEmitter
-
 from playwright._impl._api_structures import (
     AriaRole,
     DropPayload,
@@ -42,10 +40,12 @@ from playwright._impl._connection import (
     ChannelOwner,
     from_channel,
     from_nullable_channel,
+    protocol_event,
 )
 from playwright._impl._element_handle import ElementHandle, convert_select_option_values
 from playwright._impl._errors import Error
 from playwright._impl._event_context_manager import EventContextManagerImpl
+from playwright._impl._event_emitter import EventEmitter
 from playwright._impl._helper import (
     DocumentLoadState,
     FrameNavigatedEvent,
@@ -59,9 +59,11 @@ from playwright._impl._helper import (
     url_matches,
 )
 from playwright._impl._js_handle import (
+    CALL_REGISTERED_FUNCTION,
     JSHandle,
     Serializable,
     add_source_url_to_script,
+    call_and_register_function_expression,
     parse_result,
     parse_value,
     serialize_argument,
@@ -100,19 +102,15 @@ class Frame(ChannelOwner):
         self._child_frames: List[Frame] = []
         self._page: Optional[Page] = None
         self._load_states: Set[str] = set(initializer["loadStates"])
-        self._event_emitter = EventEmitter()
-        self._channel.on(
-            "loadstate",
-            lambda params: self._on_load_state(params.get("add"), params.get("remove")),
-        )
-        self._channel.on(
-            "navigated",
-            lambda params: self._on_frame_navigated(params),
-        )
+        self._event_emitter = EventEmitter(self._loop)
 
     def __repr__(self) -> str:
         return f"<Frame name={self.name} url={self.url!r}>"
 
+    @protocol_event("loadstate")
+    def _on_load_state_event(self, params: Dict) -> None:
+        self._on_load_state(params.get("add"), params.get("remove"))
+
     def _on_load_state(
         self, add: DocumentLoadState = None, remove: DocumentLoadState = None
     ) -> None:
@@ -127,6 +125,7 @@ class Frame(ChannelOwner):
         if not self._parent_frame and add == "domcontentloaded" and self._page:
             self._page.emit("domcontentloaded", self._page)
 
+    @protocol_event("navigated")
     def _on_frame_navigated(self, event: FrameNavigatedEvent) -> None:
         self._url = event["url"]
         self._name = event["name"]
@@ -352,6 +351,20 @@ class Frame(ChannelOwner):
             )
         )
 
+    async def _call_registered_function(
+        self, id: str, source: Optional[str], arg: Serializable = None
+    ) -> Any:
+        result = await self.evaluate(CALL_REGISTERED_FUNCTION, [id, arg])
+        if result[0]:
+            return result[1]
+        # The document was created before the function got registered, e.g.
+        # the page was already open. Ship the source once to install it.
+        if source is None:
+            raise Error(f'Function "{id}" is not registered')
+        return await self.evaluate(
+            call_and_register_function_expression(id, source), arg
+        )
+
     async def evaluate_handle(
         self, expression: str, arg: Serializable = None
     ) -> JSHandle:
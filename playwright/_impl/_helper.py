@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import base64
 import datetime
+import json
 import math
 import os
 import re
@@ -375,15 +377,10 @@ def patch_error_message(message: str) -> str:
 
 def locals_to_params(args: Dict) -> Dict:
     copy = {}
-    for key in args:
-        if key == "self":
+    for key, value in args.items():
+        if value is None or key == "self":
             continue
-        if args[key] is not None:
-            copy[key] = (
-                args[key]
-                if not isinstance(args[key], Dict)
-                else locals_to_params(args[key])
-            )
+        copy[key] = locals_to_params(value) if isinstance(value, dict) else value
     return copy
 
 
@@ -461,6 +458,8 @@ class RouteHandler:
         handled_future = route._start_handling()
 
         self._handled_count += 1
+        monitor = route._connection._stall_monitor
+        start = monitor._handler_started(self.handler) if monitor else 0
         if self._is_sync:
             handler_finished_future = route._loop.create_future()
 
@@ -475,9 +474,13 @@ class RouteHandler:
             # so it needs a fiber.
             g = RouteGreenlet(_handler)
             g.switch()
+            if monitor:
+                monitor._handler_finished("Route.route", start)
             await handler_finished_future
         else:
             coro_or_future = self.handler(route, route.request)  # type: ignore
+            if monitor:
+                monitor._handler_finished("Route.route", start)
             if coro_or_future:
                 # separate task so that we get a proper stack trace for exceptions / tracing api_name extraction
                 await asyncio.ensure_future(coro_or_future)
@@ -558,6 +561,49 @@ async def async_readfile(file: Union[str, Path]) -> bytes:
 T = TypeVar("T")
 
 
+# Files that are re-read for every new context (storage state, client
+# certificates) are read and parsed once, and cached until their stat
+# signature changes. Files modified within the last couple of seconds are
+# never cached, since a rewrite within the file system timestamp granularity
+# would not change the signature. The parsed values are only ever sent to the
+# driver, never handed to user code, so they are shared read-only.
+_FILE_CACHE_MAX_ENTRIES = 32
+_FILE_CACHE_MIN_AGE_IN_SECONDS = 2
+_file_cache: Dict[Tuple[str, Callable], Tuple[Tuple[int, int, int], Any]] = {}
+
+
+async def async_readfile_cached(
+    file: Union[str, Path], parse: Callable[[bytes], T]
+) -> T:
+    path = os.path.abspath(file)
+    key = (path, parse)
+    loop = asyncio.get_running_loop()
+    try:
+        stat = await loop.run_in_executor(None, os.stat, path)
+    except OSError:
+        _file_cache.pop(key, None)
+        return parse(await async_readfile(path))
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _file_cache.get(key)
+    if cached and cached[0] == signature:
+        return cached[1]
+    value = parse(await async_readfile(path))
+    if time.time() - stat.st_mtime >= _FILE_CACHE_MIN_AGE_IN_SECONDS:
+        _file_cache.pop(key, None)
+        if len(_file_cache) >= _FILE_CACHE_MAX_ENTRIES:
+            del _file_cache[next(iter(_file_cache))]
+        _file_cache[key] = (signature, value)
+    return value
+
+
+def parse_json_bytes(data: bytes) -> Any:
+    return json.loads(data.decode())
+
+
+def to_base64(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
 def to_impl(obj: T) -> T:
     if hasattr(obj, "_impl_obj"):
         return cast(Any, obj)._impl_obj
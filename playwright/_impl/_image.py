@@ -0,0 +1,120 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+from typing import Any, Tuple
+
+
+class RawImage:
+    def __init__(self, width: int, height: int, data: bytes) -> None:
+        self.width = width
+        self.height = height
+        # Row-major RGBA, 4 bytes per pixel.
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"<RawImage width={self.width} height={self.height}>"
+
+    def to_numpy(self) -> Any:
+        try:
+            import numpy
+        except ImportError as exc:
+            raise ImportError("RawImage.to_numpy() requires numpy") from exc
+        # Read-only view over the same buffer, no copy is made.
+        return numpy.frombuffer(self.data, dtype=numpy.uint8).reshape(
+            self.height, self.width, 4
+        )
+
+
+def decode_image(encoded: bytes) -> RawImage:
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise ImportError("Raw screenshots require the 'Pillow' package") from exc
+    with Image.open(io.BytesIO(encoded)) as image:
+        rgba = image if image.mode == "RGBA" else image.convert("RGBA")
+        return RawImage(rgba.width, rgba.height, rgba.tobytes())
+
+
+def encode_png(image: RawImage) -> bytes:
+    try:
+        from PIL import Image
+    except ImportError as exc:
+        raise ImportError("Raw screenshots require the 'Pillow' package") from exc
+    buffer = io.BytesIO()
+    Image.frombuffer(
+        "RGBA", (image.width, image.height), image.data, "raw", "RGBA", 0, 1
+    ).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def compare_images(
+    actual: RawImage, expected: RawImage, threshold: float
+) -> Tuple[int, RawImage]:
+    # Returns the number of differing pixels and a diff image: differences in
+    # red, anti-aliasing differences in yellow over a faded expected image.
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError("Screenshot comparison requires numpy") from exc
+    a = actual.to_numpy().astype(numpy.int16)
+    e = expected.to_numpy().astype(numpy.int16)
+    max_delta = threshold * 255
+    different = (numpy.abs(a - e) > max_delta).any(axis=2)
+
+    anti_aliased = numpy.zeros_like(different)
+    if different.any():
+        # A pixel is considered anti-aliased when it is a blend in one of the
+        # images (at most two identical neighbours) and its colour in each
+        # image lies within the colour range of the other image's 3x3
+        # neighbourhood.
+        padded_a = numpy.pad(a, ((1, 1), (1, 1), (0, 0)), mode="edge")
+        padded_e = numpy.pad(e, ((1, 1), (1, 1), (0, 0)), mode="edge")
+        low_a, high_a = a.copy(), a.copy()
+        low_e, high_e = e.copy(), e.copy()
+        same_a = numpy.zeros(different.shape, dtype=numpy.uint8)
+        same_e = numpy.zeros(different.shape, dtype=numpy.uint8)
+        height, width = different.shape
+        for dy in (0, 1, 2):
+            for dx in (0, 1, 2):
+                if dy == 1 and dx == 1:
+                    continue
+                rows = slice(dy, dy + height)
+                columns = slice(dx, dx + width)
+                shifted_a = padded_a[rows, columns]
+                shifted_e = padded_e[rows, columns]
+                numpy.minimum(low_a, shifted_a, out=low_a)
+                numpy.maximum(high_a, shifted_a, out=high_a)
+                numpy.minimum(low_e, shifted_e, out=low_e)
+                numpy.maximum(high_e, shifted_e, out=high_e)
+                same_a += (a == shifted_a).all(axis=2)
+                same_e += (e == shifted_e).all(axis=2)
+        blended = (same_a <= 2) | (same_e <= 2)
+        a_in_e = ((a >= low_e - max_delta) & (a <= high_e + max_delta)).all(axis=2)
+        e_in_a = ((e >= low_a - max_delta) & (e <= high_a + max_delta)).all(axis=2)
+        anti_aliased = different & blended & a_in_e & e_in_a
+        different &= ~anti_aliased
+
+    gray = e[:, :, :3].mean(axis=2)
+    faded = (255 - (255 - gray) * 0.1).astype(numpy.uint8)
+    diff = numpy.empty(e.shape, dtype=numpy.uint8)
+    diff[:, :, 0] = faded
+    diff[:, :, 1] = faded
+    diff[:, :, 2] = faded
+    diff[:, :, 3] = 255
+    diff[anti_aliased] = (255, 255, 0, 255)
+    diff[different] = (255, 0, 0, 255)
+    return int(different.sum()), RawImage(
+        expected.width, expected.height, diff.tobytes()
+    )
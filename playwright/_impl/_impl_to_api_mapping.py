@@ -20,6 +20,10 @@ from playwright._impl._map import Map
 
 API_ATTR = "_pw_api_instance_"
 IMPL_ATTR = "_pw_impl_instance_"
+HANDLER_ATTR = "_pw_handler_"
+
+# Values of these types are never impl objects and are passed through as is.
+_PRIMITIVE_TYPES = frozenset((str, int, float, bool, bytes, type(None)))
 
 
 class ImplWrapper:
@@ -40,29 +44,39 @@ class ImplToApiMapping:
     def from_maybe_impl(
         self, obj: Any, visited: Optional[Map[Any, Union[List, Dict]]] = None
     ) -> Any:
-        # Python does share default arguments between calls, so we need to
-        # create a new map if it is not provided.
-        if not visited:
-            visited = Map()
-        if not obj:
+        obj_type = type(obj)
+        if obj_type in _PRIMITIVE_TYPES or not obj:
             return obj
+        # Containers are copied, primitive members without a recursive call.
         if isinstance(obj, dict):
-            if obj in visited:
+            if visited is None:
+                visited = Map()
+            elif obj in visited:
                 return visited[obj]
             o: Dict = {}
             visited[obj] = o
             for name, value in obj.items():
-                o[name] = self.from_maybe_impl(value, visited)
+                o[name] = (
+                    value
+                    if type(value) in _PRIMITIVE_TYPES
+                    else self.from_maybe_impl(value, visited)
+                )
             return o
         if isinstance(obj, list):
-            if obj in visited:
+            if visited is None:
+                visited = Map()
+            elif obj in visited:
                 return visited[obj]
             a: List = []
             visited[obj] = a
             for item in obj:
-                a.append(self.from_maybe_impl(item, visited))
+                a.append(
+                    item
+                    if type(item) in _PRIMITIVE_TYPES
+                    else self.from_maybe_impl(item, visited)
+                )
             return a
-        api_class = self._mapping.get(type(obj))
+        api_class = self._mapping.get(obj_type)
         if api_class:
             api_instance = getattr(obj, API_ATTR, None)
             if not api_instance:
@@ -90,6 +104,8 @@ class ImplToApiMapping:
     def to_impl(
         self, obj: Any, visited: Optional[Map[Any, Union[List, Dict]]] = None
     ) -> Any:
+        if type(obj) in _PRIMITIVE_TYPES:
+            return obj
         if visited is None:
             visited = Map()
         try:
@@ -118,28 +134,19 @@ class ImplToApiMapping:
             raise Error("Maximum argument depth exceeded")
 
     def wrap_handler(self, handler: Callable[..., Any]) -> Callable[..., None]:
-        def wrapper_func(*args: Any) -> Any:
-            parameters = inspect.signature(handler).parameters
-            has_varargs = any(
-                parameter.kind == inspect.Parameter.VAR_POSITIONAL
-                for parameter in parameters.values()
-            )
-            arg_count = (
-                len(args)
-                if has_varargs
-                else sum(
-                    parameter.kind
-                    in (
-                        inspect.Parameter.POSITIONAL_ONLY,
-                        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    )
-                    for parameter in parameters.values()
-                )
-            )
-            return handler(
-                *list(map(lambda a: self.from_maybe_impl(a), args))[:arg_count]
-            )
+        # Number of positional arguments the handler accepts, None when it
+        # takes *args. Computed on the first call, signatures do not change.
+        arg_count: Optional[int] = -1
 
+        def wrapper_func(*args: Any) -> Any:
+            nonlocal arg_count
+            if arg_count == -1:
+                arg_count = _positional_arg_count(handler)
+            if arg_count is not None:
+                args = args[:arg_count]
+            return handler(*[self.from_maybe_impl(arg) for arg in args])
+
+        setattr(wrapper_func, HANDLER_ATTR, handler)
         if inspect.ismethod(handler):
             wrapper = getattr(handler.__self__, IMPL_ATTR + handler.__name__, None)
             if not wrapper:
@@ -156,3 +163,19 @@ class ImplToApiMapping:
             wrapper = wrapper_func
             setattr(handler, IMPL_ATTR, wrapper)
         return wrapper
+
+
+def _positional_arg_count(handler: Callable[..., Any]) -> Optional[int]:
+    parameters = inspect.signature(handler).parameters.values()
+    if any(
+        parameter.kind == inspect.Parameter.VAR_POSITIONAL for parameter in parameters
+    ):
+        return None
+    return sum(
+        parameter.kind
+        in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        )
+        for parameter in parameters
+    )
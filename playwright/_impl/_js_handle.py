@@ -12,17 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
 import base64
 import collections.abc
 import datetime
+import hashlib
+import json
 import math
-import struct
+import sys
 import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 from urllib.parse import ParseResult, urlparse, urlunparse
 
-from playwright._impl._connection import Channel, ChannelOwner, from_channel
+from playwright._impl._connection import (
+    Channel,
+    ChannelOwner,
+    from_channel,
+    protocol_event,
+)
 from playwright._impl._errors import Error, is_target_closed_error
 from playwright._impl._map import Map
 
@@ -54,9 +62,11 @@ class JSHandle(ChannelOwner):
     ) -> None:
         super().__init__(parent, type, guid, initializer)
         self._preview = self._initializer["preview"]
-        self._channel.on(
-            "previewUpdated", lambda params: self._on_preview_updated(params["preview"])
-        )
+        self._released = False
+        # Playwright does not keep handles for itself. Handles evicted while
+        # a call is in flight are held until it completes, so that the reply
+        # can still return them.
+        self._mark_evictable()
 
     def __repr__(self) -> str:
         return f"<JSHandle preview={self._preview}>"
@@ -64,6 +74,10 @@ class JSHandle(ChannelOwner):
     def __str__(self) -> str:
         return self._preview
 
+    @protocol_event("previewUpdated")
+    def _on_preview_updated_event(self, params: Dict) -> None:
+        self._on_preview_updated(params["preview"])
+
     def _on_preview_updated(self, preview: str) -> None:
         self._preview = preview
 
@@ -120,6 +134,13 @@ class JSHandle(ChannelOwner):
             if not is_target_closed_error(e):
                 raise e
 
+    def _release(self) -> None:
+        # Like dispose(), without waiting for the driver. Handles that were
+        # disposed already are left alone.
+        self._released = True
+        if self._connection._get_object(self._guid) is self:
+            self._channel.send_no_reply("dispose", None, is_internal=True)
+
     async def json_value(self) -> Any:
         return parse_result(
             await self._channel.send(
@@ -129,23 +150,115 @@ class JSHandle(ChannelOwner):
         )
 
 
+# array.array has no clamped variant, so Uint8ClampedArray comes back as an
+# array.array("B") like Uint8Array, and is sent back as a Uint8Array.
+_TYPED_ARRAY_FORMATS = {
+    "i8": "b",
+    "ui8": "B",
+    "ui8c": "B",
+    "i16": "h",
+    "ui16": "H",
+    "i32": "i",
+    "ui32": "I",
+    "f32": "f",
+    "f64": "d",
+    "bi64": "q",
+    "bui64": "Q",
+}
+_TYPED_ARRAY_KINDS = {
+    "b": "i8",
+    "B": "ui8",
+    "h": "i16",
+    "H": "ui16",
+    "i": "i32",
+    "I": "ui32",
+    "f": "f32",
+    "d": "f64",
+    "q": "bi64",
+    "Q": "bui64",
+}
+
+
+# Plain lists and dicts nested deeper than this are handed over to the
+# generic path, which detects cycles.
+_JSON_FAST_PATH_MAX_DEPTH = 64
+
+
+class _NotJSON(Exception):
+    pass
+
+
+def _serialize_json(value: Any, last_id: List[int], depth: int) -> Any:
+    # Serializes trees of plain lists, dicts and JSON scalars without
+    # tracking visited containers, so a container that occurs twice is sent
+    # twice, like json.dumps() does. Raises _NotJSON for anything else.
+    value_type = type(value)
+    if value_type is str:
+        return {"s": value}
+    if value_type is bool:
+        return {"b": value}
+    if value_type is int:
+        return {"n": value}
+    if value_type is float and math.isfinite(value) and math.copysign(1, value) > 0:
+        return {"n": value}
+    if value is None:
+        return {"v": "null"}
+    if depth < _JSON_FAST_PATH_MAX_DEPTH:
+        if value_type is list:
+            last_id[0] += 1
+            id = last_id[0]
+            return {
+                "a": [_serialize_json(e, last_id, depth + 1) for e in value],
+                "id": id,
+            }
+        if value_type is dict:
+            last_id[0] += 1
+            id = last_id[0]
+            return {
+                "o": [
+                    {"k": k, "v": _serialize_json(v, last_id, depth + 1)}
+                    for k, v in value.items()
+                ],
+                "id": id,
+            }
+    raise _NotJSON()
+
+
 def serialize_value(
     value: Any, handles: List[Channel], visitor_info: Optional[VisitorInfo] = None
 ) -> Any:
+    # Fast path for the JSON scalars that make up the bulk of most arguments.
+    # Exact type checks keep bool (a subclass of int) and user subclasses on
+    # the generic path below.
+    value_type = type(value)
+    if value_type is str:
+        return {"s": value}
+    if value_type is bool:
+        return {"b": value}
+    if value_type is int:
+        return {"n": value}
+    if value_type is float and math.isfinite(value) and math.copysign(1, value) > 0:
+        return {"n": value}
+    if value is None:
+        return dict(v="null")
+
     if visitor_info is None:
+        if value_type is list or value_type is dict:
+            try:
+                return _serialize_json(value, [0], 0)
+            except _NotJSON:
+                pass
         visitor_info = VisitorInfo()
     if isinstance(value, JSHandle):
         h = len(handles)
         handles.append(value._channel)
         return dict(h=h)
-    if value is None:
-        return dict(v="null")
     if isinstance(value, float):
         if value == float("inf"):
             return dict(v="Infinity")
         if value == float("-inf"):
             return dict(v="-Infinity")
-        if value == float("-0"):
+        if value == 0 and math.copysign(1, value) < 0:
             return dict(v="-0")
         if math.isnan(value):
             return dict(v="NaN")
@@ -182,6 +295,16 @@ def serialize_value(
         return {"s": value}
     if isinstance(value, ParseResult):
         return {"u": urlunparse(value)}
+    if isinstance(value, array.array) and value.typecode in _TYPED_ARRAY_KINDS:
+        if sys.byteorder == "big":
+            value = array.array(value.typecode, value)
+            value.byteswap()
+        return {
+            "ta": {
+                "b": base64.b64encode(value.tobytes()).decode(),
+                "k": _TYPED_ARRAY_KINDS[value.typecode],
+            }
+        }
 
     if value in visitor_info.visited:
         return dict(ref=visitor_info.visited[value])
@@ -211,126 +334,119 @@ def serialize_argument(arg: Serializable = None) -> Any:
 
 
 def parse_value(value: Any, refs: Optional[Dict[int, Any]] = None) -> Any:
+    if not isinstance(value, dict):
+        return value
+    # Plain JSON values are by far the most common, check for them first.
+    if "n" in value:
+        return value["n"]
+    if "s" in value:
+        return value["s"]
+    if "b" in value:
+        return value["b"]
+
     if refs is None:
         refs = {}
-    if value is None:
-        return None
-    if isinstance(value, dict):
-        if "ref" in value:
-            return refs[value["ref"]]
-
-        if "v" in value:
-            v = value["v"]
-            if v == "Infinity":
-                return float("inf")
-            if v == "-Infinity":
-                return float("-inf")
-            if v == "-0":
-                return float("-0")
-            if v == "NaN":
-                return float("nan")
-            if v == "undefined":
-                return None
-            if v == "null":
-                return None
-            return v
-
-        if "u" in value:
-            return urlparse(value["u"])
-
-        if "bi" in value:
-            return int(value["bi"])
-
-        if "e" in value:
-            error = Error(value["e"]["m"])
-            error._name = value["e"]["n"]
-            error._stack = value["e"]["s"]
-            return error
-
-        if "a" in value:
-            a: List = []
-            refs[value["id"]] = a
-            for e in value["a"]:
-                a.append(parse_value(e, refs))
-            return a
-
-        if "d" in value:
-            # Node.js Date objects are always in UTC.
-            return datetime.datetime.strptime(
-                value["d"], "%Y-%m-%dT%H:%M:%S.%fZ"
-            ).replace(tzinfo=datetime.timezone.utc)
-
-        if "o" in value:
-            o: Dict = {}
-            refs[value["id"]] = o
-            for e in value["o"]:
-                o[e["k"]] = parse_value(e["v"], refs)
-            return o
-
-        if "n" in value:
-            return value["n"]
-
-        if "s" in value:
-            return value["s"]
-
-        if "b" in value:
-            return value["b"]
-
-        if "ta" in value:
-            encoded_bytes = value["ta"]["b"]
-            decoded_bytes = base64.b64decode(encoded_bytes)
-            array_type = value["ta"]["k"]
-            if array_type == "i8":
-                word_size = 1
-                fmt = "b"
-            elif array_type == "ui8" or array_type == "ui8c":
-                word_size = 1
-                fmt = "B"
-            elif array_type == "i16":
-                word_size = 2
-                fmt = "h"
-            elif array_type == "ui16":
-                word_size = 2
-                fmt = "H"
-            elif array_type == "i32":
-                word_size = 4
-                fmt = "i"
-            elif array_type == "ui32":
-                word_size = 4
-                fmt = "I"
-            elif array_type == "f32":
-                word_size = 4
-                fmt = "f"
-            elif array_type == "f64":
-                word_size = 8
-                fmt = "d"
-            elif array_type == "bi64":
-                word_size = 8
-                fmt = "q"
-            elif array_type == "bui64":
-                word_size = 8
-                fmt = "Q"
-            else:
-                raise ValueError(f"Unsupported array type: {array_type}")
-
-            byte_len = len(decoded_bytes)
-            if byte_len % word_size != 0:
-                raise ValueError(
-                    f"Decoded bytes length {byte_len} is not a multiple of word size {word_size}"
-                )
-
-            if byte_len == 0:
-                return []
-            array_len = byte_len // word_size
-            # "<" denotes little-endian
-            format_string = f"<{array_len}{fmt}"
-            return list(struct.unpack(format_string, decoded_bytes))
+    if "ref" in value:
+        return refs[value["ref"]]
+
+    if "v" in value:
+        v = value["v"]
+        if v == "Infinity":
+            return float("inf")
+        if v == "-Infinity":
+            return float("-inf")
+        if v == "-0":
+            return float("-0")
+        if v == "NaN":
+            return float("nan")
+        if v == "undefined":
+            return None
+        if v == "null":
+            return None
+        return v
+
+    if "a" in value:
+        a: List = []
+        refs[value["id"]] = a
+        for e in value["a"]:
+            a.append(parse_value(e, refs))
+        return a
+
+    if "o" in value:
+        o: Dict = {}
+        refs[value["id"]] = o
+        for e in value["o"]:
+            o[e["k"]] = parse_value(e["v"], refs)
+        return o
+
+    if "u" in value:
+        return urlparse(value["u"])
+
+    if "bi" in value:
+        return int(value["bi"])
+
+    if "e" in value:
+        error = Error(value["e"]["m"])
+        error._name = value["e"]["n"]
+        error._stack = value["e"]["s"]
+        return error
+
+    if "d" in value:
+        # Node.js Date objects are always in UTC.
+        return datetime.datetime.strptime(value["d"], "%Y-%m-%dT%H:%M:%S.%fZ").replace(
+            tzinfo=datetime.timezone.utc
+        )
+
+    if "ta" in value:
+        return parse_typed_array(value["ta"]["b"], value["ta"]["k"])
     return value
 
 
+def parse_typed_array(encoded_bytes: str, array_type: str) -> array.array:
+    # Decode straight into a typed buffer instead of boxing every element, the
+    # result supports the buffer protocol (e.g. numpy.frombuffer) without copies.
+    fmt = _TYPED_ARRAY_FORMATS.get(array_type)
+    if not fmt:
+        raise ValueError(f"Unsupported array type: {array_type}")
+    result = array.array(fmt)
+    decoded_bytes = base64.b64decode(encoded_bytes)
+    byte_len = len(decoded_bytes)
+    if byte_len % result.itemsize != 0:
+        raise ValueError(
+            f"Decoded bytes length {byte_len} is not a multiple of word size {result.itemsize}"
+        )
+    result.frombytes(decoded_bytes)
+    # The wire format is little-endian.
+    if sys.byteorder == "big":
+        result.byteswap()
+    return result
+
+
 def parse_result(result: Any) -> Any:
     return parse_value(result)
 
 
+_REGISTERED_FUNCTIONS = "globalThis[Symbol.for('playwright.registeredFunctions')]"
+
+CALL_REGISTERED_FUNCTION = f"""async ([id, arg]) => {{
+  const functions = {_REGISTERED_FUNCTIONS};
+  if (!functions || !(id in functions))
+    return [false];
+  return [true, await functions[id](arg)];
+}}"""
+
+
+def registered_function_id(source: str) -> str:
+    return hashlib.sha1(source.encode()).hexdigest()[:16]
+
+
+def register_function_script(id: str, source: str) -> str:
+    return f"({_REGISTERED_FUNCTIONS} = {_REGISTERED_FUNCTIONS} || {{}})[{json.dumps(id)}] = ({source});"
+
+
+def call_and_register_function_expression(id: str, source: str) -> str:
+    return f"async arg => {{ {register_function_script(id, source)} return {_REGISTERED_FUNCTIONS}[{json.dumps(id)}](arg); }}"
+
+
 def add_source_url_to_script(source: str, path: Union[str, Path]) -> str:
     return source + "\n//# sourceURL=" + str(path).replace("\n", "")
@@ -0,0 +1,98 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# A JSON decoder for large protocol messages that are parsed on a worker
+# thread. json.loads() holds the GIL for the whole document, so running it on
+# a thread would still stall the event loop. This decoder walks containers in
+# Python, which lets the interpreter switch threads regularly, and decodes
+# long strings in bounded pieces with the C scanner. It is slower than
+# json.loads() for large nested documents, but keeps the loop responsive.
+
+import json
+from json.decoder import scanstring  # type: ignore[attr-defined]
+from json.scanner import py_make_scanner  # type: ignore[attr-defined]
+from typing import Any, List, Tuple
+
+_STRING_CHUNK = 1024 * 1024
+
+
+def _safe_cut(s: str, start: int, cut: int) -> int:
+    # Moves `cut` back until it does not split an escape sequence or a
+    # surrogate pair. Returns `start` if no such position was found.
+    while cut > start:
+        last = s.rfind("\\", start, cut)
+        # The longest escape is a 12 character surrogate pair.
+        if last < cut - 12:
+            return cut
+        run = last
+        while run > start and s[run - 1] == "\\":
+            run -= 1
+        # A run of backslashes always starts a new escape sequence.
+        position = run
+        high_surrogate = False
+        while position <= last:
+            first, last_hex = position + 1, position + 4
+            escape = s[first:last_hex].lower()
+            high_surrogate = escape in ("ud8", "ud9", "uda", "udb")
+            position += 6 if escape[:1] == "u" else 2
+        if position > cut or (
+            position == cut and high_surrogate and s.startswith("\\", cut)
+        ):
+            cut = run
+            continue
+        return cut
+    return start
+
+
+def _scan_string(s: str, end: int, strict: bool = True) -> Tuple[str, int]:
+    quote = s.find('"', end)
+    if quote != -1 and s.find("\\", end, quote) == -1:
+        return s[end:quote], quote + 1
+    # Short strings go straight to the C scanner, once the closing quote is
+    # known to be at most a chunk away.
+    while quote != -1 and quote - end <= _STRING_CHUNK:
+        escaped = quote
+        while escaped > end and s[escaped - 1] == "\\":
+            escaped -= 1
+        if (quote - escaped) % 2 == 0:
+            return scanstring(s, end, strict)
+        quote = s.find('"', quote + 1)
+    chunks: List[str] = []
+    while len(s) - end > _STRING_CHUNK:
+        cut = _safe_cut(s, end, end + _STRING_CHUNK)
+        if cut <= end:
+            break
+        # Terminate the piece with a quote of our own. If the scanner stops
+        # before it, the string ended inside the piece.
+        piece = s[end:cut] + '"'
+        value, index = scanstring(piece, 0, strict)
+        chunks.append(value)
+        if index < len(piece):
+            return "".join(chunks), end + index
+        end = cut
+    value, end = scanstring(s, end, strict)
+    chunks.append(value)
+    return "".join(chunks), end
+
+
+class _YieldingDecoder(json.JSONDecoder):
+    def __init__(self) -> None:
+        super().__init__()
+        self.parse_string = _scan_string
+        self.scan_once = py_make_scanner(self)
+
+
+def decode_large_message(data: bytes) -> Any:
+    # The scanner keeps per-call state, so every call gets its own decoder.
+    return _YieldingDecoder().decode(data.decode())
@@ -51,7 +51,8 @@ class JsonPipeTransport(AsyncIOEventEmitter, Transport):
         def handle_message(message: Dict) -> None:
             if self._stop_requested:
                 return
-            self.on_message(cast(ParsedMessagePayload, message))
+            # The size on the wire is not known for piped messages.
+            self.on_message(cast(ParsedMessagePayload, message), 0)
 
         def handle_closed(reason: Optional[str]) -> None:
             self.emit("close", reason)
@@ -49,6 +49,7 @@ from playwright._impl._helper import (
     monotonic_time,
     to_impl,
 )
+from playwright._impl._image import RawImage, decode_image
 from playwright._impl._js_handle import Serializable, serialize_argument
 from playwright._impl._str_utils import (
     escape_for_attribute_selector,
@@ -586,6 +587,21 @@ class Locator:
             ),
         )
 
+    async def screenshot_raw(
+        self,
+        timeout: float = None,
+        omitBackground: bool = None,
+        animations: Literal["allow", "disabled"] = None,
+        caret: Literal["hide", "initial"] = None,
+        scale: Literal["css", "device"] = None,
+        mask: Sequence["Locator"] = None,
+        maskColor: str = None,
+        style: str = None,
+    ) -> RawImage:
+        return decode_image(
+            await self.screenshot(type="png", **locals_to_params(locals()))
+        )
+
     async def aria_snapshot(
         self,
         timeout: float = None,
@@ -740,6 +756,31 @@ class Locator:
             self._selector, "ee => ee.map(e => e.textContent || '')"
         )
 
+    async def extract(
+        self,
+        fields: Dict[str, str],
+        layout: Literal["columns", "rows"] = None,
+        offset: int = None,
+        limit: int = None,
+    ) -> Union[Dict[str, List[Any]], List[Dict[str, Any]]]:
+        if not fields:
+            raise Error("At least one field must be specified")
+        names = list(fields.keys())
+        values = await self._frame.eval_on_selector_all(
+            self._selector,
+            _EXTRACT_FUNCTION,
+            {
+                "fields": [parse_extract_field(fields[name]) for name in names],
+                "offset": offset or 0,
+                "limit": limit,
+            },
+        )
+        if layout == "rows":
+            return [dict(zip(names, row)) for row in values]
+        return {
+            name: [row[index] for row in values] for index, name in enumerate(names)
+        }
+
     async def wait_for(
         self,
         timeout: float = None,
@@ -974,6 +1015,38 @@ def get_by_text_selector(text: Union[str, Pattern[str]], exact: bool = None) ->
     return "internal:text=" + escape_for_text_selector(text, exact=exact)
 
 
+_EXTRACT_FUNCTION = """(elements, { fields, offset, limit }) => {
+  const rows = elements.slice(offset, limit === null ? undefined : offset + limit);
+  const read = (row, field) => {
+    const element = field.selector ? row.querySelector(field.selector) : row;
+    if (!element)
+      return null;
+    if (field.kind === 'attribute')
+      return element.getAttribute(field.name);
+    if (field.kind === 'html')
+      return element.innerHTML;
+    return 'innerText' in element ? element.innerText : element.textContent;
+  };
+  return rows.map(row => fields.map(field => read(row, field)));
+}"""
+
+
+def parse_extract_field(spec: str) -> Dict[str, str]:
+    # Field specs are relative CSS selectors with an optional "@attribute" or
+    # " >> text" / " >> html" suffix, e.g. "h2 >> text" or "a@href".
+    match = re.match(r"^(.*?)\s*>>\s*(text|html)$", spec)
+    if match:
+        return {"selector": match.group(1).strip(), "kind": match.group(2)}
+    match = re.match(r"^(.*?)@([\w:.-]+)$", spec)
+    if match:
+        return {
+            "selector": match.group(1).strip(),
+            "kind": "attribute",
+            "name": match.group(2),
+        }
+    return {"selector": spec.strip(), "kind": "text"}
+
+
 def bool_to_js_bool(value: bool) -> str:
     return "true" if value else "false"
 
@@ -0,0 +1,42 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import TypedDict
+
+
+class MemoryBudgetSnapshot(TypedDict):
+    max_objects: int
+    tracked: int
+    evicted: int
+    collected: int
+
+
+class MemoryBudget:
+    def __init__(self, max_objects: int = 1000) -> None:
+        # Finished requests and their responses, and JSHandles, that a page,
+        # frame or context keeps registered before the oldest ones are
+        # evicted. Evicted objects stay usable while the caller holds them and
+        # are garbage collected otherwise.
+        self.max_objects = max_objects
+        self._tracked = 0
+        self._evicted = 0
+        self._collected = 0
+
+    def snapshot(self) -> MemoryBudgetSnapshot:
+        return {
+            "max_objects": self.max_objects,
+            "tracked": self._tracked,
+            "evicted": self._evicted,
+            "collected": self._collected,
+        }
@@ -0,0 +1,361 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import inspect
+import math
+import time
+import warnings
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Optional, Tuple, TypedDict
+
+from playwright._impl._api_structures import LatencySnapshot
+from playwright._impl._impl_to_api_mapping import HANDLER_ATTR
+
+# Values below 2 ** _SUB_BUCKET_BITS microseconds get a bucket each, larger
+# values share _HALF_SUB_BUCKET_COUNT buckets per power of two. This keeps the
+# relative error of reported percentiles around 3% (HDR histogram style).
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKET_COUNT = _SUB_BUCKET_COUNT >> 1
+
+
+class ApiCallMetric:
+    __slots__ = (
+        "method",
+        "api_name",
+        "wall_time",
+        "start_time",
+        "duration",
+        "request_bytes",
+        "response_bytes",
+        "error",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        api_name: Optional[str],
+        wall_time: float,
+        start_time: float,
+        request_bytes: int,
+    ) -> None:
+        # Protocol method, e.g. "Frame.click".
+        self.method = method
+        # User facing API, e.g. "Page.click". None for internal calls.
+        self.api_name = api_name
+        # Milliseconds since epoch when the call was sent.
+        self.wall_time = wall_time
+        # Monotonic start time in seconds, see time.perf_counter().
+        self.start_time = start_time
+        # Round trip time in milliseconds.
+        self.duration: float = 0
+        self.request_bytes = request_bytes
+        self.response_bytes = 0
+        self.error: Optional[BaseException] = None
+
+    def __repr__(self) -> str:
+        return f"<ApiCallMetric method={self.method} api_name={self.api_name} duration={self.duration:.3f}ms>"
+
+
+class MetricsCollector(ABC):
+    @abstractmethod
+    def record(self, metric: ApiCallMetric) -> None:
+        pass
+
+
+class Histogram:
+    def __init__(self) -> None:
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        index = _bucket_index(int(value * 1000))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, round(percentile / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return max(self.min, min(self.max, _bucket_upper_bound(index) / 1000))
+        return self.max
+
+    def snapshot(self) -> LatencySnapshot:
+        return {
+            "min": self.min,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKET_COUNT:
+        return max(value, 0)
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return (
+        _SUB_BUCKET_COUNT
+        + (shift - 1) * _HALF_SUB_BUCKET_COUNT
+        + (value >> shift)
+        - _HALF_SUB_BUCKET_COUNT
+    )
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < _SUB_BUCKET_COUNT:
+        return index
+    shift, offset = divmod(index - _SUB_BUCKET_COUNT, _HALF_SUB_BUCKET_COUNT)
+    shift += 1
+    return ((offset + _HALF_SUB_BUCKET_COUNT + 1) << shift) - 1
+
+
+class ApiCallStats(TypedDict):
+    count: int
+    errors: int
+    error_rate: float
+    request_bytes: int
+    response_bytes: int
+    latency: LatencySnapshot
+
+
+class _MethodStats:
+    def __init__(self) -> None:
+        self.errors = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.latency = Histogram()
+
+    def snapshot(self) -> ApiCallStats:
+        count = self.latency.count
+        return {
+            "count": count,
+            "errors": self.errors,
+            "error_rate": self.errors / count if count else 0.0,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "latency": self.latency.snapshot(),
+        }
+
+
+class InMemoryMetricsCollector(MetricsCollector):
+    def __init__(self) -> None:
+        self._stats: Dict[str, _MethodStats] = {}
+
+    def record(self, metric: ApiCallMetric) -> None:
+        # Internal calls are attributed to the protocol method they send.
+        key = metric.api_name or metric.method
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _MethodStats()
+        stats.latency.record(metric.duration)
+        stats.request_bytes += metric.request_bytes
+        stats.response_bytes += metric.response_bytes
+        if metric.error is not None:
+            stats.errors += 1
+
+    def snapshot(self) -> Dict[str, ApiCallStats]:
+        return {key: stats.snapshot() for key, stats in self._stats.items()}
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+
+class OpenTelemetryMetricsCollector(MetricsCollector):
+    def __init__(self, tracer: Any = None) -> None:
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError(
+                "OpenTelemetryMetricsCollector requires the 'opentelemetry-api' package"
+            ) from exc
+        self._status = trace.Status
+        self._status_code = trace.StatusCode
+        self._tracer = tracer or trace.get_tracer("playwright")
+
+    def record(self, metric: ApiCallMetric) -> None:
+        start_time = int(metric.wall_time * 1_000_000)
+        span = self._tracer.start_span(
+            metric.api_name or metric.method,
+            start_time=start_time,
+            attributes={
+                "playwright.method": metric.method,
+                "playwright.request_bytes": metric.request_bytes,
+                "playwright.response_bytes": metric.response_bytes,
+            },
+        )
+        if metric.error is not None:
+            span.record_exception(metric.error)
+            span.set_status(self._status(self._status_code.ERROR, str(metric.error)))
+        span.end(end_time=start_time + int(metric.duration * 1_000_000))
+
+
+class StallWarning(UserWarning):
+    pass
+
+
+class HandlerStats(TypedDict):
+    count: int
+    total: float
+    max: float
+    stalls: int
+
+
+class StallSnapshot(TypedDict):
+    loop_lag: LatencySnapshot
+    loop_stalls: int
+    queue_depth: int
+    max_queue_depth: int
+    handlers: Dict[str, HandlerStats]
+
+
+class StallMonitor:
+    def __init__(
+        self,
+        handler_threshold: float = 100,
+        loop_lag_threshold: float = 100,
+        interval: float = 100,
+        warn: bool = True,
+    ) -> None:
+        # All durations are in milliseconds.
+        self._handler_threshold = handler_threshold
+        self._loop_lag_threshold = loop_lag_threshold
+        self._interval = interval
+        self._warn = warn
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._current_handler: Optional[Callable] = None
+        self._current_duration = 0.0
+        self._slice = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self._handlers: Dict[str, HandlerStats] = {}
+        self._loop_lag = Histogram()
+        self._loop_stalls = 0
+        self._queue_depth = 0
+        self._max_queue_depth = 0
+
+    def snapshot(self) -> StallSnapshot:
+        return {
+            "loop_lag": self._loop_lag.snapshot(),
+            "loop_stalls": self._loop_stalls,
+            "queue_depth": self._queue_depth,
+            "max_queue_depth": self._max_queue_depth,
+            "handlers": {name: stats.copy() for name, stats in self._handlers.items()},
+        }
+
+    def _start(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._stop()
+        self._schedule_probe(loop)
+
+    def _stop(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule_probe(self, loop: asyncio.AbstractEventLoop) -> None:
+        deadline = loop.time() + self._interval / 1000
+        self._timer = loop.call_at(deadline, self._on_probe, loop, deadline)
+
+    def _on_probe(self, loop: asyncio.AbstractEventLoop, deadline: float) -> None:
+        lag = max(0, loop.time() - deadline) * 1000
+        self._loop_lag.record(lag)
+        if lag > self._loop_lag_threshold:
+            self._loop_stalls += 1
+            self._report(f"Event loop was blocked for {lag:.0f}ms")
+        self._schedule_probe(loop)
+
+    def _handler_started(self, handler: Optional[Callable] = None) -> float:
+        # Starts timing one dispatcher slice. Listeners that run within it are
+        # reported via _listener_started/_listener_finished, the slowest one
+        # is blamed unless the caller already knows the handler.
+        self._slice += 1
+        self._current_handler = handler
+        self._current_duration = math.inf if handler else 0.0
+        return time.perf_counter()
+
+    def _listener_started(self, listener: Callable) -> Tuple[int, float]:
+        if self._current_handler is None:
+            self._current_handler = listener
+        return self._slice, time.perf_counter()
+
+    def _listener_finished(self, listener: Callable, token: Tuple[int, float]) -> None:
+        slice, start = token
+        # Sync listeners may resume in a later slice, ignore those.
+        if slice != self._slice:
+            return
+        duration = time.perf_counter() - start
+        if duration > self._current_duration:
+            self._current_handler = listener
+            self._current_duration = duration
+
+    def _handler_finished(self, event: str, start: float) -> None:
+        duration = (time.perf_counter() - start) * 1000
+        handler = self._current_handler
+        self._current_handler = None
+        name = _handler_name(handler) if handler else event
+        stats = self._handlers.get(name)
+        if stats is None:
+            stats = self._handlers[name] = {
+                "count": 0,
+                "total": 0.0,
+                "max": 0.0,
+                "stalls": 0,
+            }
+        stats["count"] += 1
+        stats["total"] += duration
+        if duration > stats["max"]:
+            stats["max"] = duration
+        if duration > self._handler_threshold:
+            stats["stalls"] += 1
+            self._report(
+                f"Handler {name} for {event} blocked the Playwright dispatcher for {duration:.0f}ms"
+            )
+
+    def _record_queue_depth(self, depth: int) -> None:
+        self._queue_depth = depth
+        if depth > self._max_queue_depth:
+            self._max_queue_depth = depth
+
+    def _report(self, message: str) -> None:
+        if self._warn:
+            warnings.warn(message, StallWarning)
+
+
+def _handler_name(handler: Callable) -> str:
+    handler = getattr(handler, HANDLER_ATTR, handler)
+    name = getattr(handler, "__qualname__", None) or repr(handler)
+    try:
+        code = inspect.unwrap(handler).__code__
+    except AttributeError:
+        return name
+    return f"{name} ({code.co_filename}:{code.co_firstlineno})"
@@ -49,14 +49,16 @@ from playwright._impl._connection import (
     _capture_stack_trace,
     from_channel,
     from_nullable_channel,
+    protocol_event,
 )
 from playwright._impl._errors import Error
 from playwright._impl._event_context_manager import EventContextManagerImpl
 from playwright._impl._helper import (
     URLMatch,
     WebSocketRouteHandlerCallback,
-    async_readfile,
+    async_readfile_cached,
     locals_to_params,
+    to_base64,
     url_matches,
 )
 from playwright._impl._str_utils import escape_regex_flags
@@ -107,21 +109,15 @@ async def to_client_certificates_protocol(
         if pfx := clientCertificate.get("pfx"):
             out_record["pfx"] = base64.b64encode(pfx).decode()
         if pfx_path := clientCertificate.get("pfxPath"):
-            out_record["pfx"] = base64.b64encode(
-                await async_readfile(pfx_path)
-            ).decode()
+            out_record["pfx"] = await async_readfile_cached(pfx_path, to_base64)
         if cert := clientCertificate.get("cert"):
             out_record["cert"] = base64.b64encode(cert).decode()
         if cert_path := clientCertificate.get("certPath"):
-            out_record["cert"] = base64.b64encode(
-                await async_readfile(cert_path)
-            ).decode()
+            out_record["cert"] = await async_readfile_cached(cert_path, to_base64)
         if key := clientCertificate.get("key"):
             out_record["key"] = base64.b64encode(key).decode()
         if key_path := clientCertificate.get("keyPath"):
-            out_record["key"] = base64.b64encode(
-                await async_readfile(key_path)
-            ).decode()
+            out_record["key"] = await async_readfile_cached(key_path, to_base64)
         out.append(out_record)
     return out
 
@@ -137,6 +133,8 @@ class Request(ChannelOwner):
         self._redirected_to: Optional["Request"] = None
         if self._redirected_from:
             self._redirected_from._redirected_to = self
+            # Held by this request from now on, see _mark_finished().
+            self._redirected_from._mark_evictable_with_response()
         self._failure_text: Optional[str] = None
         self._timing: ResourceTiming = {
             "startTime": 0,
@@ -289,6 +287,19 @@ class Request(ChannelOwner):
         if self._timing["responseStart"] == -1:
             self._timing["responseStart"] = response_end_timing
 
+    def _mark_finished(self) -> None:
+        # A redirect response is followed by a request that names this one as
+        # redirectedFrom, so it must stay registered until that request exists.
+        status = self._response.status if self._response else 0
+        if 300 <= status < 400 and status != 304:
+            return
+        self._mark_evictable_with_response()
+
+    def _mark_evictable_with_response(self) -> None:
+        if self._response:
+            self._response._mark_evictable()
+        self._mark_evictable()
+
     @property
     def headers(self) -> Headers:
         override = self._fallback_overrides.headers
@@ -433,13 +444,13 @@ class Route(ChannelOwner):
             params["isBase64"] = False
             length = len(body.encode())
         elif isinstance(body, bytes):
-            params["body"] = base64.b64encode(body).decode()
+            params["body"] = self._connection.encode_binary(body)
             params["isBase64"] = True
             length = len(body)
         elif path:
             del params["path"]
             file_content = Path(path).read_bytes()
-            params["body"] = base64.b64encode(file_content).decode()
+            params["body"] = self._connection.encode_binary(file_content)
             params["isBase64"] = True
             length = len(file_content)
 
@@ -629,11 +640,7 @@ class WebSocketRoute(ChannelOwner):
         self._server = ServerWebSocketRoute(self)
         self._connected = False
 
-        self._channel.on("messageFromPage", self._channel_message_from_page)
-        self._channel.on("messageFromServer", self._channel_message_from_server)
-        self._channel.on("closePage", self._channel_close_page)
-        self._channel.on("closeServer", self._channel_close_server)
-
+    @protocol_event("messageFromPage")
     def _channel_message_from_page(self, event: Dict) -> None:
         if self._on_page_message:
             self._on_page_message(
@@ -644,6 +651,7 @@ class WebSocketRoute(ChannelOwner):
         elif self._connected:
             self._channel.send_may_fail("sendToServer", None, event)
 
+    @protocol_event("messageFromServer")
     def _channel_message_from_server(self, event: Dict) -> None:
         if self._on_server_message:
             self._on_server_message(
@@ -654,12 +662,14 @@ class WebSocketRoute(ChannelOwner):
         else:
             self._channel.send_may_fail("sendToPage", None, event)
 
+    @protocol_event("closePage")
     def _channel_close_page(self, event: Dict) -> None:
         if self._on_page_close:
             self._on_page_close(event["code"], event["reason"])
         else:
             self._channel.send_may_fail("closeServer", None, event)
 
+    @protocol_event("closeServer")
     def _channel_close_server(self, event: Dict) -> None:
         if self._on_server_close:
             self._on_server_close(event["code"], event["reason"])
@@ -883,7 +893,7 @@ class Response(ChannelOwner):
             "body",
             None,
         )
-        return base64.b64decode(binary)
+        return self._connection.decode_binary(binary)
 
     async def text(self) -> str:
         content = await self.body()
@@ -915,23 +925,26 @@ class WebSocket(ChannelOwner):
         super().__init__(parent, type, guid, initializer)
         self._is_closed = False
         self._page = cast("Page", parent)
-        self._channel.on(
-            "frameSent",
-            lambda params: self._on_frame_sent(params["opcode"], params["data"]),
-        )
-        self._channel.on(
-            "frameReceived",
-            lambda params: self._on_frame_received(params["opcode"], params["data"]),
-        )
-        self._channel.on(
-            "socketError",
-            lambda params: self.emit(WebSocket.Events.Error, params["error"]),
-        )
-        self._channel.on("close", lambda params: self._on_close())
 
     def __repr__(self) -> str:
         return f"<WebSocket url={self.url!r}>"
 
+    @protocol_event("frameSent")
+    def _on_frame_sent_event(self, params: Dict) -> None:
+        self._on_frame_sent(params["opcode"], params["data"])
+
+    @protocol_event("frameReceived")
+    def _on_frame_received_event(self, params: Dict) -> None:
+        self._on_frame_received(params["opcode"], params["data"])
+
+    @protocol_event("socketError")
+    def _on_socket_error_event(self, params: Dict) -> None:
+        self.emit(WebSocket.Events.Error, params["error"])
+
+    @protocol_event("close")
+    def _on_close_event(self, params: Dict) -> None:
+        self._on_close()
+
     @property
     def url(self) -> str:
         return self._initializer["url"]
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import asyncio
-import base64
 import inspect
 import re
 import sys
@@ -45,9 +44,11 @@ from playwright._impl._api_structures import (
 from playwright._impl._artifact import Artifact
 from playwright._impl._clock import Clock
 from playwright._impl._connection import (
+    Channel,
     ChannelOwner,
     from_channel,
     from_nullable_channel,
+    protocol_event,
 )
 from playwright._impl._console_message import ConsoleMessage
 from playwright._impl._disposable import Disposable, DisposableStub
@@ -84,6 +85,7 @@ from playwright._impl._helper import (
     serialize_error,
     url_matches,
 )
+from playwright._impl._image import RawImage, decode_image
 from playwright._impl._input import Keyboard, Mouse, Touchscreen
 from playwright._impl._js_handle import (
     JSHandle,
@@ -192,58 +194,6 @@ class Page(ChannelOwner):
         self._har_routers: List[HarRouter] = []
         self._locator_handlers: Dict[str, LocatorHandler] = {}
 
-        self._channel.on(
-            "bindingCall",
-            lambda params: self._on_binding(from_channel(params["binding"])),
-        )
-        self._channel.on("close", lambda _: self._on_close())
-        self._channel.on("crash", lambda _: self._on_crash())
-        self._channel.on("download", lambda params: self._on_download(params))
-        self._channel.on(
-            "fileChooser",
-            lambda params: self.emit(
-                Page.Events.FileChooser,
-                FileChooser(
-                    self, from_channel(params["element"]), params["isMultiple"]
-                ),
-            ),
-        )
-        self._channel.on(
-            "frameAttached",
-            lambda params: self._on_frame_attached(from_channel(params["frame"])),
-        )
-        self._channel.on(
-            "frameDetached",
-            lambda params: self._on_frame_detached(from_channel(params["frame"])),
-        )
-        self._channel.on(
-            "locatorHandlerTriggered",
-            lambda params: self._loop.create_task(
-                self._on_locator_handler_triggered(params["uid"])
-            ),
-        )
-        self._channel.on(
-            "route",
-            lambda params: self._loop.create_task(
-                self._on_route(from_channel(params["route"]))
-            ),
-        )
-        self._channel.on(
-            "webSocketRoute",
-            lambda params: self._loop.create_task(
-                self._on_web_socket_route(from_channel(params["webSocketRoute"]))
-            ),
-        )
-        self._channel.on("viewportSizeChanged", self._on_viewport_size_changed)
-        self._channel.on(
-            "webSocket",
-            lambda params: self.emit(
-                Page.Events.WebSocket, from_channel(params["webSocket"])
-            ),
-        )
-        self._channel.on(
-            "worker", lambda params: self._on_worker(from_channel(params["worker"]))
-        )
         self._closed_or_crashed_future: asyncio.Future = asyncio.Future()
         self.on(
             Page.Events.Close,
@@ -279,6 +229,55 @@ class Page(ChannelOwner):
     def __repr__(self) -> str:
         return f"<Page url={self.url!r}>"
 
+    @protocol_event("bindingCall")
+    def _on_binding_call_event(self, params: Dict) -> None:
+        self._on_binding(from_channel(params["binding"]))
+
+    @protocol_event("close")
+    def _on_close_event(self, params: Dict) -> None:
+        self._on_close()
+
+    @protocol_event("crash")
+    def _on_crash_event(self, params: Dict) -> None:
+        self._on_crash()
+
+    @protocol_event("fileChooser")
+    def _on_file_chooser_event(self, params: Dict) -> None:
+        self.emit(
+            Page.Events.FileChooser,
+            FileChooser(self, from_channel(params["element"]), params["isMultiple"]),
+        )
+
+    @protocol_event("frameAttached")
+    def _on_frame_attached_event(self, params: Dict) -> None:
+        self._on_frame_attached(from_channel(params["frame"]))
+
+    @protocol_event("frameDetached")
+    def _on_frame_detached_event(self, params: Dict) -> None:
+        self._on_frame_detached(from_channel(params["frame"]))
+
+    @protocol_event("locatorHandlerTriggered")
+    def _on_locator_handler_triggered_event(self, params: Dict) -> asyncio.Task:
+        return self._loop.create_task(self._on_locator_handler_triggered(params["uid"]))
+
+    @protocol_event("route")
+    def _on_route_event(self, params: Dict) -> asyncio.Task:
+        return self._loop.create_task(self._on_route(from_channel(params["route"])))
+
+    @protocol_event("webSocketRoute")
+    def _on_web_socket_route_event(self, params: Dict) -> asyncio.Task:
+        return self._loop.create_task(
+            self._on_web_socket_route(from_channel(params["webSocketRoute"]))
+        )
+
+    @protocol_event("webSocket")
+    def _on_web_socket_event(self, params: Dict) -> None:
+        self.emit(Page.Events.WebSocket, from_channel(params["webSocket"]))
+
+    @protocol_event("worker")
+    def _on_worker_event(self, params: Dict) -> None:
+        self._on_worker(from_channel(params["worker"]))
+
     def _on_frame_attached(self, frame: Frame) -> None:
         frame._page = self
         self._frames.append(frame)
@@ -360,6 +359,7 @@ class Page(ChannelOwner):
     def _on_crash(self) -> None:
         self.emit(Page.Events.Crash, self)
 
+    @protocol_event("download")
     def _on_download(self, params: Any) -> None:
         url = params["url"]
         suggested_filename = params["suggestedFilename"]
@@ -368,6 +368,7 @@ class Page(ChannelOwner):
         self.emit(Page.Events.Download, download)
         self._browser_context.emit("download", download)
 
+    @protocol_event("viewportSizeChanged")
     def _on_viewport_size_changed(self, params: Any) -> None:
         self._viewport_size = params["viewportSize"]
 
@@ -476,6 +477,12 @@ class Page(ChannelOwner):
     ) -> JSHandle:
         return await self._main_frame.evaluate_handle(expression, arg)
 
+    async def call(self, fn: str, arg: Serializable = None) -> Any:
+        registration = self._browser_context._registered_functions.get(fn)
+        return await self._main_frame._call_registered_function(
+            fn, registration[0] if registration else None, arg
+        )
+
     async def eval_on_selector(
         self,
         selector: str,
@@ -828,12 +835,29 @@ class Page(ChannelOwner):
         encoded_binary = await self._channel.send(
             "screenshot", self._timeout_settings.timeout, params
         )
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = self._connection.decode_binary(encoded_binary)
         if path:
             make_dirs_for_file(path)
             await async_writefile(path, decoded_binary)
         return decoded_binary
 
+    async def screenshot_raw(
+        self,
+        timeout: float = None,
+        omitBackground: bool = None,
+        fullPage: bool = None,
+        clip: FloatRect = None,
+        animations: Literal["allow", "disabled"] = None,
+        caret: Literal["hide", "initial"] = None,
+        scale: Literal["css", "device"] = None,
+        mask: Sequence["Locator"] = None,
+        maskColor: str = None,
+        style: str = None,
+    ) -> RawImage:
+        return decode_image(
+            await self.screenshot(type="png", **locals_to_params(locals()))
+        )
+
     async def title(self) -> str:
         return await self._main_frame.title()
 
@@ -1203,7 +1227,7 @@ class Page(ChannelOwner):
         if "path" in params:
             del params["path"]
         encoded_binary = await self._channel.send("pdf", None, params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = self._connection.decode_binary(encoded_binary)
         if path:
             make_dirs_for_file(path)
             await async_writefile(path, decoded_binary)
@@ -1481,7 +1505,9 @@ class Page(ChannelOwner):
 
     async def requests(self) -> List[Request]:
         request_objects = await self._channel.send("requests", None)
-        return [from_channel(r) for r in request_objects]
+        # The driver lists its recent requests, which may include some that
+        # the memory budget evicted and that were garbage collected since.
+        return [from_channel(r) for r in request_objects if isinstance(r, Channel)]
 
     async def console_messages(
         self, filter: Literal["all", "since-navigation"] = None
@@ -1489,12 +1515,14 @@ class Page(ChannelOwner):
         message_dicts = await self._channel.send(
             "consoleMessages", None, locals_to_params(locals())
         )
-        return [
-            ConsoleMessage(
+        messages = []
+        for event in message_dicts:
+            message = ConsoleMessage(
                 {**event, "page": self._channel}, self._loop, self._dispatcher_fiber
             )
-            for event in message_dicts
-        ]
+            message._check_released_args()
+            messages.append(message)
+        return messages
 
     async def page_errors(
         self, filter: Literal["all", "since-navigation"] = None
@@ -1526,13 +1554,16 @@ class Worker(ChannelOwner):
     ) -> None:
         super().__init__(parent, type, guid, initializer)
         self._set_event_to_subscription_mapping({Worker.Events.Console: "console"})
-        self._channel.on("close", lambda _: self._on_close())
         self._page: Optional[Page] = None
         self._context: Optional["BrowserContext"] = None
 
     def __repr__(self) -> str:
         return f"<Worker url={self.url!r}>"
 
+    @protocol_event("close")
+    def _on_close_event(self, params: Dict) -> None:
+        self._on_close()
+
     def _on_close(self) -> None:
         if self._page:
             self._page._workers.remove(self)
@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict
+from typing import Dict, Optional
 
 from playwright._impl._browser_type import BrowserType
 from playwright._impl._connection import ChannelOwner, from_channel
+from playwright._impl._errors import Error
 from playwright._impl._fetch import APIRequest
+from playwright._impl._memory_budget import MemoryBudget
+from playwright._impl._metrics import MetricsCollector, StallMonitor
 from playwright._impl._selectors import Selectors
 
 
@@ -53,6 +56,23 @@ class Playwright(ChannelOwner):
             return self.webkit
         raise ValueError("Invalid browser " + value)
 
+    def set_metrics_collector(self, collector: Optional[MetricsCollector]) -> None:
+        self._connection.set_metrics_collector(collector)
+
+    def set_stall_monitor(self, monitor: Optional[StallMonitor]) -> None:
+        self._connection.set_stall_monitor(monitor)
+
+    def set_memory_budget(self, budget: Optional[MemoryBudget]) -> None:
+        self._connection.set_memory_budget(budget)
+
+    def set_console_message_retention(self, limit: Optional[int]) -> None:
+        # The argument handles of older console messages are disposed and
+        # their args raise. By default all are kept until their execution
+        # context goes away.
+        if limit is not None and limit < 1:
+            raise Error("limit must be a positive number")
+        self._connection.set_console_message_retention(limit)
+
     def _set_selectors(self, selectors: Selectors) -> None:
         self.selectors = selectors
 
@@ -12,16 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import base64
+import time
+from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    List,
+    Literal,
+    Optional,
+    Union,
+)
 
-from playwright._impl._api_structures import ScreencastFrame, ScreencastSize
+from playwright._impl._api_structures import (
+    ScreencastFrame,
+    ScreencastSize,
+    ScreencastStats,
+)
 from playwright._impl._artifact import Artifact
 from playwright._impl._connection import from_nullable_channel
 from playwright._impl._disposable import DisposableStub
 from playwright._impl._errors import Error
+from playwright._impl._greenlets import EventGreenlet
 from playwright._impl._helper import locals_to_params
+from playwright._impl._metrics import Histogram
 
 if TYPE_CHECKING:  # pragma: no cover
     from playwright._impl._page import Page
@@ -40,6 +58,11 @@ ScreencastCursor = Literal[
     "none",
     "pointer",
 ]
+ScreencastOverflow = Literal[
+    "backpressure",
+    "drop-oldest",
+    "keep-latest",
+]
 
 
 class Screencast:
@@ -51,8 +74,43 @@ class Screencast:
         self._save_path: Optional[Union[str, Path]] = None
         self._on_frame: Optional[ScreencastFrameCallback] = None
         self._artifact: Optional[Artifact] = None
+        # Pipeline mode state, see _enqueue_frame.
+        self._queue_size = 0
+        self._overflow: ScreencastOverflow = "backpressure"
+        # Queued frames as [params, received time, acked].
+        self._queue: Deque[List[Any]] = deque()
+        self._pump_task: Optional[asyncio.Task] = None
+        self._reset_stats()
         page._channel.on("screencastFrame", self._dispatch_frame)
 
+    def _reset_stats(self) -> None:
+        self._received = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._latency = Histogram()
+        self._delivery_times: Deque[float] = deque()
+
+    def _record_delivery(self, received: float) -> None:
+        now = time.perf_counter()
+        self._delivered += 1
+        self._latency.record((now - received) * 1000)
+        self._delivery_times.append(now)
+        while now - self._delivery_times[0] > 1:
+            self._delivery_times.popleft()
+
+    def frame_stats(self) -> ScreencastStats:
+        now = time.perf_counter()
+        while self._delivery_times and now - self._delivery_times[0] > 1:
+            self._delivery_times.popleft()
+        return {
+            "received": self._received,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "queue_depth": len(self._queue),
+            "fps": float(len(self._delivery_times)),
+            "latency": self._latency.snapshot(),
+        }
+
     def _ack_frame(self, frame_id: int) -> None:
         try:
             self._page._channel.send_no_reply(
@@ -61,49 +119,148 @@ class Screencast:
         except (Error, OSError):
             pass
 
-    async def _await_callback_and_ack(self, result: Any, frame_id: int) -> None:
+    async def _await_callback_and_ack(
+        self, result: Any, frame_id: int, received: float
+    ) -> None:
         try:
             await result
+            self._record_delivery(received)
         finally:
             self._ack_frame(frame_id)
 
     def _dispatch_frame(self, params: dict) -> Any:
         result = None
         task = None
+        received = time.perf_counter()
+        if self._on_frame and self._queue_size:
+            self._received += 1
+            self._enqueue_frame(params, received)
+            return None
         try:
             if not self._on_frame:
                 return
-            data = params["data"]
-            if isinstance(data, str):
-                data = base64.b64decode(data)
-            result = self._on_frame(
-                {
-                    "data": data,
-                    "timestamp": params.get("timestamp", 0),
-                    "viewportWidth": params["viewportWidth"],
-                    "viewportHeight": params["viewportHeight"],
-                }
-            )
+            self._received += 1
+            result = self._on_frame(self._decode_frame(params))
+            if not hasattr(result, "__await__"):
+                self._record_delivery(received)
         finally:
             if hasattr(result, "__await__"):
                 task = self._loop.create_task(
-                    self._await_callback_and_ack(result, params["frameId"])
+                    self._await_callback_and_ack(result, params["frameId"], received)
                 )
             else:
                 self._ack_frame(params["frameId"])
         return task
 
+    def _decode_frame(self, params: dict) -> ScreencastFrame:
+        data = params["data"]
+        if isinstance(data, str):
+            data = base64.b64decode(data)
+        return {
+            "data": data,
+            "timestamp": params.get("timestamp", 0),
+            "viewportWidth": params["viewportWidth"],
+            "viewportHeight": params["viewportHeight"],
+        }
+
+    def _enqueue_frame(self, params: dict, received: float) -> None:
+        # Frames are handed to a single consumer that decodes them on the
+        # default executor and runs the callback on the event loop. With "backpressure", frames
+        # that do not fit into the queue stay unacknowledged so that the
+        # server stops producing until the consumer catches up. The other
+        # policies acknowledge right away and discard stale frames instead.
+        if self._overflow == "keep-latest":
+            self._dropped += len(self._queue)
+            self._queue.clear()
+        elif self._overflow == "drop-oldest" and len(self._queue) >= self._queue_size:
+            self._queue.popleft()
+            self._dropped += 1
+        acked = self._overflow != "backpressure" or len(self._queue) < self._queue_size
+        self._queue.append([params, received, acked])
+        if acked:
+            self._ack_frame(params["frameId"])
+        if not self._pump_task:
+            self._pump_task = self._loop.create_task(self._pump_frames())
+
+    def _ack_queued_frames(self) -> None:
+        for index, item in enumerate(self._queue):
+            if index >= self._queue_size:
+                break
+            if not item[2]:
+                item[2] = True
+                self._ack_frame(item[0]["frameId"])
+
+    async def _pump_frames(self) -> None:
+        try:
+            while self._queue:
+                params, received, acked = self._queue.popleft()
+                if not acked:
+                    self._ack_frame(params["frameId"])
+                self._ack_queued_frames()
+                on_frame = self._on_frame
+                if not on_frame:
+                    continue
+                try:
+                    frame = await self._loop.run_in_executor(
+                        None, self._decode_frame, params
+                    )
+                    await self._call_on_frame(on_frame, frame)
+                except Exception as exc:
+                    self._page._connection._on_event_listener_error(exc)
+                else:
+                    self._record_delivery(received)
+        finally:
+            if self._pump_task is asyncio.current_task():
+                self._pump_task = None
+
+    async def _call_on_frame(
+        self, on_frame: ScreencastFrameCallback, frame: ScreencastFrame
+    ) -> None:
+        if self._dispatcher_fiber:
+            callback_finished_future = self._loop.create_future()
+
+            def _callback() -> None:
+                try:
+                    on_frame(frame)
+                    callback_finished_future.set_result(None)
+                except Exception as e:
+                    callback_finished_future.set_exception(e)
+
+            g = EventGreenlet(_callback)
+            g.switch()
+            await callback_finished_future
+        else:
+            result = on_frame(frame)
+            if hasattr(result, "__await__"):
+                await result
+
+    def _stop_pipeline(self) -> None:
+        self._dropped += len(self._queue)
+        self._queue.clear()
+        self._queue_size = 0
+        if self._pump_task:
+            self._pump_task.cancel()
+            self._pump_task = None
+
     async def start(
         self,
         onFrame: ScreencastFrameCallback = None,
         path: Union[str, Path] = None,
         quality: int = None,
         size: ScreencastSize = None,
+        queueSize: int = None,
+        overflow: ScreencastOverflow = None,
     ) -> DisposableStub:
         if self._started:
             raise Error("Screencast is already started")
+        if queueSize is not None and queueSize < 1:
+            raise Error("queueSize must be a positive number")
         self._started = True
         self._on_frame = onFrame
+        # Either option switches frame delivery to the pipeline mode.
+        self._queue_size = queueSize or (1 if overflow else 0)
+        self._overflow = overflow or "backpressure"
+        self._reset_stats()
         result = await self._page._channel.send_return_as_dict(
             "screencastStart",
             None,
@@ -123,6 +280,7 @@ class Screencast:
     async def stop(self) -> None:
         self._started = False
         self._on_frame = None
+        self._stop_pipeline()
         await self._page._channel.send("screencastStop", None)
         if self._save_path and self._artifact:
             await self._artifact.save_as(self._save_path)
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
 from pathlib import Path
 from typing import Dict, Union
 
@@ -32,7 +31,7 @@ class Stream(ChannelOwner):
             if not binary:
                 break
             await self._loop.run_in_executor(
-                None, lambda: file.write(base64.b64decode(binary))
+                None, lambda: file.write(self._connection.decode_binary(binary))
             )
         await self._loop.run_in_executor(None, lambda: file.close())
 
@@ -42,5 +41,5 @@ class Stream(ChannelOwner):
             chunk = await self._channel.send("read", None, {"size": 1024 * 1024})
             if not chunk:
                 break
-            binary += base64.b64decode(chunk)
+            binary += self._connection.decode_binary(chunk)
         return binary
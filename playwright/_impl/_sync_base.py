@@ -20,8 +20,10 @@ from typing import (
     Any,
     Callable,
     Coroutine,
+    Dict,
     Generator,
     Generic,
+    List,
     Optional,
     Type,
     TypeVar,
@@ -149,3 +151,16 @@ class SyncContextManager(SyncBase):
         self.close()
 
     def close(self) -> None: ...
+
+
+class SyncEventStream(SyncContextManager):
+    # Iterates the batches of an impl stream, whose _next_batch() returns
+    # None once the stream is closed.
+    def __iter__(self: Self) -> Self:
+        return self
+
+    def __next__(self) -> List[Dict[str, Any]]:
+        batch = self._sync(self._impl_obj._next_batch())
+        if batch is None:
+            raise StopIteration
+        return batch
@@ -0,0 +1,58 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import inspect
+import shutil
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Union
+
+
+class TraceSink(ABC):
+    # Receives finished trace chunks. The chunk is a complete trace archive
+    # in a temporary file that is removed once write() returns.
+    @abstractmethod
+    async def write(self, name: str, path: Path) -> None:
+        pass
+
+
+class DirectoryTraceSink(TraceSink):
+    def __init__(self, directory: Union[str, Path]) -> None:
+        self._directory = Path(directory)
+
+    async def write(self, name: str, path: Path) -> None:
+        target = self._directory / name
+
+        def move() -> None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            shutil.move(str(path), str(target))
+
+        await asyncio.get_running_loop().run_in_executor(None, move)
+
+
+class CallbackTraceSink(TraceSink):
+    def __init__(self, callback: Callable[[str, Path], Any]) -> None:
+        # Coroutine callbacks run on the event loop, plain callbacks run on
+        # the default executor so that a blocking upload does not stall
+        # Playwright. Neither may call back into Playwright.
+        self._callback = callback
+
+    async def write(self, name: str, path: Path) -> None:
+        if inspect.iscoroutinefunction(self._callback):
+            await self._callback(name, path)
+            return
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._callback, name, path
+        )
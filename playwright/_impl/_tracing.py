@@ -12,8 +12,28 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import glob
+import os
 import pathlib
-from typing import Any, Dict, Literal, Optional, Pattern, Union, cast
+import shutil
+import tempfile
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Literal,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 from playwright._impl._api_structures import TracingGroupLocation
 from playwright._impl._artifact import Artifact
@@ -23,7 +43,12 @@ from playwright._impl._connection import (
     from_nullable_channel,
 )
 from playwright._impl._disposable import DisposableStub
+from playwright._impl._errors import is_target_closed_error
 from playwright._impl._helper import Error, locals_to_params
+from playwright._impl._trace_sink import TraceSink
+
+# How often the current chunk is checked for rollover.
+_CHUNK_CHECK_INTERVAL = 1.0
 
 
 class Tracing(ChannelOwner):
@@ -38,6 +63,29 @@ class Tracing(ChannelOwner):
         self._traces_dir: Optional[str] = None
         self._har_id: Optional[str] = None
         self._har_recorders: Dict[str, Dict[str, str]] = {}
+        self._sink: Optional[TraceSink] = None
+        self._max_chunk_size: Optional[int] = None
+        self._trace_name: Optional[str] = None
+        self._chunk_name: Optional[str] = None
+        self._chunk_title: Optional[str] = None
+        self._chunk_index = 0
+        self._chunk_started = 0.0
+        self._chunk_lock = asyncio.Lock()
+        self._chunk_duration: Optional[float] = None
+        self._chunk_watcher: Optional[asyncio.Task] = None
+        self._exports: Set[asyncio.Task] = set()
+        # Recorder mode keeps the last chunks as (write, discard) pairs and
+        # only exports them when keep_recent() is called.
+        self._retain_chunks: Optional[int] = None
+        self._retained: Deque[
+            Tuple[
+                Callable[[Union[pathlib.Path, str]], Awaitable[None]],
+                Callable[[], Awaitable[None]],
+            ]
+        ] = deque()
+        self._keep_on_error = False
+        self._keep_task: Optional[asyncio.Task] = None
+        self._stack_sample_rate = 1.0
 
     async def start(
         self,
@@ -47,10 +95,45 @@ class Tracing(ChannelOwner):
         screenshots: bool = None,
         sources: bool = None,
         live: bool = None,
+        sink: TraceSink = None,
+        maxChunkSize: int = None,
+        chunkDuration: float = None,
+        retainChunks: int = None,
+        keepOnError: bool = None,
+        stackSampleRate: float = None,
     ) -> None:
-        params = locals_to_params(locals())
+        if maxChunkSize is not None:
+            if not sink:
+                raise Error("maxChunkSize requires a sink")
+            if self._connection.is_remote or not self._traces_dir:
+                raise Error(
+                    "maxChunkSize requires a local browser launched with traces_dir"
+                )
+        if retainChunks is not None:
+            if not sink:
+                raise Error("retainChunks requires a sink")
+            if retainChunks < 1:
+                raise Error("retainChunks must be a positive number")
+        if keepOnError and retainChunks is None:
+            raise Error("keepOnError requires retainChunks")
+        if chunkDuration is not None and not sink:
+            raise Error("chunkDuration requires a sink")
+        if stackSampleRate is not None and not 0 <= stackSampleRate <= 1:
+            raise Error("stackSampleRate must be between 0 and 1")
         self._include_sources = bool(sources)
         self._is_live = bool(live)
+        self._sink = sink
+        self._max_chunk_size = maxChunkSize
+        self._chunk_duration = chunkDuration
+        self._retain_chunks = retainChunks
+        self._stack_sample_rate = 1.0 if stackSampleRate is None else stackSampleRate
+        self._chunk_index = 0
+        if keepOnError and not self._keep_on_error:
+            # Only failures of calls made within the traced context count.
+            self._connection._api_error_listeners[cast(ChannelOwner, self._parent)] = (
+                self._on_api_error
+            )
+        self._keep_on_error = bool(keepOnError)
 
         await self._channel.send(
             "tracingStart",
@@ -62,59 +145,204 @@ class Tracing(ChannelOwner):
                 "live": live,
             },
         )
-        trace_name = await self._channel.send(
-            "tracingStartChunk", None, {"title": title, "name": name}
-        )
-        await self._start_collecting_stacks(trace_name)
+        await self._start_chunk(title, name)
 
     async def start_chunk(self, title: str = None, name: str = None) -> None:
-        params = locals_to_params(locals())
-        trace_name = await self._channel.send("tracingStartChunk", None, params)
+        async with self._chunk_lock:
+            await self._start_chunk(title, name)
+
+    async def _start_chunk(self, title: Optional[str], name: Optional[str]) -> None:
+        trace_name = await self._channel.send(
+            "tracingStartChunk", None, locals_to_params(locals())
+        )
+        self._trace_name = trace_name
+        self._chunk_started = time.time()
+        self._chunk_name = name
+        self._chunk_title = title
         await self._start_collecting_stacks(trace_name)
+        needs_watcher = (
+            self._max_chunk_size is not None or self._chunk_duration is not None
+        )
+        if needs_watcher and not self._chunk_watcher:
+            self._chunk_watcher = self._loop.create_task(self._watch_chunks())
 
     async def _start_collecting_stacks(self, trace_name: str) -> None:
         if not self._is_tracing:
             self._is_tracing = True
-            self._connection.set_is_tracing(True)
+            self._connection.set_is_tracing(True, self, self._stack_sample_rate)
         self._stacks_id = await self._connection.local_utils.tracing_started(
             self._traces_dir, trace_name, self._is_live
         )
 
     async def stop_chunk(self, path: Union[pathlib.Path, str] = None) -> None:
-        await self._do_stop_chunk(path)
+        async with self._chunk_lock:
+            self._stop_watching_chunks()
+            await self._do_stop_chunk(path)
 
     async def stop(self, path: Union[pathlib.Path, str] = None) -> None:
-        await self._do_stop_chunk(path)
-        await self._channel.send(
-            "tracingStop",
+        async with self._chunk_lock:
+            self._stop_watching_chunks()
+            # In recorder mode nothing is kept unless keep_recent() was called.
+            discard = self._retain_chunks is not None and not path
+            await self._do_stop_chunk(path, discard)
+            await self._channel.send(
+                "tracingStop",
+                None,
+            )
+            await self._discard_retained(len(self._retained))
+        if self._keep_on_error:
+            self._connection._api_error_listeners.pop(
+                cast(ChannelOwner, self._parent), None
+            )
+            self._keep_on_error = False
+        self._sink = None
+        self._max_chunk_size = None
+        self._chunk_duration = None
+        self._retain_chunks = None
+
+    async def keep_recent(self) -> None:
+        if self._retain_chunks is None:
+            raise Error("keep_recent() requires tracing started with retainChunks")
+        async with self._chunk_lock:
+            if self._trace_name:
+                # Close the current chunk so that it is kept as well.
+                await self._do_stop_chunk()
+                await self._start_chunk(self._chunk_title, self._chunk_name)
+            retained = list(self._retained)
+            self._retained.clear()
+        for write, _ in retained:
+            self._export_chunk(write)
+
+    def _on_api_error(self, error: Exception) -> None:
+        if is_target_closed_error(error) or self._keep_task:
+            return
+
+        async def keep() -> None:
+            try:
+                await self.keep_recent()
+            except Exception as exc:
+                if not is_target_closed_error(exc):
+                    self._connection._on_event_listener_error(exc)
+            finally:
+                self._keep_task = None
+
+        self._keep_task = self._loop.create_task(keep())
+        self._exports.add(self._keep_task)
+        self._keep_task.add_done_callback(self._exports.discard)
+
+    async def _discard_retained(self, count: int) -> None:
+        for _ in range(count):
+            _, discard = self._retained.popleft()
+            try:
+                await discard()
+            except Exception as exc:
+                if not is_target_closed_error(exc):
+                    raise
+
+    def _stop_watching_chunks(self) -> None:
+        if self._chunk_watcher:
+            self._chunk_watcher.cancel()
+            self._chunk_watcher = None
+
+    async def _watch_chunks(self) -> None:
+        # Rolls the trace over into a new chunk whenever the live trace files
+        # grow past max_chunk_size or the chunk gets older than chunk_duration.
+        # Finished chunks are exported or retained in the background, so
+        # stopping the trace only has to deal with the tail.
+        interval = _CHUNK_CHECK_INTERVAL
+        if self._chunk_duration is not None:
+            interval = min(interval, self._chunk_duration / 1000)
+        while True:
+            await asyncio.sleep(interval)
+            trace_name = self._trace_name
+            if not trace_name or not await self._should_roll_over(trace_name):
+                continue
+            async with self._chunk_lock:
+                if trace_name != self._trace_name:
+                    continue
+                try:
+                    await self._do_stop_chunk()
+                    await self._start_chunk(self._chunk_title, self._chunk_name)
+                except Exception as exc:
+                    self._chunk_watcher = None
+                    if not is_target_closed_error(exc):
+                        self._connection._on_event_listener_error(exc)
+                    return
+
+    async def _should_roll_over(self, trace_name: str) -> bool:
+        if (
+            self._chunk_duration is not None
+            and (time.time() - self._chunk_started) * 1000 >= self._chunk_duration
+        ):
+            return True
+        if self._max_chunk_size is None:
+            return False
+        assert self._traces_dir
+        size = await self._loop.run_in_executor(
             None,
+            _live_trace_size,
+            self._traces_dir,
+            trace_name,
+            self._chunk_started,
         )
+        return size >= self._max_chunk_size
 
-    async def _do_stop_chunk(self, file_path: Union[pathlib.Path, str] = None) -> None:
+    async def _flush_exports(self) -> None:
+        while self._exports:
+            await asyncio.wait(self._exports)
+
+    async def _finish_background_work(self) -> None:
+        # Called before the context closes: pending exports still need the
+        # connection, chunks that were never kept are dropped.
+        self._stop_watching_chunks()
+        if self._keep_on_error:
+            self._connection._api_error_listeners.pop(
+                cast(ChannelOwner, self._parent), None
+            )
+            self._keep_on_error = False
+        await self._flush_exports()
+        await self._discard_retained(len(self._retained))
+
+    async def _do_stop_chunk(
+        self, file_path: Union[pathlib.Path, str] = None, discard: bool = False
+    ) -> None:
         self._reset_stack_counter()
+        self._trace_name = None
 
-        if not file_path:
+        if discard or (not file_path and not self._sink):
             # Not interested in any artifacts
             await self._channel.send("tracingStopChunk", None, {"mode": "discard"})
             if self._stacks_id:
                 await self._connection.local_utils.trace_discarded(self._stacks_id)
             return
 
+        # The next chunk gets its own stacks id, remember this one for the
+        # export that may run after the next chunk has started.
+        stacks_id = self._stacks_id
+        include_sources = self._include_sources
         is_local = not self._connection.is_remote
 
         if is_local:
             result = await self._channel.send_return_as_dict(
                 "tracingStopChunk", None, {"mode": "entries"}
             )
-            await self._connection.local_utils.zip(
-                {
-                    "zipFile": str(file_path),
-                    "entries": result["entries"],
-                    "stacksId": self._stacks_id,
-                    "mode": "write",
-                    "includeSources": self._include_sources,
-                }
-            )
+
+            async def write(file_path: Union[pathlib.Path, str]) -> None:
+                await self._connection.local_utils.zip(
+                    {
+                        "zipFile": str(file_path),
+                        "entries": result["entries"],
+                        "stacksId": stacks_id,
+                        "mode": "write",
+                        "includeSources": include_sources,
+                    }
+                )
+
+            async def discard_entries() -> None:
+                if stacks_id:
+                    await self._connection.local_utils.trace_discarded(stacks_id)
+
+            await self._write_chunk(write, discard_entries, file_path)
             return
 
         result = await self._channel.send_return_as_dict(
@@ -132,28 +360,79 @@ class Tracing(ChannelOwner):
 
         # The artifact may be missing if the browser closed while stopping tracing.
         if not artifact:
-            if self._stacks_id:
-                await self._connection.local_utils.trace_discarded(self._stacks_id)
+            if stacks_id:
+                await self._connection.local_utils.trace_discarded(stacks_id)
             return
 
-        # Save trace to the final local file.
-        await artifact.save_as(file_path)
-        await artifact.delete()
+        async def write_archive(file_path: Union[pathlib.Path, str]) -> None:
+            assert artifact
+            # Save trace to the final local file.
+            await artifact.save_as(file_path)
+            await artifact.delete()
 
-        await self._connection.local_utils.zip(
-            {
-                "zipFile": str(file_path),
-                "entries": [],
-                "stacksId": self._stacks_id,
-                "mode": "append",
-                "includeSources": self._include_sources,
-            }
-        )
+            await self._connection.local_utils.zip(
+                {
+                    "zipFile": str(file_path),
+                    "entries": [],
+                    "stacksId": stacks_id,
+                    "mode": "append",
+                    "includeSources": include_sources,
+                }
+            )
+
+        async def discard_archive() -> None:
+            assert artifact
+            await artifact.delete()
+            if stacks_id:
+                await self._connection.local_utils.trace_discarded(stacks_id)
+
+        await self._write_chunk(write_archive, discard_archive, file_path)
+
+    async def _write_chunk(
+        self,
+        write: Callable[[Union[pathlib.Path, str]], Awaitable[None]],
+        discard: Callable[[], Awaitable[None]],
+        file_path: Optional[Union[pathlib.Path, str]],
+    ) -> None:
+        if file_path:
+            await write(file_path)
+            return
+        if self._retain_chunks is not None:
+            self._retained.append((write, discard))
+            await self._discard_retained(len(self._retained) - self._retain_chunks)
+            return
+        self._export_chunk(write)
+
+    def _export_chunk(
+        self, write: Callable[[Union[pathlib.Path, str]], Awaitable[None]]
+    ) -> None:
+        sink = self._sink
+        assert sink
+        self._chunk_index += 1
+        name = f"{self._chunk_name or 'trace'}-{self._chunk_index}.zip"
+
+        async def export() -> None:
+            directory = await self._loop.run_in_executor(None, tempfile.mkdtemp)
+            try:
+                path = pathlib.Path(directory) / name
+                await write(path)
+                await sink.write(name, path)
+            except Exception as exc:
+                # Nobody awaits the export, report it like a failing listener.
+                self._connection._on_event_listener_error(exc)
+            finally:
+                await self._loop.run_in_executor(
+                    None, lambda: shutil.rmtree(directory, ignore_errors=True)
+                )
+
+        task = self._loop.create_task(export())
+        self._exports.add(task)
+        task.add_done_callback(self._exports.discard)
 
     def _reset_stack_counter(self) -> None:
         if self._is_tracing:
             self._is_tracing = False
-            self._connection.set_is_tracing(False)
+            self._connection.set_is_tracing(False, self)
 
     async def group(
         self, name: str, location: TracingGroupLocation = None
@@ -279,3 +558,19 @@ class Tracing(ChannelOwner):
         # Uncompressed har is not supported in thin clients
         await artifact.save_as(params["path"] + ".tmp")
         await artifact.delete()
+
+
+def _live_trace_size(traces_dir: str, trace_name: str, since: float) -> int:
+    # Only the event files written by the current chunk are counted, files of
+    # earlier chunks are left alone and resources are shared between chunks.
+    size = 0
+    pattern = os.path.join(glob.escape(traces_dir), glob.escape(trace_name))
+    for suffix in (".trace", ".network"):
+        for path in glob.glob(pattern + "*" + suffix):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_mtime > since:
+                size += stat.st_size
+    return size
@@ -19,10 +19,12 @@ import os
 import subprocess
 import sys
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Optional, Union
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
 
 from playwright._impl._driver import compute_driver_executable, get_driver_env
 from playwright._impl._helper import ParsedMessagePayload
+from playwright._impl._json_decoder import decode_large_message
 
 
 # Sourced from: https://github.com/pytest-dev/pytest/blob/da01ee0a4bb0af780167ecd228ab3ad249511302/src/_pytest/faulthandler.py#L69-L77
@@ -45,11 +47,32 @@ def _get_stderr_fileno() -> Optional[int]:
         return sys.__stderr__.fileno()
 
 
+# Frames at least this large are parsed on a worker thread with a decoder
+# that yields the GIL, so that decoding e.g. a huge evaluate() result does not
+# block the other pages on the connection.
+OFF_LOOP_PARSE_THRESHOLD = int(
+    os.environ.get("PLAYWRIGHT_OFF_LOOP_PARSE_THRESHOLD", 1024 * 1024)
+)
+
+
 class Transport(ABC):
     def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
         self._loop = loop
-        self.on_message: Callable[[ParsedMessagePayload], None] = lambda _: None
+        # Called with every received message and its wire size in bytes.
+        self.on_message: Callable[[ParsedMessagePayload, int], None] = (
+            lambda message, size: None
+        )
         self.on_error_future: asyncio.Future = loop.create_future()
+        # Wire size of the last serialized message, for metrics.
+        self.last_sent_bytes = 0
+        self._off_loop_parse_threshold = OFF_LOOP_PARSE_THRESHOLD
+        # Messages waiting for an earlier frame to be parsed off the loop, as
+        # (wire size, parsed message or parse future), in arrival order.
+        self._parsing: Deque[
+            Tuple[int, Union[ParsedMessagePayload, "asyncio.Future[Any]"]]
+        ] = deque()
+        # Wire size of the frames read but not dispatched yet.
+        self._pending_bytes = 0
 
     @abstractmethod
     def request_stop(self) -> None:
@@ -58,6 +81,9 @@ class Transport(ABC):
     def dispose(self) -> None:
         pass
 
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
     @abstractmethod
     async def wait_until_stopped(self) -> None:
         pass
@@ -78,24 +104,79 @@ class Transport(ABC):
         msg = json.dumps(message)
         if "DEBUGP" in os.environ:  # pragma: no cover
             print("\x1b[32mSEND>\x1b[0m", json.dumps(message, indent=2))
-        return msg.encode()
+        data = msg.encode()
+        self.last_sent_bytes = len(data)
+        return data
 
     def deserialize_message(self, data: Union[str, bytes]) -> ParsedMessagePayload:
         obj = json.loads(data)
+        self._log_received(obj)
+        return obj
 
+    def _log_received(self, message: ParsedMessagePayload) -> None:
         if "DEBUGP" in os.environ:  # pragma: no cover
-            print("\x1b[33mRECV>\x1b[0m", json.dumps(obj, indent=2))
-        return obj
+            print("\x1b[33mRECV>\x1b[0m", json.dumps(message, indent=2))
+
+    def _on_frame(self, data: bytes) -> None:
+        if len(data) >= self._off_loop_parse_threshold:
+            future = self._loop.run_in_executor(None, decode_large_message, data)
+            future.add_done_callback(lambda _: self._dispatch_parsed())
+            self._parsing.append((len(data), future))
+            self._pending_bytes += len(data)
+            return
+        message = self.deserialize_message(data)
+        if self._parsing:
+            # Keep dispatch order: wait for the earlier large frame.
+            self._parsing.append((len(data), message))
+            self._pending_bytes += len(data)
+            return
+        self.on_message(message, len(data))
+
+    def _dispatch_parsed(self) -> None:
+        # Runs as a done callback, so failures are reported through
+        # on_error_future like the read loop would instead of escaping to the
+        # event loop with the frames queued behind them never dispatched.
+        dispatch_error: Optional[Exception] = None
+        while self._parsing:
+            size, entry = self._parsing[0]
+            if isinstance(entry, asyncio.Future):
+                if not entry.done():
+                    break
+                try:
+                    message = entry.result()
+                except Exception as exc:
+                    self._parsing.clear()
+                    self._pending_bytes = 0
+                    dispatch_error = dispatch_error or exc
+                    break
+                self._log_received(message)
+            else:
+                message = entry
+            self._parsing.popleft()
+            self._pending_bytes -= size
+            try:
+                self.on_message(message, size)
+            except Exception as exc:
+                dispatch_error = dispatch_error or exc
+        if dispatch_error and not self.on_error_future.done():
+            self.on_error_future.set_exception(dispatch_error)
 
 
 class PipeTransport(Transport):
-    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        off_loop_parse_threshold: int = OFF_LOOP_PARSE_THRESHOLD,
+    ) -> None:
         super().__init__(loop)
         self._stopped = False
+        self._off_loop_parse_threshold = off_loop_parse_threshold
 
     def request_stop(self) -> None:
         assert self._output
         self._stopped = True
+        self._parsing.clear()
+        self._pending_bytes = 0
         self._output.close()
 
     async def wait_until_stopped(self) -> None:
@@ -144,22 +225,23 @@ class PipeTransport(Transport):
                     if self._stopped:
                         break
                     length = int.from_bytes(buffer, byteorder="little", signed=False)
-                    buffer = bytes(0)
-                    while length:
-                        to_read = min(length, 32768)
-                        data = await self._proc.stdout.readexactly(to_read)
-                        if self._stopped:
-                            break
-                        length -= to_read
-                        if len(buffer):
-                            buffer = buffer + data
-                        else:
-                            buffer = data
+                    if length <= 32768:
+                        buffer = await self._proc.stdout.readexactly(length)
+                    else:
+                        # Accumulate large frames in place, re-concatenating
+                        # bytes would be quadratic in the frame size.
+                        chunks = bytearray()
+                        while length:
+                            to_read = min(length, 32768)
+                            chunks += await self._proc.stdout.readexactly(to_read)
+                            if self._stopped:
+                                break
+                            length -= to_read
+                        buffer = bytes(chunks)
                     if self._stopped:
                         break
 
-                    obj = self.deserialize_message(buffer)
-                    self.on_message(obj)
+                    self._on_frame(buffer)
                 except asyncio.IncompleteReadError:
                     if not self._stopped:
                         self.on_error_future.set_exception(
@@ -15,25 +15,36 @@
 import asyncio
 import inspect
 import math
+import os
 import uuid
 from asyncio.tasks import Task
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from pyee import EventEmitter
-
 from playwright._impl._connection import ChannelOwner
 from playwright._impl._errors import Error, TimeoutError
+from playwright._impl._event_emitter import EventEmitter
+
+# Wait info is only consumed by tracing, allow skipping it when not tracing.
+_SKIP_WAIT_INFO_WITHOUT_TRACING = bool(
+    os.environ.get("PLAYWRIGHT_SKIP_WAIT_INFO_WITHOUT_TRACING")
+)
 
 
 class Waiter:
     def __init__(self, channel_owner: ChannelOwner, event: str) -> None:
         self._result: asyncio.Future = asyncio.Future()
-        self._wait_id = uuid.uuid4().hex
         self._loop = channel_owner._loop
         self._pending_tasks: List[Task] = []
+        self._timer_handles: List[asyncio.TimerHandle] = []
         self._channel = channel_owner._channel
         self._registered_listeners: List[Tuple[EventEmitter, str, Callable]] = []
         self._logs: List[str] = []
+        # Decided once so that "before" and "after" are always sent in pairs.
+        self._send_wait_info = (
+            not _SKIP_WAIT_INFO_WITHOUT_TRACING
+            or channel_owner._connection._tracing_count > 0
+        )
+        self._wait_id = uuid.uuid4().hex if self._send_wait_info else ""
         self._wait_for_event_info_before(self._wait_id, event)
 
     def _wait_for_event_info_before(self, wait_id: str, event: str) -> None:
@@ -59,6 +70,8 @@ class Waiter:
     def _send_wait_for_event_info(
         self, params: Dict[str, Any], is_internal: bool = False, title: str = None
     ) -> None:
+        if not self._send_wait_info:
+            return
         # Wait info is fire-and-forget telemetry and must not affect the waiter.
         try:
             self._channel.send_no_reply(
@@ -90,14 +103,16 @@ class Waiter:
     def reject_on_timeout(self, timeout: float, message: str) -> None:
         if timeout == 0:
             return
-
-        async def reject() -> None:
-            await asyncio.sleep(timeout / 1000)
-            self._reject(TimeoutError(message))
-
-        self._pending_tasks.append(self._loop.create_task(reject()))
+        # A timer handle is much cheaper than a task sleeping for the timeout.
+        self._timer_handles.append(
+            self._loop.call_later(
+                timeout / 1000, lambda: self._reject(TimeoutError(message))
+            )
+        )
 
     def _cleanup(self) -> None:
+        for handle in self._timer_handles:
+            handle.cancel()
         for task in self._pending_tasks:
             if not task.done():
                 task.cancel()
@@ -178,12 +193,17 @@ class Waiter:
         )
 
 
-def throw_on_timeout(timeout: float, exception: Exception) -> asyncio.Task:
-    async def throw() -> None:
-        await asyncio.sleep(timeout / 1000)
-        raise exception
+def throw_on_timeout(timeout: float, exception: Exception) -> asyncio.Future:
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def throw() -> None:
+        if not future.done():
+            future.set_exception(exception)
 
-    return asyncio.create_task(throw())
+    handle = loop.call_later(timeout / 1000, throw)
+    future.add_done_callback(lambda _: handle.cancel())
+    return future
 
 
 def format_log_recording(log: List[str]) -> str:
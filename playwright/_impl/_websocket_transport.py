@@ -0,0 +1,279 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import ssl
+import urllib.request
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from playwright._impl._errors import Error, TargetClosedError
+from playwright._impl._helper import ParsedMessagePayload
+from playwright._impl._transport import Transport
+from playwright._repo_version import version
+
+_ACCEPT_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_OPCODE_CONTINUATION = 0x0
+_OPCODE_TEXT = 0x1
+_OPCODE_BINARY = 0x2
+_OPCODE_CLOSE = 0x8
+_OPCODE_PING = 0x9
+_OPCODE_PONG = 0xA
+
+
+def _mask(data: bytes, key: bytes) -> bytes:
+    # XOR the whole payload as one big integer, which is much faster than a
+    # per-byte loop for the large messages the protocol carries.
+    length = len(data)
+    if not length:
+        return data
+    repeated = (key * (length // 4 + 1))[:length]
+    return (
+        int.from_bytes(data, "little") ^ int.from_bytes(repeated, "little")
+    ).to_bytes(length, "little")
+
+
+def _encode_frame(opcode: int, payload: bytes) -> bytes:
+    # Client frames are always final and masked (RFC 6455, section 5.3).
+    length = len(payload)
+    if length < 126:
+        header = bytes([0x80 | opcode, 0x80 | length])
+    elif length < 1 << 16:
+        header = bytes([0x80 | opcode, 0x80 | 126]) + length.to_bytes(2, "big")
+    else:
+        header = bytes([0x80 | opcode, 0x80 | 127]) + length.to_bytes(8, "big")
+    key = os.urandom(4)
+    return header + key + _mask(payload, key)
+
+
+async def _resolve_ws_endpoint(endpoint: str, headers: Dict[str, str]) -> str:
+    # Same as the driver: http(s) endpoints point at a server that reports
+    # its WebSocket endpoint under /json.
+    if endpoint.startswith("ws"):
+        return endpoint
+    parts = urlsplit(endpoint)
+    path = parts.path if parts.path.endswith("/") else parts.path + "/"
+    url = parts._replace(path=path + "json").geturl()
+
+    def fetch() -> str:
+        request = urllib.request.Request(
+            url, headers={"User-Agent": headers["User-Agent"]}
+        )
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())["wsEndpoint"]
+
+    return await asyncio.get_running_loop().run_in_executor(None, fetch)
+
+
+class WebSocketTransport(Transport):
+    # Speaks the Playwright protocol to a remote server directly, as JSON text
+    # frames over a WebSocket, instead of relaying every message through the
+    # local driver's jsonPipe.
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        endpoint: str,
+        headers: Dict[str, str],
+        slow_mo: float = 0,
+    ) -> None:
+        super().__init__(loop)
+        self.on_close: Callable[[Optional[str]], None] = lambda _: None
+        self._endpoint = endpoint
+        self._headers = {
+            "User-Agent": f"Playwright/{version} (python)",
+            "x-playwright-proxy": "",
+            **headers,
+        }
+        self._slow_mo = slow_mo / 1000
+        self._delayed: Deque[Tuple[float, ParsedMessagePayload, int]] = deque()
+        self._delay_handle: Optional[asyncio.TimerHandle] = None
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._stop_requested = False
+        self._stopped_future: asyncio.Future = loop.create_future()
+
+    async def open(self) -> None:
+        endpoint = await _resolve_ws_endpoint(self._endpoint, self._headers)
+        parts = urlsplit(endpoint)
+        secure = parts.scheme == "wss"
+        host = parts.hostname or "localhost"
+        port = parts.port or (443 if secure else 80)
+        self._reader, self._writer = await asyncio.open_connection(
+            host,
+            port,
+            ssl=ssl.create_default_context() if secure else None,
+            limit=2**20,
+        )
+        key = base64.b64encode(os.urandom(16))
+        request = [
+            f"GET {parts.path or '/'}{'?' + parts.query if parts.query else ''} HTTP/1.1",
+            f"Host: {parts.netloc}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {key.decode()}",
+            "Sec-WebSocket-Version: 13",
+            *(f"{name}: {value}" for name, value in self._headers.items()),
+        ]
+        self._writer.write(("\r\n".join(request) + "\r\n\r\n").encode())
+        status, response_headers = await self._read_handshake_response()
+        expected_accept = base64.b64encode(
+            hashlib.sha1(key + _ACCEPT_GUID).digest()
+        ).decode()
+        if (
+            status.split(" ")[1:2] == ["101"]
+            and response_headers.get("sec-websocket-accept") == expected_accept
+        ):
+            return
+        body = b""
+        if "content-length" in response_headers:
+            body = await self._reader.readexactly(
+                int(response_headers["content-length"])
+            )
+        self._writer.close()
+        message = f"WebSocket error: {endpoint} {status.split(' ', 1)[-1]}"
+        if body:
+            message += "\n" + body.decode(errors="replace")
+        raise Error(message)
+
+    async def _read_handshake_response(self) -> Tuple[str, Dict[str, str]]:
+        assert self._reader
+        lines = (
+            (await self._reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        )
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        return lines[0], headers
+
+    def request_stop(self) -> None:
+        if self._stop_requested:
+            return
+        self._stop_requested = True
+        self._parsing.clear()
+        # Messages delayed by slowMo are still delivered.
+        self._pending_bytes = sum(size for _, _, size in self._delayed)
+        self._write_frame(_OPCODE_CLOSE, (1000).to_bytes(2, "big"))
+
+    def dispose(self) -> None:
+        self.on_error_future.cancel()
+        if self._writer:
+            self._writer.close()
+        if self._delay_handle:
+            self._delay_handle.cancel()
+        if not self._stopped_future.done():
+            self._stopped_future.set_result(None)
+
+    async def wait_until_stopped(self) -> None:
+        await self._stopped_future
+
+    async def connect(self) -> None:
+        # The handshake happens in open(), so that it can be timed out and
+        # fail the connect() call before the connection starts.
+        assert self._reader
+
+    async def run(self) -> None:
+        reason: Optional[str] = None
+        try:
+            reason = await self._read_frames()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if self._writer:
+                self._writer.close()
+            if self._stop_requested:
+                reason = None
+            self.on_close(reason)
+            if reason and not self.on_error_future.done():
+                self.on_error_future.set_exception(TargetClosedError(reason))
+            if not self._stopped_future.done():
+                self._stopped_future.set_result(None)
+
+    async def _read_frames(self) -> Optional[str]:
+        # Returns the close reason sent by the server, if any.
+        reader = self._reader
+        assert reader
+        fragments: List[bytes] = []
+        while True:
+            head = await reader.readexactly(2)
+            opcode = head[0] & 0x0F
+            length = head[1] & 0x7F
+            if length == 126:
+                length = int.from_bytes(await reader.readexactly(2), "big")
+            elif length == 127:
+                length = int.from_bytes(await reader.readexactly(8), "big")
+            key = await reader.readexactly(4) if head[1] & 0x80 else None
+            payload = await reader.readexactly(length)
+            if key:
+                payload = _mask(payload, key)
+
+            if opcode == _OPCODE_CLOSE:
+                if not self._stop_requested:
+                    self._write_frame(_OPCODE_CLOSE, payload[:2])
+                return payload[2:].decode(errors="replace") or None
+            if opcode == _OPCODE_PING:
+                self._write_frame(_OPCODE_PONG, payload)
+                continue
+            if opcode == _OPCODE_PONG:
+                continue
+            if opcode in (_OPCODE_TEXT, _OPCODE_BINARY, _OPCODE_CONTINUATION):
+                fragments.append(payload)
+            if not head[0] & 0x80:
+                continue
+            data = fragments[0] if len(fragments) == 1 else b"".join(fragments)
+            fragments = []
+            if self._stop_requested:
+                continue
+            if self._slow_mo:
+                self._delay(self.deserialize_message(data), len(data))
+            else:
+                self._on_frame(data)
+
+    def _delay(self, message: ParsedMessagePayload, size: int) -> None:
+        # Like the driver, delay every incoming message by slowMo while
+        # keeping them in order.
+        self._delayed.append((self._loop.time() + self._slow_mo, message, size))
+        self._pending_bytes += size
+        if not self._delay_handle:
+            self._delay_handle = self._loop.call_at(
+                self._delayed[0][0], self._flush_delayed
+            )
+
+    def _flush_delayed(self) -> None:
+        self._delay_handle = None
+        now = self._loop.time()
+        while self._delayed and self._delayed[0][0] <= now:
+            _, message, size = self._delayed.popleft()
+            self._pending_bytes -= size
+            self.on_message(message, size)
+        if self._delayed:
+            self._delay_handle = self._loop.call_at(
+                self._delayed[0][0], self._flush_delayed
+            )
+
+    def _write_frame(self, opcode: int, payload: bytes) -> None:
+        if self._writer and not self._writer.is_closing():
+            self._writer.write(_encode_frame(opcode, payload))
+
+    def send(self, message: Dict) -> None:
+        if self._stop_requested:
+            raise Error("Playwright connection closed")
+        self._write_frame(_OPCODE_TEXT, self.serialize_message(message))
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
 import os
 from pathlib import Path
 from typing import Dict, Union
@@ -31,12 +30,17 @@ class WritableStream(ChannelOwner):
         super().__init__(parent, type, guid, initializer)
 
     async def copy(self, path: Union[str, Path]) -> None:
+        # Out of band payloads cost a file each, so send them in larger chunks.
+        binary_channel = self._connection._binary_channel
+        chunk_size = max(
+            COPY_BUFSIZE, binary_channel.threshold if binary_channel else 0
+        )
         with open(path, "rb") as f:
             while True:
-                data = f.read(COPY_BUFSIZE)
+                data = f.read(chunk_size)
                 if not data:
                     break
                 await self._channel.send(
-                    "write", None, {"binary": base64.b64encode(data).decode()}
+                    "write", None, {"binary": self._connection.encode_binary(data)}
                 )
         await self._channel.send("close", None)
@@ -18,15 +18,21 @@ Firefox and WebKit with a single API. Playwright is built to enable cross-browse
 web automation that is ever-green, capable, reliable and fast.
 """
 
-from typing import Any, Optional, Union, overload
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Optional, Union, overload
 
 import playwright._impl._api_structures
 import playwright._impl._errors
 import playwright._impl._form_data
+import playwright._impl._image
+import playwright._impl._memory_budget
+import playwright._impl._metrics
+import playwright._impl._trace_sink
 import playwright.async_api._generated
 from playwright._impl._assertions import (
     APIResponseAssertions as APIResponseAssertionsImpl,
 )
+from playwright._impl._assertions import ExpectBatch as ExpectBatchImpl
 from playwright._impl._assertions import LocatorAssertions as LocatorAssertionsImpl
 from playwright._impl._assertions import PageAssertions as PageAssertionsImpl
 from playwright.async_api._context_manager import PlaywrightContextManager
@@ -38,6 +44,7 @@ from playwright.async_api._generated import (
     Browser,
     BrowserContext,
     BrowserType,
+    CDPEventStream,
     CDPSession,
     ConsoleMessage,
     Dialog,
@@ -71,6 +78,17 @@ ChromiumBrowserContext = BrowserContext
 Cookie = playwright._impl._api_structures.Cookie
 FilePayload = playwright._impl._api_structures.FilePayload
 FormData = playwright._impl._form_data.FormData
+ApiCallMetric = playwright._impl._metrics.ApiCallMetric
+RawImage = playwright._impl._image.RawImage
+InMemoryMetricsCollector = playwright._impl._metrics.InMemoryMetricsCollector
+MemoryBudget = playwright._impl._memory_budget.MemoryBudget
+MetricsCollector = playwright._impl._metrics.MetricsCollector
+OpenTelemetryMetricsCollector = playwright._impl._metrics.OpenTelemetryMetricsCollector
+StallMonitor = playwright._impl._metrics.StallMonitor
+StallWarning = playwright._impl._metrics.StallWarning
+TraceSink = playwright._impl._trace_sink.TraceSink
+DirectoryTraceSink = playwright._impl._trace_sink.DirectoryTraceSink
+CallbackTraceSink = playwright._impl._trace_sink.CallbackTraceSink
 FloatRect = playwright._impl._api_structures.FloatRect
 Geolocation = playwright._impl._api_structures.Geolocation
 HttpCredentials = playwright._impl._api_structures.HttpCredentials
@@ -83,6 +101,7 @@ ProxySettings = playwright._impl._api_structures.ProxySettings
 ResourceTiming = playwright._impl._api_structures.ResourceTiming
 ScreencastFrame = playwright._impl._api_structures.ScreencastFrame
 ScreencastSize = playwright._impl._api_structures.ScreencastSize
+ScreencastStats = playwright._impl._api_structures.ScreencastStats
 SourceLocation = playwright._impl._api_structures.SourceLocation
 StorageState = playwright._impl._api_structures.StorageState
 StorageStateCookie = playwright._impl._api_structures.StorageStateCookie
@@ -164,6 +183,23 @@ class Expect:
         """
         return self._dispatch(actual, message, is_soft=True)
 
+    @asynccontextmanager
+    async def all(self) -> AsyncIterator[None]:
+        """
+        Groups web-first assertions so that they are polled concurrently.
+        Assertions made inside the block are collected and sent together when
+        the block exits, so the group costs a single polling window instead
+        of one per assertion. All failures are reported in one error.
+        """
+        __tracebackhide__ = True
+        batch = ExpectBatchImpl()
+        batch._start()
+        try:
+            yield
+        finally:
+            batch._stop()
+        await batch.run()
+
     def _dispatch(
         self,
         actual: Union[Page, Locator, APIResponse],
@@ -209,14 +245,18 @@ __all__ = [
     "APIRequest",
     "APIRequestContext",
     "APIResponse",
+    "ApiCallMetric",
     "Browser",
     "BrowserBindResult",
     "BrowserContext",
     "BrowserType",
+    "CallbackTraceSink",
+    "CDPEventStream",
     "CDPSession",
     "ChromiumBrowserContext",
     "ConsoleMessage",
     "Cookie",
+    "DirectoryTraceSink",
     "Dialog",
     "Download",
     "ElementHandle",
@@ -229,10 +269,14 @@ __all__ = [
     "FrameLocator",
     "Geolocation",
     "HttpCredentials",
+    "InMemoryMetricsCollector",
     "JSHandle",
     "Keyboard",
     "Locator",
+    "MemoryBudget",
+    "MetricsCollector",
     "Mouse",
+    "OpenTelemetryMetricsCollector",
     "DebuggerLocation",
     "DebuggerPausedDetails",
     "Page",
@@ -240,18 +284,23 @@ __all__ = [
     "Position",
     "Playwright",
     "ProxySettings",
+    "RawImage",
     "Request",
     "ResourceTiming",
     "Response",
     "Route",
     "ScreencastFrame",
     "ScreencastSize",
+    "ScreencastStats",
     "Selectors",
     "SourceLocation",
+    "StallMonitor",
+    "StallWarning",
     "StorageState",
     "StorageStateCookie",
     "TimeoutError",
     "Touchscreen",
+    "TraceSink",
     "Video",
     "ViewportSize",
     "VirtualCredential",
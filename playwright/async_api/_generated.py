@@ -38,6 +38,7 @@ from playwright._impl._api_structures import (
     ResourceTiming,
     ScreencastFrame,
     ScreencastSize,
+    ScreencastStats,
     SecurityDetails,
     SetCookieParam,
     SourceLocation,
@@ -56,11 +57,13 @@ from playwright._impl._async_base import (
     AsyncBase,
     AsyncContextManager,
     AsyncEventContextManager,
+    AsyncEventStream,
     mapping,
 )
 from playwright._impl._browser import Browser as BrowserImpl
 from playwright._impl._browser_context import BrowserContext as BrowserContextImpl
 from playwright._impl._browser_type import BrowserType as BrowserTypeImpl
+from playwright._impl._cdp_session import CDPEventStream as CDPEventStreamImpl
 from playwright._impl._cdp_session import CDPSession as CDPSessionImpl
 from playwright._impl._clock import Clock as ClockImpl
 from playwright._impl._console_message import ConsoleMessage as ConsoleMessageImpl
@@ -78,12 +81,15 @@ from playwright._impl._file_chooser import FileChooser as FileChooserImpl
 from playwright._impl._form_data import FormData
 from playwright._impl._frame import Frame as FrameImpl
 from playwright._impl._helper import to_milliseconds
+from playwright._impl._image import RawImage
 from playwright._impl._input import Keyboard as KeyboardImpl
 from playwright._impl._input import Mouse as MouseImpl
 from playwright._impl._input import Touchscreen as TouchscreenImpl
 from playwright._impl._js_handle import JSHandle as JSHandleImpl
 from playwright._impl._locator import FrameLocator as FrameLocatorImpl
 from playwright._impl._locator import Locator as LocatorImpl
+from playwright._impl._memory_budget import MemoryBudget
+from playwright._impl._metrics import MetricsCollector, StallMonitor
 from playwright._impl._network import Request as RequestImpl
 from playwright._impl._network import Response as ResponseImpl
 from playwright._impl._network import Route as RouteImpl
@@ -94,6 +100,7 @@ from playwright._impl._page import Worker as WorkerImpl
 from playwright._impl._playwright import Playwright as PlaywrightImpl
 from playwright._impl._screencast import Screencast as ScreencastImpl
 from playwright._impl._selectors import Selectors as SelectorsImpl
+from playwright._impl._trace_sink import TraceSink
 from playwright._impl._tracing import Tracing as TracingImpl
 from playwright._impl._video import Video as VideoImpl
 from playwright._impl._web_error import WebError as WebErrorImpl
@@ -3130,6 +3137,32 @@ class ElementHandle(JSHandle):
             )
         )
 
+    async def screenshot_raw(
+        self,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        style: typing.Optional[str] = None,
+    ) -> "RawImage":
+
+        return mapping.from_impl(
+            await self._impl_obj.screenshot_raw(
+                timeout=to_milliseconds(timeout),
+                omitBackground=omit_background,
+                animations=animations,
+                caret=caret,
+                scale=scale,
+                mask=mapping.to_impl(mask),
+                maskColor=mask_color,
+                style=style,
+            )
+        )
+
     async def query_selector(self, selector: str) -> typing.Optional["ElementHandle"]:
         """ElementHandle.query_selector
 
@@ -7914,6 +7947,10 @@ class Screencast(AsyncBase):
         path: typing.Optional[typing.Union[pathlib.Path, str]] = None,
         quality: typing.Optional[int] = None,
         size: typing.Optional[ScreencastSize] = None,
+        queue_size: typing.Optional[int] = None,
+        overflow: typing.Optional[
+            Literal["backpressure", "drop-oldest", "keep-latest"]
+        ] = None,
     ) -> "AsyncContextManager":
         """Screencast.start
 
@@ -7947,6 +7984,8 @@ class Screencast(AsyncBase):
                 path=path,
                 quality=quality,
                 size=size,
+                queueSize=queue_size,
+                overflow=overflow,
             )
         )
 
@@ -7959,6 +7998,10 @@ class Screencast(AsyncBase):
 
         return mapping.from_maybe_impl(await self._impl_obj.stop())
 
+    def frame_stats(self) -> ScreencastStats:
+
+        return mapping.from_impl(self._impl_obj.frame_stats())
+
     async def show_actions(
         self,
         *,
@@ -9445,6 +9488,14 @@ class Page(AsyncContextManager):
             )
         )
 
+    async def call(
+        self, fn: str, arg: typing.Optional[typing.Any] = None
+    ) -> typing.Any:
+
+        return mapping.from_maybe_impl(
+            await self._impl_obj.call(fn=fn, arg=mapping.to_impl(arg))
+        )
+
     async def eval_on_selector(
         self,
         selector: str,
@@ -10856,6 +10907,36 @@ class Page(AsyncContextManager):
             )
         )
 
+    async def screenshot_raw(
+        self,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        omit_background: typing.Optional[bool] = None,
+        full_page: typing.Optional[bool] = None,
+        clip: typing.Optional[FloatRect] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        style: typing.Optional[str] = None,
+    ) -> "RawImage":
+
+        return mapping.from_impl(
+            await self._impl_obj.screenshot_raw(
+                timeout=to_milliseconds(timeout),
+                omitBackground=omit_background,
+                fullPage=full_page,
+                clip=clip,
+                animations=animations,
+                caret=caret,
+                scale=scale,
+                mask=mapping.to_impl(mask),
+                maskColor=mask_color,
+                style=style,
+            )
+        )
+
     async def title(self) -> str:
         """Page.title
 
@@ -14781,6 +14862,16 @@ class BrowserContext(AsyncContextManager):
             await self._impl_obj.add_init_script(script=script, path=path)
         )
 
+    async def register_function(self, source: str) -> str:
+
+        return mapping.from_maybe_impl(
+            await self._impl_obj.register_function(source=source)
+        )
+
+    async def unregister_function(self, fn: str) -> None:
+
+        return mapping.from_maybe_impl(await self._impl_obj.unregister_function(fn=fn))
+
     async def expose_binding(
         self, name: str, callback: typing.Callable
     ) -> "AsyncContextManager":
@@ -15816,6 +15907,37 @@ class CDPSession(AsyncBase):
             await self._impl_obj.send(method=method, params=mapping.to_impl(params))
         )
 
+    async def send_many(
+        self,
+        commands: typing.Sequence[typing.Tuple[str, typing.Optional[typing.Dict]]],
+        *,
+        concurrency: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+
+        return mapping.from_maybe_impl(
+            await self._impl_obj.send_many(
+                commands=mapping.to_impl(commands), concurrency=concurrency
+            )
+        )
+
+    def stream(
+        self,
+        *,
+        methods: typing.Optional[typing.Sequence[str]] = None,
+        max_batch: typing.Optional[int] = None,
+        max_queue: typing.Optional[int] = None,
+        translate_guids: typing.Optional[bool] = None,
+    ) -> "CDPEventStream":
+
+        return mapping.from_impl(
+            self._impl_obj.stream(
+                methods=mapping.to_impl(methods),
+                maxBatch=max_batch,
+                maxQueue=max_queue,
+                translateGuids=translate_guids,
+            )
+        )
+
     async def detach(self) -> None:
         """CDPSession.detach
 
@@ -15829,6 +15951,20 @@ class CDPSession(AsyncBase):
 mapping.register(CDPSessionImpl, CDPSession)
 
 
+class CDPEventStream(AsyncEventStream):
+
+    @property
+    def dropped(self) -> int:
+        return mapping.from_maybe_impl(self._impl_obj.dropped)
+
+    async def close(self) -> None:
+
+        return mapping.from_maybe_impl(await self._impl_obj.close())
+
+
+mapping.register(CDPEventStreamImpl, CDPEventStream)
+
+
 class Browser(AsyncContextManager):
 
     @typing.overload
@@ -17167,6 +17303,7 @@ class BrowserType(AsyncBase):
         slow_mo: typing.Optional[float] = None,
         headers: typing.Optional[typing.Dict[str, str]] = None,
         expose_network: typing.Optional[str] = None,
+        transport: typing.Optional[Literal["driver", "websocket"]] = None,
     ) -> "Browser":
         """BrowserType.connect
 
@@ -17213,6 +17350,7 @@ class BrowserType(AsyncBase):
                 slowMo=slow_mo,
                 headers=mapping.to_impl(headers),
                 exposeNetwork=expose_network,
+                transport=transport,
             )
         )
 
@@ -17342,6 +17480,32 @@ class Playwright(AsyncBase):
 
         return mapping.from_maybe_impl(await self._impl_obj.stop())
 
+    def set_metrics_collector(
+        self, collector: typing.Optional["MetricsCollector"] = None
+    ) -> None:
+
+        return mapping.from_maybe_impl(
+            self._impl_obj.set_metrics_collector(collector=collector)
+        )
+
+    def set_stall_monitor(
+        self, monitor: typing.Optional["StallMonitor"] = None
+    ) -> None:
+
+        return mapping.from_maybe_impl(
+            self._impl_obj.set_stall_monitor(monitor=monitor)
+        )
+
+    def set_memory_budget(self, budget: typing.Optional["MemoryBudget"] = None) -> None:
+
+        return mapping.from_maybe_impl(self._impl_obj.set_memory_budget(budget=budget))
+
+    def set_console_message_retention(self, limit: typing.Optional[int] = None) -> None:
+
+        return mapping.from_maybe_impl(
+            self._impl_obj.set_console_message_retention(limit=limit)
+        )
+
 
 mapping.register(PlaywrightImpl, Playwright)
 
@@ -17357,6 +17521,12 @@ class Tracing(AsyncBase):
         screenshots: typing.Optional[bool] = None,
         sources: typing.Optional[bool] = None,
         live: typing.Optional[bool] = None,
+        sink: typing.Optional["TraceSink"] = None,
+        max_chunk_size: typing.Optional[int] = None,
+        chunk_duration: typing.Optional[float] = None,
+        retain_chunks: typing.Optional[int] = None,
+        keep_on_error: typing.Optional[bool] = None,
+        stack_sample_rate: typing.Optional[float] = None,
     ) -> None:
         """Tracing.start
 
@@ -17410,6 +17580,12 @@ class Tracing(AsyncBase):
                 screenshots=screenshots,
                 sources=sources,
                 live=live,
+                sink=sink,
+                maxChunkSize=max_chunk_size,
+                chunkDuration=chunk_duration,
+                retainChunks=retain_chunks,
+                keepOnError=keep_on_error,
+                stackSampleRate=stack_sample_rate,
             )
         )
 
@@ -17484,6 +17660,10 @@ class Tracing(AsyncBase):
 
         return mapping.from_maybe_impl(await self._impl_obj.stop(path=path))
 
+    async def keep_recent(self) -> None:
+
+        return mapping.from_maybe_impl(await self._impl_obj.keep_recent())
+
     async def group(
         self, name: str, *, location: typing.Optional[TracingGroupLocation] = None
     ) -> "AsyncContextManager":
@@ -19853,6 +20033,32 @@ class Locator(AsyncBase):
             )
         )
 
+    async def screenshot_raw(
+        self,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        style: typing.Optional[str] = None,
+    ) -> "RawImage":
+
+        return mapping.from_impl(
+            await self._impl_obj.screenshot_raw(
+                timeout=to_milliseconds(timeout),
+                omitBackground=omit_background,
+                animations=animations,
+                caret=caret,
+                scale=scale,
+                mask=mapping.to_impl(mask),
+                maskColor=mask_color,
+                style=style,
+            )
+        )
+
     async def aria_snapshot(
         self,
         *,
@@ -20466,6 +20672,27 @@ class Locator(AsyncBase):
 
         return mapping.from_maybe_impl(await self._impl_obj.all_text_contents())
 
+    async def extract(
+        self,
+        fields: typing.Dict[str, str],
+        *,
+        layout: typing.Optional[Literal["columns", "rows"]] = None,
+        offset: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Union[
+        typing.Dict[str, typing.List[typing.Any]],
+        typing.List[typing.Dict[str, typing.Any]],
+    ]:
+
+        return mapping.from_maybe_impl(
+            await self._impl_obj.extract(
+                fields=mapping.to_impl(fields),
+                layout=layout,
+                offset=offset,
+                limit=limit,
+            )
+        )
+
     async def wait_for(
         self,
         *,
@@ -21849,6 +22076,47 @@ class PageAssertions(AsyncBase):
             )
         )
 
+    async def to_match_screenshot(
+        self,
+        name: str,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        threshold: typing.Optional[float] = None,
+        max_diff_pixels: typing.Optional[int] = None,
+        max_diff_pixel_ratio: typing.Optional[float] = None,
+        snapshot_dir: typing.Optional[typing.Union[pathlib.Path, str]] = None,
+        full_page: typing.Optional[bool] = None,
+        clip: typing.Optional[FloatRect] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        style: typing.Optional[str] = None,
+    ) -> None:
+        __tracebackhide__ = True
+
+        return mapping.from_maybe_impl(
+            await self._impl_obj.to_match_screenshot(
+                name=name,
+                timeout=to_milliseconds(timeout),
+                threshold=threshold,
+                maxDiffPixels=max_diff_pixels,
+                maxDiffPixelRatio=max_diff_pixel_ratio,
+                snapshotDir=snapshot_dir,
+                fullPage=full_page,
+                clip=clip,
+                mask=mapping.to_impl(mask),
+                maskColor=mask_color,
+                omitBackground=omit_background,
+                animations=animations,
+                caret=caret,
+                scale=scale,
+                style=style,
+            )
+        )
+
 
 mapping.register(PageAssertionsImpl, PageAssertions)
 
@@ -23819,6 +24087,43 @@ class LocatorAssertions(AsyncBase):
             )
         )
 
+    async def to_match_screenshot(
+        self,
+        name: str,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        threshold: typing.Optional[float] = None,
+        max_diff_pixels: typing.Optional[int] = None,
+        max_diff_pixel_ratio: typing.Optional[float] = None,
+        snapshot_dir: typing.Optional[typing.Union[pathlib.Path, str]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        style: typing.Optional[str] = None,
+    ) -> None:
+        __tracebackhide__ = True
+
+        return mapping.from_maybe_impl(
+            await self._impl_obj.to_match_screenshot(
+                name=name,
+                timeout=to_milliseconds(timeout),
+                threshold=threshold,
+                maxDiffPixels=max_diff_pixels,
+                maxDiffPixelRatio=max_diff_pixel_ratio,
+                snapshotDir=snapshot_dir,
+                mask=mapping.to_impl(mask),
+                maskColor=mask_color,
+                omitBackground=omit_background,
+                animations=animations,
+                caret=caret,
+                scale=scale,
+                style=style,
+            )
+        )
+
 
 mapping.register(LocatorAssertionsImpl, LocatorAssertions)
 
@@ -38,6 +38,7 @@ from playwright._impl._api_structures import (
     ResourceTiming,
     ScreencastFrame,
     ScreencastSize,
+    ScreencastStats,
     SecurityDetails,
     SetCookieParam,
     SourceLocation,
@@ -55,6 +56,7 @@ from playwright._impl._assertions import PageAssertions as PageAssertionsImpl
 from playwright._impl._browser import Browser as BrowserImpl
 from playwright._impl._browser_context import BrowserContext as BrowserContextImpl
 from playwright._impl._browser_type import BrowserType as BrowserTypeImpl
+from playwright._impl._cdp_session import CDPEventStream as CDPEventStreamImpl
 from playwright._impl._cdp_session import CDPSession as CDPSessionImpl
 from playwright._impl._clock import Clock as ClockImpl
 from playwright._impl._console_message import ConsoleMessage as ConsoleMessageImpl
@@ -72,12 +74,15 @@ from playwright._impl._file_chooser import FileChooser as FileChooserImpl
 from playwright._impl._form_data import FormData
 from playwright._impl._frame import Frame as FrameImpl
 from playwright._impl._helper import to_milliseconds
+from playwright._impl._image import RawImage
 from playwright._impl._input import Keyboard as KeyboardImpl
 from playwright._impl._input import Mouse as MouseImpl
 from playwright._impl._input import Touchscreen as TouchscreenImpl
 from playwright._impl._js_handle import JSHandle as JSHandleImpl
 from playwright._impl._locator import FrameLocator as FrameLocatorImpl
 from playwright._impl._locator import Locator as LocatorImpl
+from playwright._impl._memory_budget import MemoryBudget
+from playwright._impl._metrics import MetricsCollector, StallMonitor
 from playwright._impl._network import Request as RequestImpl
 from playwright._impl._network import Response as ResponseImpl
 from playwright._impl._network import Route as RouteImpl
@@ -92,8 +97,10 @@ from playwright._impl._sync_base import (
     EventContextManager,
     SyncBase,
     SyncContextManager,
+    SyncEventStream,
     mapping,
 )
+from playwright._impl._trace_sink import TraceSink
 from playwright._impl._tracing import Tracing as TracingImpl
 from playwright._impl._video import Video as VideoImpl
 from playwright._impl._web_error import WebError as WebErrorImpl
@@ -3166,6 +3173,34 @@ class ElementHandle(JSHandle):
             )
         )
 
+    def screenshot_raw(
+        self,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        style: typing.Optional[str] = None,
+    ) -> "RawImage":
+
+        return mapping.from_impl(
+            self._sync(
+                self._impl_obj.screenshot_raw(
+                    timeout=to_milliseconds(timeout),
+                    omitBackground=omit_background,
+                    animations=animations,
+                    caret=caret,
+                    scale=scale,
+                    mask=mapping.to_impl(mask),
+                    maskColor=mask_color,
+                    style=style,
+                )
+            )
+        )
+
     def query_selector(self, selector: str) -> typing.Optional["ElementHandle"]:
         """ElementHandle.query_selector
 
@@ -7992,6 +8027,10 @@ class Screencast(SyncBase):
         path: typing.Optional[typing.Union[pathlib.Path, str]] = None,
         quality: typing.Optional[int] = None,
         size: typing.Optional[ScreencastSize] = None,
+        queue_size: typing.Optional[int] = None,
+        overflow: typing.Optional[
+            Literal["backpressure", "drop-oldest", "keep-latest"]
+        ] = None,
     ) -> "SyncContextManager":
         """Screencast.start
 
@@ -8026,6 +8065,8 @@ class Screencast(SyncBase):
                     path=path,
                     quality=quality,
                     size=size,
+                    queueSize=queue_size,
+                    overflow=overflow,
                 )
             )
         )
@@ -8039,6 +8080,10 @@ class Screencast(SyncBase):
 
         return mapping.from_maybe_impl(self._sync(self._impl_obj.stop()))
 
+    def frame_stats(self) -> ScreencastStats:
+
+        return mapping.from_impl(self._impl_obj.frame_stats())
+
     def show_actions(
         self,
         *,
@@ -9443,6 +9488,12 @@ class Page(SyncContextManager):
             )
         )
 
+    def call(self, fn: str, arg: typing.Optional[typing.Any] = None) -> typing.Any:
+
+        return mapping.from_maybe_impl(
+            self._sync(self._impl_obj.call(fn=fn, arg=mapping.to_impl(arg)))
+        )
+
     def eval_on_selector(
         self,
         selector: str,
@@ -10888,6 +10939,38 @@ class Page(SyncContextManager):
             )
         )
 
+    def screenshot_raw(
+        self,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        omit_background: typing.Optional[bool] = None,
+        full_page: typing.Optional[bool] = None,
+        clip: typing.Optional[FloatRect] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        style: typing.Optional[str] = None,
+    ) -> "RawImage":
+
+        return mapping.from_impl(
+            self._sync(
+                self._impl_obj.screenshot_raw(
+                    timeout=to_milliseconds(timeout),
+                    omitBackground=omit_background,
+                    fullPage=full_page,
+                    clip=clip,
+                    animations=animations,
+                    caret=caret,
+                    scale=scale,
+                    mask=mapping.to_impl(mask),
+                    maskColor=mask_color,
+                    style=style,
+                )
+            )
+        )
+
     def title(self) -> str:
         """Page.title
 
@@ -14777,6 +14860,18 @@ class BrowserContext(SyncContextManager):
             self._sync(self._impl_obj.add_init_script(script=script, path=path))
         )
 
+    def register_function(self, source: str) -> str:
+
+        return mapping.from_maybe_impl(
+            self._sync(self._impl_obj.register_function(source=source))
+        )
+
+    def unregister_function(self, fn: str) -> None:
+
+        return mapping.from_maybe_impl(
+            self._sync(self._impl_obj.unregister_function(fn=fn))
+        )
+
     def expose_binding(
         self, name: str, callback: typing.Callable
     ) -> "SyncContextManager":
@@ -15799,6 +15894,39 @@ class CDPSession(SyncBase):
             )
         )
 
+    def send_many(
+        self,
+        commands: typing.Sequence[typing.Tuple[str, typing.Optional[typing.Dict]]],
+        *,
+        concurrency: typing.Optional[int] = None,
+    ) -> typing.List[typing.Any]:
+
+        return mapping.from_maybe_impl(
+            self._sync(
+                self._impl_obj.send_many(
+                    commands=mapping.to_impl(commands), concurrency=concurrency
+                )
+            )
+        )
+
+    def stream(
+        self,
+        *,
+        methods: typing.Optional[typing.Sequence[str]] = None,
+        max_batch: typing.Optional[int] = None,
+        max_queue: typing.Optional[int] = None,
+        translate_guids: typing.Optional[bool] = None,
+    ) -> "CDPEventStream":
+
+        return mapping.from_impl(
+            self._impl_obj.stream(
+                methods=mapping.to_impl(methods),
+                maxBatch=max_batch,
+                maxQueue=max_queue,
+                translateGuids=translate_guids,
+            )
+        )
+
     def detach(self) -> None:
         """CDPSession.detach
 
@@ -15812,6 +15940,20 @@ class CDPSession(SyncBase):
 mapping.register(CDPSessionImpl, CDPSession)
 
 
+class CDPEventStream(SyncEventStream):
+
+    @property
+    def dropped(self) -> int:
+        return mapping.from_maybe_impl(self._impl_obj.dropped)
+
+    def close(self) -> None:
+
+        return mapping.from_maybe_impl(self._sync(self._impl_obj.close()))
+
+
+mapping.register(CDPEventStreamImpl, CDPEventStream)
+
+
 class Browser(SyncContextManager):
 
     @typing.overload
@@ -17144,6 +17286,7 @@ class BrowserType(SyncBase):
         slow_mo: typing.Optional[float] = None,
         headers: typing.Optional[typing.Dict[str, str]] = None,
         expose_network: typing.Optional[str] = None,
+        transport: typing.Optional[Literal["driver", "websocket"]] = None,
     ) -> "Browser":
         """BrowserType.connect
 
@@ -17191,6 +17334,7 @@ class BrowserType(SyncBase):
                     slowMo=slow_mo,
                     headers=mapping.to_impl(headers),
                     exposeNetwork=expose_network,
+                    transport=transport,
                 )
             )
         )
@@ -17318,6 +17462,32 @@ class Playwright(SyncBase):
 
         return mapping.from_maybe_impl(self._sync(self._impl_obj.stop()))
 
+    def set_metrics_collector(
+        self, collector: typing.Optional["MetricsCollector"] = None
+    ) -> None:
+
+        return mapping.from_maybe_impl(
+            self._impl_obj.set_metrics_collector(collector=collector)
+        )
+
+    def set_stall_monitor(
+        self, monitor: typing.Optional["StallMonitor"] = None
+    ) -> None:
+
+        return mapping.from_maybe_impl(
+            self._impl_obj.set_stall_monitor(monitor=monitor)
+        )
+
+    def set_memory_budget(self, budget: typing.Optional["MemoryBudget"] = None) -> None:
+
+        return mapping.from_maybe_impl(self._impl_obj.set_memory_budget(budget=budget))
+
+    def set_console_message_retention(self, limit: typing.Optional[int] = None) -> None:
+
+        return mapping.from_maybe_impl(
+            self._impl_obj.set_console_message_retention(limit=limit)
+        )
+
 
 mapping.register(PlaywrightImpl, Playwright)
 
@@ -17333,6 +17503,12 @@ class Tracing(SyncBase):
         screenshots: typing.Optional[bool] = None,
         sources: typing.Optional[bool] = None,
         live: typing.Optional[bool] = None,
+        sink: typing.Optional["TraceSink"] = None,
+        max_chunk_size: typing.Optional[int] = None,
+        chunk_duration: typing.Optional[float] = None,
+        retain_chunks: typing.Optional[int] = None,
+        keep_on_error: typing.Optional[bool] = None,
+        stack_sample_rate: typing.Optional[float] = None,
     ) -> None:
         """Tracing.start
 
@@ -17387,6 +17563,12 @@ class Tracing(SyncBase):
                     screenshots=screenshots,
                     sources=sources,
                     live=live,
+                    sink=sink,
+                    maxChunkSize=max_chunk_size,
+                    chunkDuration=chunk_duration,
+                    retainChunks=retain_chunks,
+                    keepOnError=keep_on_error,
+                    stackSampleRate=stack_sample_rate,
                 )
             )
         )
@@ -17462,6 +17644,10 @@ class Tracing(SyncBase):
 
         return mapping.from_maybe_impl(self._sync(self._impl_obj.stop(path=path)))
 
+    def keep_recent(self) -> None:
+
+        return mapping.from_maybe_impl(self._sync(self._impl_obj.keep_recent()))
+
     def group(
         self, name: str, *, location: typing.Optional[TracingGroupLocation] = None
     ) -> "SyncContextManager":
@@ -19864,6 +20050,34 @@ class Locator(SyncBase):
             )
         )
 
+    def screenshot_raw(
+        self,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        style: typing.Optional[str] = None,
+    ) -> "RawImage":
+
+        return mapping.from_impl(
+            self._sync(
+                self._impl_obj.screenshot_raw(
+                    timeout=to_milliseconds(timeout),
+                    omitBackground=omit_background,
+                    animations=animations,
+                    caret=caret,
+                    scale=scale,
+                    mask=mapping.to_impl(mask),
+                    maskColor=mask_color,
+                    style=style,
+                )
+            )
+        )
+
     def aria_snapshot(
         self,
         *,
@@ -20498,6 +20712,29 @@ class Locator(SyncBase):
 
         return mapping.from_maybe_impl(self._sync(self._impl_obj.all_text_contents()))
 
+    def extract(
+        self,
+        fields: typing.Dict[str, str],
+        *,
+        layout: typing.Optional[Literal["columns", "rows"]] = None,
+        offset: typing.Optional[int] = None,
+        limit: typing.Optional[int] = None,
+    ) -> typing.Union[
+        typing.Dict[str, typing.List[typing.Any]],
+        typing.List[typing.Dict[str, typing.Any]],
+    ]:
+
+        return mapping.from_maybe_impl(
+            self._sync(
+                self._impl_obj.extract(
+                    fields=mapping.to_impl(fields),
+                    layout=layout,
+                    offset=offset,
+                    limit=limit,
+                )
+            )
+        )
+
     def wait_for(
         self,
         *,
@@ -21923,6 +22160,49 @@ class PageAssertions(SyncBase):
             )
         )
 
+    def to_match_screenshot(
+        self,
+        name: str,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        threshold: typing.Optional[float] = None,
+        max_diff_pixels: typing.Optional[int] = None,
+        max_diff_pixel_ratio: typing.Optional[float] = None,
+        snapshot_dir: typing.Optional[typing.Union[pathlib.Path, str]] = None,
+        full_page: typing.Optional[bool] = None,
+        clip: typing.Optional[FloatRect] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        style: typing.Optional[str] = None,
+    ) -> None:
+        __tracebackhide__ = True
+
+        return mapping.from_maybe_impl(
+            self._sync(
+                self._impl_obj.to_match_screenshot(
+                    name=name,
+                    timeout=to_milliseconds(timeout),
+                    threshold=threshold,
+                    maxDiffPixels=max_diff_pixels,
+                    maxDiffPixelRatio=max_diff_pixel_ratio,
+                    snapshotDir=snapshot_dir,
+                    fullPage=full_page,
+                    clip=clip,
+                    mask=mapping.to_impl(mask),
+                    maskColor=mask_color,
+                    omitBackground=omit_background,
+                    animations=animations,
+                    caret=caret,
+                    scale=scale,
+                    style=style,
+                )
+            )
+        )
+
 
 mapping.register(PageAssertionsImpl, PageAssertions)
 
@@ -23988,6 +24268,45 @@ class LocatorAssertions(SyncBase):
             )
         )
 
+    def to_match_screenshot(
+        self,
+        name: str,
+        *,
+        timeout: typing.Optional[typing.Union[float, datetime.timedelta]] = None,
+        threshold: typing.Optional[float] = None,
+        max_diff_pixels: typing.Optional[int] = None,
+        max_diff_pixel_ratio: typing.Optional[float] = None,
+        snapshot_dir: typing.Optional[typing.Union[pathlib.Path, str]] = None,
+        mask: typing.Optional[typing.Sequence["Locator"]] = None,
+        mask_color: typing.Optional[str] = None,
+        omit_background: typing.Optional[bool] = None,
+        animations: typing.Optional[Literal["allow", "disabled"]] = None,
+        caret: typing.Optional[Literal["hide", "initial"]] = None,
+        scale: typing.Optional[Literal["css", "device"]] = None,
+        style: typing.Optional[str] = None,
+    ) -> None:
+        __tracebackhide__ = True
+
+        return mapping.from_maybe_impl(
+            self._sync(
+                self._impl_obj.to_match_screenshot(
+                    name=name,
+                    timeout=to_milliseconds(timeout),
+                    threshold=threshold,
+                    maxDiffPixels=max_diff_pixels,
+                    maxDiffPixelRatio=max_diff_pixel_ratio,
+                    snapshotDir=snapshot_dir,
+                    mask=mapping.to_impl(mask),
+                    maskColor=mask_color,
+                    omitBackground=omit_background,
+                    animations=animations,
+                    caret=caret,
+                    scale=scale,
+                    style=style,
+                )
+            )
+        )
+
 
 mapping.register(LocatorAssertionsImpl, LocatorAssertions)
 
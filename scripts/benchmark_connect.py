@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Compares BrowserType.connect() over the local driver's jsonPipe with the
+# direct WebSocket transport. A local launch-server stands in for the remote
+# grid. Latency is measured with sequential evaluate() round trips,
+# throughput with concurrent evaluate() calls returning large strings.
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Literal, Tuple
+
+from playwright._impl._driver import compute_driver_executable
+from playwright.async_api import async_playwright
+
+
+def launch_server(browser_name: str) -> Tuple[subprocess.Popen, str]:
+    config = Path(tempfile.mkdtemp()) / "config.json"
+    config.write_text(json.dumps({}))
+    executable_path, entrypoint_path = compute_driver_executable()
+    process = subprocess.Popen(
+        [
+            executable_path,
+            entrypoint_path,
+            "launch-server",
+            "--browser",
+            browser_name,
+            "--config",
+            str(config),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=sys.stderr,
+    )
+    assert process.stdout
+    ws_endpoint = process.stdout.readline().decode().strip()
+    process.stdout.close()
+    return process, ws_endpoint
+
+
+async def main(browser_name: str, round_trips: int, payload_kb: int) -> None:
+    process, ws_endpoint = launch_server(browser_name)
+    try:
+        async with async_playwright() as p:
+            browser_type = getattr(p, browser_name)
+            transports: Tuple[Literal["driver", "websocket"], ...] = (
+                "driver",
+                "websocket",
+            )
+            for transport in transports:
+                browser = await browser_type.connect(ws_endpoint, transport=transport)
+                page = await browser.new_page()
+                await page.evaluate("1")
+
+                cpu = time.process_time()
+                latencies = []
+                for _ in range(round_trips):
+                    start = time.perf_counter()
+                    await page.evaluate("1")
+                    latencies.append(time.perf_counter() - start)
+                latencies.sort()
+
+                start = time.perf_counter()
+                results = await asyncio.gather(
+                    *(
+                        page.evaluate(f"'x'.repeat({payload_kb * 1024})")
+                        for _ in range(round_trips // 10)
+                    )
+                )
+                elapsed = time.perf_counter() - start
+                megabytes = sum(len(result) for result in results) / 2**20
+                cpu = time.process_time() - cpu
+
+                print(
+                    f"{transport:>9}: "
+                    f"p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, "
+                    f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.2f}ms, "
+                    f"{megabytes / elapsed:.1f} MB/s, "
+                    f"client CPU {cpu:.2f}s"
+                )
+                await browser.close()
+    finally:
+        process.kill()
+        process.wait()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--browser", default="chromium")
+    parser.add_argument("--round-trips", type=int, default=2000)
+    parser.add_argument("--payload-kb", type=int, default=512)
+    args = parser.parse_args()
+    asyncio.run(main(args.browser, args.round_trips, args.payload_kb))
@@ -0,0 +1,120 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the client-side cost of delivering events to user listeners, e.g.
+# page.on("console") or page.on("request") on a busy page, of converting
+# return values in the generated API and the memory taken by protocol objects.
+# No driver or browser is involved.
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, cast
+
+from fake_transport import IdleTransport, create_connection
+
+from playwright._impl._connection import ChannelOwner
+from playwright._impl._helper import ParsedMessagePayload
+from playwright._impl._impl_to_api_mapping import ImplToApiMapping
+from playwright._impl._js_handle import JSHandle
+
+
+def measure(label: str, count: int, action: Callable[[], Any]) -> None:
+    start = time.perf_counter()
+    for _ in range(count):
+        action()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {count / elapsed:,.0f}/s")
+
+
+def measure_objects(
+    label: str, count: int, create: Callable[[int], ChannelOwner]
+) -> None:
+    start = time.perf_counter()
+    objects = [create(i) for i in range(count)]
+    elapsed = time.perf_counter() - start
+    for object in objects:
+        object._dispose(None)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [create(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    for object in objects:
+        object._dispose(None)
+    print(
+        f"{label:>28}: {count / elapsed:,.0f}/s, {size / count:,.0f} bytes per object"
+    )
+
+
+async def main(events: int) -> None:
+    loop = asyncio.get_running_loop()
+    connection = create_connection(IdleTransport(loop))
+    page = ChannelOwner(connection, "Page", "page@1", {})
+    mapping = ImplToApiMapping()
+    payload = {"type": "log", "text": "hello", "location": {"url": "a", "line": 1}}
+    received = 0
+
+    def on_event(event: Dict) -> None:
+        nonlocal received
+        received += 1
+
+    async def on_event_async(event: Dict) -> None:
+        nonlocal received
+        received += 1
+
+    measure_objects(
+        "ChannelOwner",
+        10000,
+        lambda i: ChannelOwner(connection, "Request", f"request@{i}", {}),
+    )
+    measure_objects(
+        "JSHandle",
+        10000,
+        lambda i: JSHandle(page, "JSHandle", f"handle@{i}", {"preview": "x"}),
+    )
+    handle = JSHandle(page, "JSHandle", "handle@0", {"preview": "x"})
+    message = cast(
+        ParsedMessagePayload,
+        {"guid": "handle@0", "method": "previewUpdated", "params": {"preview": "y"}},
+    )
+    measure("protocol event", events, lambda: connection.dispatch(message))
+    handle._dispose(None)
+    measure("emit without listener", events, lambda: page.emit("sync", payload))
+    page.on("sync", mapping.wrap_handler(on_event))
+    page.on("async", mapping.wrap_handler(on_event_async))
+    measure("sync listener", events, lambda: page.emit("sync", payload))
+    start = time.perf_counter()
+    for _ in range(events):
+        page.emit("async", payload)
+    await asyncio.sleep(0)
+    while received < 2 * events:
+        await asyncio.sleep(0)
+    print(f"{'async listener':>28}: {events / (time.perf_counter() - start):,.0f}/s")
+
+    measure("from_maybe_impl(str)", events, lambda: mapping.from_maybe_impl("text"))
+    measure(
+        "from_maybe_impl(flat dict)",
+        events,
+        lambda: mapping.from_maybe_impl({"width": 1, "height": 2}),
+    )
+    measure("from_maybe_impl(nested)", events, lambda: mapping.from_maybe_impl(payload))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--events", type=int, default=200000)
+    args = parser.parse_args()
+    asyncio.run(main(args.events))
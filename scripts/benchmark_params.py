@@ -0,0 +1,157 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the client-side cost of turning the arguments of common API calls
+# into protocol messages, from locals_to_params() to the transport. Arguments
+# are laid out like locals() of the Frame methods, with None for everything
+# that was not passed. Nothing is sent anywhere.
+
+import argparse
+import asyncio
+import inspect
+import time
+from typing import Any, Dict, List, Tuple
+
+from fake_transport import IdleTransport, create_connection
+
+from playwright._impl._connection import ChannelOwner
+from playwright._impl._frame import Frame
+from playwright._impl._helper import locals_to_params
+from playwright._impl._js_handle import JSHandle, serialize_argument
+
+
+def common_calls(handle: JSHandle) -> List[Tuple[str, str, Dict[str, Any]]]:
+    # (Frame method, protocol method, arguments passed by the caller)
+    position = {"x": 10, "y": 20}
+    element = serialize_argument(handle)
+    return [
+        ("_click", "click", {"selector": "#submit"}),
+        ("_click", "click", {"selector": "text=Next", "timeout": 5000}),
+        ("_click", "click", {"selector": "#a", "position": position, "force": True}),
+        ("_click", "click", {"selector": "#menu", "button": "right"}),
+        ("_click", "click", {"selector": "#b", "modifiers": ["Shift"]}),
+        ("dblclick", "dblclick", {"selector": "#cell"}),
+        ("tap", "tap", {"selector": "#button"}),
+        ("_fill", "fill", {"selector": "#name", "value": "John"}),
+        ("_fill", "fill", {"selector": "#email", "value": "a@b.c", "strict": True}),
+        ("_fill", "fill", {"selector": "#q", "value": "", "timeout": 1000}),
+        ("type", "type", {"selector": "#search", "text": "playwright"}),
+        ("press", "press", {"selector": "#search", "key": "Enter"}),
+        ("press", "press", {"selector": "#q", "key": "Control+A", "delay": 10}),
+        ("check", "check", {"selector": "#agree"}),
+        ("uncheck", "uncheck", {"selector": "#agree"}),
+        ("hover", "hover", {"selector": "#menu"}),
+        ("hover", "hover", {"selector": "#menu", "position": position}),
+        ("focus", "focus", {"selector": "#name"}),
+        ("is_visible", "isVisible", {"selector": "#dialog"}),
+        ("is_visible", "isVisible", {"selector": "#toast", "strict": True}),
+        ("is_hidden", "isHidden", {"selector": "#spinner"}),
+        ("is_enabled", "isEnabled", {"selector": "#submit"}),
+        ("is_disabled", "isDisabled", {"selector": "#submit"}),
+        ("is_checked", "isChecked", {"selector": "#agree"}),
+        ("is_editable", "isEditable", {"selector": "#name"}),
+        ("text_content", "textContent", {"selector": "h1"}),
+        ("inner_text", "innerText", {"selector": ".price"}),
+        ("inner_html", "innerHTML", {"selector": "#list"}),
+        ("get_attribute", "getAttribute", {"selector": "a", "name": "href"}),
+        ("input_value", "inputValue", {"selector": "#name"}),
+        ("wait_for_selector", "waitForSelector", {"selector": "#result"}),
+        (
+            "wait_for_selector",
+            "waitForSelector",
+            {"selector": "#spinner", "state": "hidden", "timeout": 10000},
+        ),
+        ("query_selector", "querySelector", {"selector": "#row"}),
+        ("dispatch_event", "dispatchEvent", {"selector": "#a", "type": "click"}),
+        ("set_checked", "check", {"selector": "#agree", "checked": True}),
+        ("select_option", "selectOption", {"selector": "select", "force": True}),
+        ("goto", "goto", {"url": "https://example.com/"}),
+        ("goto", "goto", {"url": "https://example.com/", "waitUntil": "load"}),
+        ("set_content", "setContent", {"html": "<div>hello</div>"}),
+        ("wait_for_timeout", "waitForTimeout", {"timeout": 100}),
+        ("content", "content", {}),
+        ("title", "title", {}),
+        ("evaluate", "evaluateExpression", {"expression": "1 + 1", "arg": None}),
+        (
+            "evaluate",
+            "evaluateExpression",
+            {"expression": "e => e.id", "arg": element},
+        ),
+        (
+            "evaluate_handle",
+            "evaluateExpressionHandle",
+            {"expression": "document.body", "arg": serialize_argument(None)},
+        ),
+        (
+            "eval_on_selector",
+            "evalOnSelector",
+            {"selector": "#a", "expression": "e => e.id", "arg": element},
+        ),
+        (
+            "eval_on_selector_all",
+            "evalOnSelectorAll",
+            {"selector": "li", "expression": "e => e.length", "arg": element},
+        ),
+        (
+            "drag_and_drop",
+            "dragAndDrop",
+            {"source": "#from", "target": "#to", "sourcePosition": position},
+        ),
+        ("_click", "click", {"selector": "#c", "trial": True, "noWaitAfter": True}),
+        ("_fill", "fill", {"selector": "#d", "value": "x" * 100, "force": True}),
+    ]
+
+
+def as_locals(frame: Frame, method: str, arguments: Dict[str, Any]) -> Dict:
+    # What locals() holds inside the Frame method for these arguments.
+    result: Dict[str, Any] = {"self": frame}
+    for name in inspect.signature(getattr(Frame, method)).parameters:
+        if name != "self":
+            result[name] = None
+    result.update(arguments)
+    return result
+
+
+async def main(rounds: int) -> None:
+    loop = asyncio.get_running_loop()
+    connection = create_connection(IdleTransport(loop))
+    root = ChannelOwner(connection, "Root", "", {})
+    frame = Frame(root, "Frame", "frame@1", {"name": "", "url": "", "loadStates": []})
+    handle = JSHandle(root, "JSHandle", "handle@1", {"preview": "div"})
+    calls = [
+        (protocol_method, as_locals(frame, method, arguments))
+        for method, protocol_method, arguments in common_calls(handle)
+    ]
+
+    def run() -> None:
+        for protocol_method, frame_locals in calls:
+            frame._channel.send_no_reply(
+                protocol_method, frame._timeout, locals_to_params(frame_locals)
+            )
+
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            connection.wrap_api_call_sync(run)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{len(calls)} calls: {elapsed / rounds / len(calls) * 1e6:.2f}us per call"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.rounds))
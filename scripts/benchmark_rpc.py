@@ -0,0 +1,59 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the client-side cost of a protocol call, e.g. is_visible() polled
+# in a tight loop. A fake transport answers every call on the next loop
+# iteration, so the numbers exclude the driver and the browser entirely.
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from fake_transport import FakeTransport, create_connection
+
+from playwright._impl._connection import ChannelOwner
+
+
+async def call(owner: ChannelOwner) -> Any:
+    return await owner._channel.send("isVisible", None, {"selector": "div"})
+
+
+async def main(calls: int, concurrency: int, rounds: int) -> None:
+    loop = asyncio.get_running_loop()
+    connection = create_connection(FakeTransport(loop, {"value": True}))
+    owner = ChannelOwner(connection, "Frame", "frame@1", {})
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for _ in range(calls):
+            await call(owner)
+        sequential = calls / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(calls // concurrency):
+            await asyncio.gather(*(call(owner) for _ in range(concurrency)))
+        concurrent = calls / (time.perf_counter() - start)
+        print(
+            f"sequential: {sequential:,.0f} RPC/s, "
+            f"{concurrency} concurrent: {concurrent:,.0f} RPC/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=50000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency, args.rounds))
@@ -0,0 +1,56 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Measures the cost of many concurrent event waiters, e.g. thousands of
+# in-flight expect_console_message() calls. Set
+# PLAYWRIGHT_SKIP_WAIT_INFO_WITHOUT_TRACING=1 to also skip the wait info
+# protocol messages.
+
+import argparse
+import asyncio
+import time
+
+from playwright.async_api import async_playwright
+
+
+async def main(waiters: int, rounds: int) -> None:
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        for _ in range(rounds):
+            start = time.perf_counter()
+            managers = [page.expect_console_message() for _ in range(waiters)]
+            infos = [await manager.__aenter__() for manager in managers]
+            created = time.perf_counter()
+            tasks = len(asyncio.all_tasks())
+            await page.evaluate("console.log('done')")
+            for manager in managers:
+                await manager.__aexit__(None, None, None)
+            for info in infos:
+                await info.value
+            done = time.perf_counter()
+            print(
+                f"{waiters} waiters: created in {(created - start) * 1000:.1f}ms, "
+                f"resolved in {(done - created) * 1000:.1f}ms, "
+                f"{tasks} tasks alive while waiting"
+            )
+        await browser.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--waiters", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.waiters, args.rounds))
@@ -24,6 +24,9 @@ from playwright._impl._helper import to_snake_case
 
 enum_regex = r"^\"[^\"]+\"(?:\|\"[^\"]+\")+$"
 union_regex = r"^[^\|]+(?:\|[^\|]+)+$"
+# Generated classes that only exist in the Python API and have no api.json
+# entry.
+python_only_classes = ["CDPEventStream"]
 
 
 class DocumentationProvider:
@@ -120,7 +123,7 @@ class DocumentationProvider:
         signature: Dict[str, Any] = None,
         is_property: bool = False,
     ) -> None:
-        if class_name in ["BindingCall"] or method_name in [
+        if class_name in ["BindingCall", *python_only_classes] or method_name in [
             "pid",
         ]:
             return
@@ -210,6 +213,8 @@ class DocumentationProvider:
             )
 
     def print_events(self, class_name: str) -> None:
+        if class_name in python_only_classes:
+            return
         clazz = self.classes[class_name]
         events = clazz["events"]
         if events:
@@ -0,0 +1,67 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Transports for the benchmarks that measure the client alone, without a
+# driver or a browser.
+
+import asyncio
+from typing import Any, Dict, cast
+
+from playwright._impl._connection import ChannelOwner, Connection
+from playwright._impl._helper import ParsedMessagePayload
+from playwright._impl._transport import Transport
+
+
+class IdleTransport(Transport):
+    # Drops every message.
+    def request_stop(self) -> None:
+        pass
+
+    async def wait_until_stopped(self) -> None:
+        pass
+
+    async def connect(self) -> None:
+        pass
+
+    async def run(self) -> None:
+        pass
+
+    def send(self, message: Dict) -> None:
+        pass
+
+
+class FakeTransport(IdleTransport):
+    # Answers every call with `result` on the next loop iteration.
+    def __init__(self, loop: asyncio.AbstractEventLoop, result: Any) -> None:
+        super().__init__(loop)
+        self._result = result
+
+    def send(self, message: Dict) -> None:
+        if "id" in message:
+            reply = {"id": message["id"], "result": self._result}
+            self._loop.call_soon(self.on_message, cast(ParsedMessagePayload, reply), 0)
+
+
+def create_remote_object(
+    parent: ChannelOwner, type: str, guid: str, initializer: Dict
+) -> ChannelOwner:
+    # Benchmarks construct the objects they need directly and the transports
+    # above never send "__create__", so nothing should ever get here.
+    raise RuntimeError(
+        f"Unexpected {type} {guid}: benchmark transports do not create objects"
+    )
+
+
+def create_connection(transport: Transport) -> Connection:
+    return Connection(None, create_remote_object, transport, transport._loop)
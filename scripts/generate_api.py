@@ -26,7 +26,7 @@ from playwright._impl._assertions import (
 from playwright._impl._browser import Browser
 from playwright._impl._browser_context import BrowserContext
 from playwright._impl._browser_type import BrowserType
-from playwright._impl._cdp_session import CDPSession
+from playwright._impl._cdp_session import CDPEventStream, CDPSession
 from playwright._impl._clock import Clock
 from playwright._impl._console_message import ConsoleMessage
 from playwright._impl._credentials import Credentials
@@ -98,6 +98,7 @@ positional_exceptions = [
     r"abort\.errorCode",
     r"accept\.promptText",
     r"add_init_script\.script",
+    r"call\.arg",
     r"cookies\.urls",
     r"dispatch_event\.eventInit",
     r"eval.*\.arg",
@@ -108,6 +109,10 @@ positional_exceptions = [
     r"register\.script",
     r"select_option\.value",
     r"send\.params",
+    r"set_metrics_collector\.collector",
+    r"set_stall_monitor\.monitor",
+    r"set_memory_budget\.budget",
+    r"set_console_message_retention\.limit",
     r"set_geolocation\.geolocation",
     r"to_have_attribute\.value",
     r"wait_for_.*\.predicate",
@@ -156,6 +161,14 @@ def signature(func: FunctionType, indent: int) -> str:
     return split.join(tokens)
 
 
+# Modules whose classes are passed through as is, without an API wrapper.
+plain_type_modules = ["_api_structures", "_metrics", "_trace_sink"]
+
+
+def is_plain_type(value_str: str) -> bool:
+    return any(f"._impl.{module}." in value_str for module in plain_type_modules)
+
+
 def arguments(func: FunctionType, indent: int) -> str:
     hints = get_type_hints(func, globals())
     tokens = []
@@ -178,15 +191,13 @@ def arguments(func: FunctionType, indent: int) -> str:
             or "Handle" in value_str
         ):
             tokens.append(f"{name}=mapping.to_impl({to_snake_case(name)})")
-        elif (
-            re.match(r"<class 'playwright\._impl\.[\w]+\.[\w]+", value_str)
-            and "_api_structures" not in value_str
-        ):
+        elif re.match(
+            r"<class 'playwright\._impl\.[\w]+\.[\w]+", value_str
+        ) and not is_plain_type(value_str):
             tokens.append(f"{name}={to_snake_case(name)}._impl_obj")
-        elif (
-            re.match(r"typing\.Optional\[playwright\._impl\.[\w]+\.[\w]+\]", value_str)
-            and "_api_structures" not in value_str
-        ):
+        elif re.match(
+            r"typing\.Optional\[playwright\._impl\.[\w]+\.[\w]+\]", value_str
+        ) and not is_plain_type(value_str):
             tokens.append(
                 f"{name}={to_snake_case(name)}._impl_obj if {to_snake_case(name)} else None"
             )
@@ -250,12 +261,13 @@ import datetime
 from typing import Literal
 
 
-from playwright._impl._api_structures import Cookie, SetCookieParam, FloatRect, FilePayload, Geolocation, HttpCredentials, PdfMargins, Position, ProxySettings, ResourceTiming, SourceLocation, StorageState, ClientCertificate, ViewportSize, RemoteAddr, SecurityDetails, RequestSizes, NameValue, TracingGroupLocation, DebuggerLocation, DebuggerPausedDetails, ScreencastFrame, ScreencastSize, BrowserBindResult, WebErrorLocation, DropPayload, VirtualCredential
+from playwright._impl._api_structures import Cookie, SetCookieParam, FloatRect, FilePayload, Geolocation, HttpCredentials, PdfMargins, Position, ProxySettings, ResourceTiming, SourceLocation, StorageState, ClientCertificate, ViewportSize, RemoteAddr, SecurityDetails, RequestSizes, NameValue, TracingGroupLocation, DebuggerLocation, DebuggerPausedDetails, ScreencastFrame, ScreencastSize, ScreencastStats, BrowserBindResult, WebErrorLocation, DropPayload, VirtualCredential
 from playwright._impl._browser import Browser as BrowserImpl
 from playwright._impl._browser_context import BrowserContext as BrowserContextImpl
 from playwright._impl._browser_type import BrowserType as BrowserTypeImpl
 from playwright._impl._clock import Clock as ClockImpl
 from playwright._impl._credentials import Credentials as CredentialsImpl
+from playwright._impl._cdp_session import CDPEventStream as CDPEventStreamImpl
 from playwright._impl._cdp_session import CDPSession as CDPSessionImpl
 from playwright._impl._console_message import ConsoleMessage as ConsoleMessageImpl
 from playwright._impl._debugger import Debugger as DebuggerImpl
@@ -279,6 +291,10 @@ from playwright._impl._tracing import Tracing as TracingImpl
 from playwright._impl._locator import Locator as LocatorImpl, FrameLocator as FrameLocatorImpl
 from playwright._impl._errors import Error
 from playwright._impl._form_data import FormData
+from playwright._impl._image import RawImage
+from playwright._impl._memory_budget import MemoryBudget
+from playwright._impl._metrics import MetricsCollector, StallMonitor
+from playwright._impl._trace_sink import TraceSink
 from playwright._impl._helper import to_milliseconds
 from playwright._impl._fetch import APIRequest as APIRequestImpl, APIResponse as APIResponseImpl, APIRequestContext as APIRequestContextImpl
 from playwright._impl._assertions import PageAssertions as PageAssertionsImpl, LocatorAssertions as LocatorAssertionsImpl, APIResponseAssertions as APIResponseAssertionsImpl
@@ -314,6 +330,7 @@ generated_types = [
     WebStorage,
     BrowserContext,
     CDPSession,
+    CDPEventStream,
     Browser,
     BrowserType,
     Playwright,
@@ -41,6 +41,8 @@ def generate(t: Any) -> None:
     base_class = t.__bases__[0].__name__
     if class_name in ["Page", "BrowserContext", "Browser", "Disposable"]:
         base_sync_class = "AsyncContextManager"
+    elif class_name == "CDPEventStream":
+        base_sync_class = "AsyncEventStream"
     elif base_class in ["ChannelOwner", "object", "AssertionsBase"]:
         base_sync_class = "AsyncBase"
     else:
@@ -133,7 +135,7 @@ def generate(t: Any) -> None:
 def main() -> None:
     print(header)
     print(
-        "from playwright._impl._async_base import AsyncEventContextManager, AsyncBase, AsyncContextManager, mapping"
+        "from playwright._impl._async_base import AsyncEventContextManager, AsyncBase, AsyncContextManager, AsyncEventStream, mapping"
     )
 
     for t in generated_types:
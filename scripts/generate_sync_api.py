@@ -45,6 +45,8 @@ def generate(t: Any) -> None:
     base_class = t.__bases__[0].__name__
     if class_name in ["Page", "BrowserContext", "Browser", "Disposable"]:
         base_sync_class = "SyncContextManager"
+    elif class_name == "CDPEventStream":
+        base_sync_class = "SyncEventStream"
     elif base_class in ["ChannelOwner", "object", "AssertionsBase"]:
         base_sync_class = "SyncBase"
     else:
@@ -137,7 +139,7 @@ def main() -> None:
 
     print(header)
     print(
-        "from playwright._impl._sync_base import EventContextManager, SyncBase, SyncContextManager, mapping"
+        "from playwright._impl._sync_base import EventContextManager, SyncBase, SyncContextManager, SyncEventStream, mapping"
     )
 
     for t in generated_types:
@@ -15,7 +15,10 @@
 from pathlib import Path
 from typing import Optional
 
+import pytest
+
 from playwright.async_api import BrowserContext, Error, Page
+from tests.server import Server
 
 
 async def test_add_init_script_evaluate_before_anything_else_on_the_page(
@@ -99,3 +102,41 @@ async def test_add_init_script_returns_disposable(page: Page) -> None:
         assert await page.evaluate("window.result") == 123
     await page.goto("data:text/html,<script>window.result = window.injected</script>")
     assert await page.evaluate("window.result") is None
+
+
+async def test_register_function_should_call_by_id(
+    context: BrowserContext, server: Server
+) -> None:
+    page = await context.new_page()
+    fn = await context.register_function("([a, b]) => a * b")
+    assert await context.register_function("([a, b]) => a * b") == fn
+    assert await page.call(fn, [6, 7]) == 42
+    await page.goto(server.EMPTY_PAGE)
+    assert await page.call(fn, [2, 3]) == 6
+
+
+async def test_register_function_should_work_for_already_created_pages(
+    context: BrowserContext, server: Server
+) -> None:
+    page = await context.new_page()
+    await page.goto(server.EMPTY_PAGE)
+    fn = await context.register_function("async () => location.pathname")
+    assert await page.call(fn) == "/empty.html"
+
+
+async def test_unregister_function_should_remove_its_init_script(
+    context: BrowserContext, server: Server
+) -> None:
+    page = await context.new_page()
+    fn = await context.register_function("() => 42")
+    await page.goto(server.EMPTY_PAGE)
+    assert await page.call(fn) == 42
+    await context.unregister_function(fn)
+    await page.goto(server.EMPTY_PAGE)
+    with pytest.raises(Error, match="is not registered"):
+        await page.call(fn)
+
+
+async def test_register_function_should_throw_for_unknown_id(page: Page) -> None:
+    with pytest.raises(Error, match='Function "unknown" is not registered'):
+        await page.call("unknown")
@@ -15,9 +15,14 @@
 import asyncio
 import datetime
 import re
+from pathlib import Path
+from types import SimpleNamespace
+from typing import cast
 
 import pytest
 
+from playwright._impl._assertions import _golden_path
+from playwright._impl._page import Page as PageImpl
 from playwright.async_api import Browser, Error, Page, expect
 from tests.server import Server
 
@@ -1191,6 +1196,58 @@ async def test_soft_does_not_leak_between_scopes(page: Page, server: Server) ->
         await expect.soft(page.locator("div")).to_have_text("nope", timeout=500)
 
 
+async def test_expect_all_should_pass(page: Page) -> None:
+    await page.set_content("<div>hello</div><span>world</span>")
+    async with expect.all():
+        await expect(page.locator("div")).to_have_text("hello")
+        await expect(page.locator("span")).to_have_text("world")
+        await expect(page.locator("p")).not_to_be_visible()
+
+
+async def test_expect_all_should_report_all_failures(page: Page) -> None:
+    await page.set_content("<div>hello</div>")
+    with pytest.raises(AssertionError) as excinfo:
+        async with expect.all():
+            await expect(page.locator("div")).to_have_text("nope", timeout=500)
+            await expect(page.locator("div")).to_have_text("hello")
+            await expect(page).to_have_title("neither", timeout=500)
+    assert "2 of 3 expectations failed" in str(excinfo.value)
+    assert "'nope'" in str(excinfo.value)
+    assert "'neither'" in str(excinfo.value)
+
+
+async def test_expect_all_should_not_capture_other_tasks(page: Page) -> None:
+    await page.set_content("<div>hello</div>")
+    inside = asyncio.Event()
+    checked = asyncio.Event()
+
+    async def assert_elsewhere() -> None:
+        await inside.wait()
+        try:
+            with pytest.raises(AssertionError):
+                await expect(page.locator("div")).to_have_text("nope", timeout=500)
+        finally:
+            checked.set()
+
+    task = asyncio.create_task(assert_elsewhere())
+    async with expect.all():
+        inside.set()
+        await checked.wait()
+        await expect(page.locator("div")).to_have_text("hello")
+    await task
+
+
+async def test_expect_all_should_not_nest(page: Page) -> None:
+    with pytest.raises(AssertionError, match="nested"):
+        async with expect.all():
+            async with expect.all():
+                pass
+    # The outer block is reset and regular assertions work again.
+    await page.set_content("<div>hello</div>")
+    with pytest.raises(AssertionError):
+        await expect(page.locator("div")).to_have_text("nope", timeout=500)
+
+
 async def test_assertions_should_include_aria_snapshot_in_separate_section(
     page: Page,
 ) -> None:
@@ -1209,3 +1266,57 @@ async def test_assertions_should_include_aria_snapshot_in_separate_section(
     actual_line = message.split("\n")[1]
     assert 'heading "Page Heading"' not in actual_line
     assert message.index('heading "Page Heading"') > message.index("Aria snapshot:")
+
+
+async def test_to_match_screenshot(page: Page, tmp_path: Path) -> None:
+    await page.set_viewport_size({"width": 100, "height": 100})
+    await page.set_content(
+        '<div style="width: 50px; height: 50px; background: blue"></div>'
+    )
+    with pytest.raises(AssertionError, match="A snapshot doesn't exist"):
+        await expect(page).to_match_screenshot("page.png", snapshot_dir=tmp_path)
+    [golden] = tmp_path.glob("golden-*/page.png")
+    await expect(page).to_match_screenshot("page.png", snapshot_dir=tmp_path)
+
+    await page.evaluate("document.querySelector('div').style.width = '60px'")
+    with pytest.raises(AssertionError) as exc_info:
+        await expect(page).to_match_screenshot(
+            "page.png", snapshot_dir=tmp_path, timeout=1000
+        )
+    assert "500 pixels (ratio 0.05 of all image pixels) are different" in str(
+        exc_info.value
+    )
+    assert golden.with_name("page-diff.png").exists()
+    assert golden.with_name("page-actual.png").exists()
+    await expect(page).to_match_screenshot(
+        "page.png", snapshot_dir=tmp_path, max_diff_pixels=500
+    )
+
+
+async def test_to_match_screenshot_with_locator_and_mask(
+    page: Page, tmp_path: Path
+) -> None:
+    await page.set_content(
+        '<section style="width: 40px; height: 40px; background: blue">'
+        '<div style="width: 20px; height: 20px; background: red"></div>'
+        "</section>"
+    )
+    with pytest.raises(AssertionError, match="A snapshot doesn't exist"):
+        await expect(page.locator("section")).to_match_screenshot(
+            "section.png", snapshot_dir=tmp_path, mask=[page.locator("div")]
+        )
+    await page.evaluate("document.querySelector('div').style.background = 'green'")
+    await expect(page.locator("section")).to_match_screenshot(
+        "section.png", snapshot_dir=tmp_path, mask=[page.locator("div")]
+    )
+    with pytest.raises(AssertionError, match="400 pixels"):
+        await expect(page.locator("section")).to_match_screenshot(
+            "section.png", snapshot_dir=tmp_path, timeout=1000
+        )
+
+
+def test_to_match_screenshot_should_require_a_known_browser_engine() -> None:
+    # E.g. a page of an Android or Electron context, which has no Browser.
+    page = cast(PageImpl, SimpleNamespace(context=SimpleNamespace(browser=None)))
+    with pytest.raises(Error, match="browser engine of this page is unknown"):
+        _golden_path(page, None, "page.png")
@@ -0,0 +1,252 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import base64
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+import pytest
+
+from playwright._impl import _connection
+from playwright._impl._binary_channel import BinaryChannel
+from playwright._impl._connection import ChannelOwner, Connection
+from playwright._impl._helper import ParsedMessagePayload
+from playwright._impl._network import Response
+from playwright._impl._object_factory import create_remote_object
+from playwright._impl._stream import Stream
+from playwright._impl._transport import Transport
+from playwright.async_api import Error, Page
+from tests.server import Server
+
+
+def test_should_exchange_large_payloads_through_files(tmp_path: Path) -> None:
+    channel = BinaryChannel.from_capability(
+        {"directory": str(tmp_path), "threshold": 1024}
+    )
+    assert channel
+
+    # Payloads written by the driver are read and removed.
+    (tmp_path / "frame").write_bytes(b"\x89PNG" * 1000)
+    assert channel.decode("oob:frame") == b"\x89PNG" * 1000
+    assert not (tmp_path / "frame").exists()
+    assert channel.decode(base64.b64encode(b"small").decode()) == b"small"
+
+    # Payloads sent to the driver are left for it to pick up.
+    encoded = channel.encode(b"x" * 4096)
+    assert encoded.startswith("oob:")
+    assert (tmp_path / encoded[4:]).read_bytes() == b"x" * 4096
+    assert channel.encode(b"small") == base64.b64encode(b"small").decode()
+
+    with pytest.raises(Error, match="Invalid binary channel payload"):
+        channel.decode("oob:../secret")
+
+
+def test_should_not_enable_binary_channel_without_driver_support() -> None:
+    assert BinaryChannel.from_capability(None) is None
+    assert BinaryChannel.from_capability({}) is None
+
+
+async def test_should_transfer_binaries_with_current_driver(
+    page: Page, server: Server
+) -> None:
+    body = b"\x00\x01" * 512 * 1024
+    await page.route(
+        "**/binary", lambda route: route.fulfill(body=body, content_type="x/y")
+    )
+    response = await page.goto(server.PREFIX + "/binary")
+    assert response
+    assert await response.body() == body
+    screenshot = await page.screenshot()
+    assert screenshot.startswith(b"\x89PNG")
+
+
+class FakeDriverTransport(Transport):
+    # Answers initialize like a local driver, optionally with the binary
+    # channel capability, and serves the calls queued in `replies`.
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, capability: Optional[Dict]
+    ) -> None:
+        super().__init__(loop)
+        self._capability = capability
+        self._stopped = loop.create_future()
+        self.initialize_params: Dict = {}
+        self.replies: Dict[str, List[Dict]] = {}
+
+    def request_stop(self) -> None:
+        if not self._stopped.done():
+            self._stopped.set_result(None)
+
+    async def wait_until_stopped(self) -> None:
+        await self._stopped
+
+    async def connect(self) -> None:
+        pass
+
+    async def run(self) -> None:
+        await self._stopped
+
+    def send(self, message: Dict) -> None:
+        self._loop.call_soon(self._reply, message)
+
+    def emit(self, message: Dict) -> None:
+        self.on_message(cast(ParsedMessagePayload, message), 0)
+
+    def _reply(self, message: Dict) -> None:
+        result: Dict[str, Any]
+        if message["method"] == "initialize":
+            self.initialize_params = message["params"]
+            self.emit(
+                {
+                    "guid": "",
+                    "method": "__create__",
+                    "params": {
+                        "type": "Playwright",
+                        "guid": "playwright",
+                        "initializer": {},
+                    },
+                }
+            )
+            result = {"playwright": {"guid": "playwright"}}
+            if self._capability and message["params"].get("binaryChannel"):
+                result["binaryChannel"] = self._capability
+        else:
+            result = self.replies[message["method"]].pop(0)
+        self.emit({"id": message["id"], "result": result})
+
+    def create(self, type: str, guid: str, initializer: Dict) -> None:
+        self.emit(
+            {
+                "guid": "playwright",
+                "method": "__create__",
+                "params": {"type": type, "guid": guid, "initializer": initializer},
+            }
+        )
+
+
+async def _connect(
+    capability: Optional[Dict],
+) -> Tuple[Connection, FakeDriverTransport]:
+    loop = asyncio.get_running_loop()
+    transport = FakeDriverTransport(loop, capability)
+    connection = Connection(None, _create_object, transport, loop)
+    loop.create_task(connection.run())
+    await connection.playwright_future
+    return connection, transport
+
+
+def _create_object(
+    parent: ChannelOwner, type: str, guid: str, initializer: Dict
+) -> ChannelOwner:
+    # The real Playwright object needs browser types and selectors.
+    if type == "Playwright":
+        return ChannelOwner(parent, type, guid, initializer)
+    return create_remote_object(parent, type, guid, initializer)
+
+
+def _create_response(
+    connection: Connection, transport: FakeDriverTransport
+) -> Response:
+    transport.create(
+        "Request",
+        "request@1",
+        {
+            "url": "http://localhost/binary",
+            "resourceType": "document",
+            "method": "GET",
+            "headers": [],
+            "isNavigationRequest": False,
+        },
+    )
+    timing = dict.fromkeys(
+        [
+            "startTime",
+            "domainLookupStart",
+            "domainLookupEnd",
+            "connectStart",
+            "secureConnectionStart",
+            "connectEnd",
+            "requestStart",
+            "responseStart",
+        ],
+        0,
+    )
+    transport.create(
+        "Response",
+        "response@1",
+        {
+            "request": {"guid": "request@1"},
+            "url": "http://localhost/binary",
+            "status": 200,
+            "statusText": "OK",
+            "headers": [],
+            "timing": timing,
+        },
+    )
+    return cast(Response, connection._objects["response@1"])
+
+
+async def test_should_receive_out_of_band_payloads_after_negotiation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(_connection, "BINARY_CHANNEL_ENABLED", True)
+    connection, transport = await _connect(
+        {"directory": str(tmp_path), "threshold": 1024}
+    )
+    assert transport.initialize_params["binaryChannel"] is True
+    assert connection._binary_channel
+
+    body = b"\x00\x01" * 4096
+    (tmp_path / "body").write_bytes(body)
+    transport.replies["body"] = [{"binary": "oob:body"}]
+    response = _create_response(connection, transport)
+    assert await response.body() == body
+    assert not (tmp_path / "body").exists()
+
+    (tmp_path / "chunk").write_bytes(b"large" * 1024)
+    transport.replies["read"] = [
+        {"binary": "oob:chunk"},
+        {"binary": base64.b64encode(b"small").decode()},
+        {"binary": ""},
+    ]
+    transport.create("Stream", "stream@1", {})
+    stream = cast(Stream, connection._objects["stream@1"])
+    assert await stream.read_all() == b"large" * 1024 + b"small"
+    assert list(tmp_path.iterdir()) == []
+    await connection.stop_async()
+
+
+async def test_should_fall_back_to_base64_without_driver_support(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(_connection, "BINARY_CHANNEL_ENABLED", True)
+    connection, transport = await _connect(None)
+    assert transport.initialize_params["binaryChannel"] is True
+    assert connection._binary_channel is None
+
+    transport.replies["body"] = [{"binary": base64.b64encode(b"body").decode()}]
+    response = _create_response(connection, transport)
+    assert await response.body() == b"body"
+    await connection.stop_async()
+
+
+async def test_should_not_request_binary_channel_unless_enabled(
+    tmp_path: Path,
+) -> None:
+    connection, transport = await _connect(
+        {"directory": str(tmp_path), "threshold": 1024}
+    )
+    assert "binaryChannel" not in transport.initialize_params
+    assert connection._binary_channel is None
+    await connection.stop_async()
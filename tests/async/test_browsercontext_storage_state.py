@@ -14,11 +14,15 @@
 
 import asyncio
 import json
+import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 import pytest
 
+from playwright._impl import _helper
+from playwright._impl._helper import async_readfile, parse_json_bytes
 from playwright.async_api import Browser, BrowserContext, Page, StorageState
 from tests.server import Server
 
@@ -240,3 +244,74 @@ async def test_should_round_trip_webauthn_credentials_with_storage_state(
     assert await context2.storage_state(credentials=True) == state
     await context.close()
     await context2.close()
+
+
+async def test_should_reload_storage_state_file_after_it_changed(
+    browser: Browser, tmp_path: Path
+) -> None:
+    path = tmp_path / "storage-state.json"
+
+    async def local_storage_from_file(value: str, age: float) -> str:
+        path.write_text(
+            json.dumps(
+                {
+                    "cookies": [],
+                    "origins": [
+                        {
+                            "origin": "https://www.example.com",
+                            "localStorage": [{"name": "name", "value": value}],
+                        }
+                    ],
+                }
+            )
+        )
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        context = await browser.new_context(storage_state=path)
+        page = await context.new_page()
+        await page.route(
+            "**/*",
+            lambda route: asyncio.create_task(route.fulfill(body="<html></html>")),
+        )
+        await page.goto("https://www.example.com")
+        result = await page.evaluate("localStorage['name']")
+        await context.close()
+        return result
+
+    assert await local_storage_from_file("first", 60) == "first"
+    assert await local_storage_from_file("first", 60) == "first"
+    assert await local_storage_from_file("second", 30) == "second"
+
+
+async def test_storage_state_file_should_be_read_and_parsed_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "storage-state.json"
+    path.write_text(json.dumps({"cookies": [], "origins": []}))
+    mtime = time.time() - 60
+    os.utime(path, (mtime, mtime))
+    reads: List[str] = []
+    parses: List[bytes] = []
+
+    async def readfile(file: str) -> bytes:
+        reads.append(file)
+        return await async_readfile(file)
+
+    def parse(data: bytes) -> Dict:
+        parses.append(data)
+        return parse_json_bytes(data)
+
+    monkeypatch.setattr(_helper, "async_readfile", readfile)
+    first = await _helper.async_readfile_cached(path, parse)
+    assert await _helper.async_readfile_cached(path, parse) is first
+    assert len(reads) == 1
+    assert len(parses) == 1
+
+    path.write_text(json.dumps({"cookies": [], "origins": [{"origin": "a"}]}))
+    os.utime(path, (mtime + 1, mtime + 1))
+    assert await _helper.async_readfile_cached(path, parse) == {
+        "cookies": [],
+        "origins": [{"origin": "a"}],
+    }
+    assert len(reads) == 2
+    assert len(parses) == 2
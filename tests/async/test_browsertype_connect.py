@@ -526,3 +526,47 @@ async def test_should_upload_a_folder(
             i,
         )
         assert content == (dir / ".." / webkit_relative_path).read_text()
+
+
+async def test_should_connect_over_direct_websocket_transport(
+    server: Server, browser_type: BrowserType, launch_server: Callable[[], RemoteServer]
+) -> None:
+    remote_server = launch_server()
+    browser = await browser_type.connect(
+        remote_server.ws_endpoint, transport="websocket"
+    )
+    disconnected = []
+    browser.on("disconnected", lambda b: disconnected.append(b))
+    page = await browser.new_page()
+    assert await page.evaluate("11 * 11") == 121
+    await page.goto(server.EMPTY_PAGE)
+    large = await page.evaluate("'x'.repeat(1024 * 1024)")
+    assert len(large) == 1024 * 1024
+    await browser.close()
+    assert disconnected == [browser]
+
+
+async def test_should_print_custom_ws_close_error_with_websocket_transport(
+    server: Server, browser_type: BrowserType
+) -> None:
+    def _handle_ws(ws: WebSocketProtocol) -> None:
+        def _onMessage(payload: bytes, isBinary: bool) -> None:
+            ws.sendClose(code=4123, reason="Oh my!")
+
+        setattr(ws, "onMessage", _onMessage)
+
+    server.once_web_socket_connection(_handle_ws)
+    with pytest.raises(Error, match="Oh my!"):
+        await browser_type.connect(
+            f"ws://localhost:{server.PORT}/ws", transport="websocket"
+        )
+
+
+async def test_websocket_transport_should_reject_expose_network(
+    browser_type: BrowserType, launch_server: Callable[[], RemoteServer]
+) -> None:
+    remote_server = launch_server()
+    with pytest.raises(Error, match="exposeNetwork is not supported"):
+        await browser_type.connect(
+            remote_server.ws_endpoint, transport="websocket", expose_network="*"
+        )
@@ -0,0 +1,161 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Dict, List, Tuple, cast
+
+import pytest
+
+from playwright._impl._connection import Channel, ChannelOwner, Connection
+from playwright._impl._helper import ParsedMessagePayload
+from playwright._impl._transport import Transport
+
+
+class ManualTransport(Transport):
+    # Answers initialize and records every other message. Replies to them are
+    # emitted by the test.
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__(loop)
+        self._stopped = loop.create_future()
+        self.sent: List[Dict] = []
+
+    def request_stop(self) -> None:
+        if not self._stopped.done():
+            self._stopped.set_result(None)
+
+    async def wait_until_stopped(self) -> None:
+        await self._stopped
+
+    async def connect(self) -> None:
+        pass
+
+    async def run(self) -> None:
+        await self._stopped
+
+    def send(self, message: Dict) -> None:
+        if message["method"] == "initialize":
+            self._loop.call_soon(self._initialize, message["id"])
+            return
+        self.sent.append(message)
+
+    def emit(self, message: Dict) -> None:
+        self.on_message(cast(ParsedMessagePayload, message), 0)
+
+    def _initialize(self, id: int) -> None:
+        self.emit(
+            {
+                "guid": "",
+                "method": "__create__",
+                "params": {
+                    "type": "Playwright",
+                    "guid": "playwright",
+                    "initializer": {},
+                },
+            }
+        )
+        self.emit({"id": id, "result": {"playwright": {"guid": "playwright"}}})
+
+    async def wait_for_sent(self, count: int) -> List[Dict]:
+        while len(self.sent) < count:
+            await asyncio.sleep(0)
+        return self.sent
+
+
+async def _connect() -> Tuple[Connection, ManualTransport, Channel]:
+    loop = asyncio.get_running_loop()
+    transport = ManualTransport(loop)
+    connection = Connection(
+        None,
+        lambda parent, type, guid, initializer: ChannelOwner(
+            parent, type, guid, initializer
+        ),
+        transport,
+        loop,
+    )
+    loop.create_task(connection.run())
+    playwright = await connection.playwright_future
+    return connection, transport, playwright._channel
+
+
+async def test_should_abort_cancelled_calls_and_consume_their_reply() -> None:
+    connection, transport, channel = await _connect()
+    task = asyncio.create_task(channel.send("slow", None))
+    [call] = await transport.wait_for_sent(1)
+    task.cancel()
+    [_, abort] = await transport.wait_for_sent(2)
+    assert abort["method"] == "__abort__"
+    assert abort["guid"] == call["guid"]
+    assert abort["params"]["id"] == call["id"]
+    # The call stays pending until the driver replies to it.
+    await asyncio.sleep(0)
+    assert not task.done()
+    assert call["id"] in connection._callbacks
+
+    transport.emit({"id": call["id"], "result": {}})
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert call["id"] not in connection._callbacks
+    await connection.stop_async()
+
+
+async def test_should_reject_calls_in_flight_on_transport_error() -> None:
+    connection, transport, channel = await _connect()
+    tasks = [asyncio.create_task(channel.send(method, None)) for method in "abc"]
+    await transport.wait_for_sent(3)
+    transport.on_error_future.set_exception(Exception("Connection lost"))
+    for task in tasks:
+        with pytest.raises(Exception, match="Connection lost"):
+            await task
+    assert connection._callbacks == {}
+    await connection.stop_async()
+
+
+async def test_should_fail_calls_after_transport_error_immediately() -> None:
+    connection, transport, channel = await _connect()
+    transport.on_error_future.set_exception(Exception("Connection lost"))
+    await asyncio.sleep(0)
+    with pytest.raises(Exception, match="Connection lost"):
+        await channel.send("late", None)
+    assert transport.sent == []
+    assert connection._callbacks == {}
+    await connection.stop_async()
+
+
+async def test_should_sample_stacks_at_the_highest_rate_of_active_tracings() -> None:
+    connection, _, _ = await _connect()
+    first, second = object(), object()
+    connection.set_is_tracing(True, first, 0.5)
+    connection.set_is_tracing(True, second, 0.2)
+    assert connection._stack_sample_rate == 0.5
+    connection.set_is_tracing(False, first)
+    assert connection._stack_sample_rate == 0.2
+    connection.set_is_tracing(False, second)
+    assert connection._stack_sample_rate == 1.0
+    await connection.stop_async()
+
+
+async def test_should_count_bytes_received_but_not_dispatched() -> None:
+    transport = ManualTransport(asyncio.get_running_loop())
+    transport._off_loop_parse_threshold = 10
+    received: List[Tuple[ParsedMessagePayload, int]] = []
+    transport.on_message = lambda message, size: received.append((message, size))
+    large = b'{"id": 1, "result": {}}'
+    small = b'{"id": 2}'
+    transport._on_frame(large)
+    transport._on_frame(small)
+    assert transport.pending_bytes() == len(large) + len(small)
+    while len(received) < 2:
+        await asyncio.sleep(0)
+    assert [size for _, size in received] == [len(large), len(small)]
+    assert transport.pending_bytes() == 0
@@ -16,7 +16,7 @@ from typing import List
 
 import pytest
 
-from playwright.async_api import ConsoleMessage, Page
+from playwright.async_api import ConsoleMessage, Error, Page, Playwright
 from tests.server import Server
 
 
@@ -153,3 +153,45 @@ async def test_console_should_not_throw_when_there_are_console_messages_in_detac
     popup = await page_info.value
     # 4. Connect to the popup and make sure it doesn't throw.
     assert await popup.evaluate("1 + 1") == 2
+
+
+async def test_console_should_release_arguments_of_old_messages(
+    playwright: Playwright, page: Page
+) -> None:
+    playwright.set_console_message_retention(2)
+    messages: List[ConsoleMessage] = []
+    page.on("console", lambda m: messages.append(m))
+    try:
+        await page.evaluate("() => { for (let i = 0; i < 5; ++i) console.log({ i }); }")
+    finally:
+        playwright.set_console_message_retention(None)
+    assert len(messages) == 5
+    assert [await m.args[0].json_value() for m in messages[3:]] == [
+        {"i": 3},
+        {"i": 4},
+    ]
+    assert messages[0].text
+    with pytest.raises(Error, match="Arguments of this console message were released"):
+        messages[0].args
+    listed = (await page.console_messages())[-5:]
+    assert await listed[4].args[0].json_value() == {"i": 4}
+    with pytest.raises(Error, match="Arguments of this console message were released"):
+        listed[0].args
+
+
+async def test_console_should_keep_arguments_without_retention(
+    page: Page,
+) -> None:
+    messages: List[ConsoleMessage] = []
+    page.on("console", lambda m: messages.append(m))
+    await page.evaluate("() => { for (let i = 0; i < 5; ++i) console.log({ i }); }")
+    assert [await m.args[0].json_value() for m in messages] == [
+        {"i": i} for i in range(5)
+    ]
+
+
+async def test_console_message_retention_should_be_positive(
+    playwright: Playwright,
+) -> None:
+    with pytest.raises(Error, match="limit must be a positive number"):
+        playwright.set_console_message_retention(0)
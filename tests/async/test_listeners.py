@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+
 from playwright.async_api import Page, Response
 from tests.server import Server
 
@@ -30,3 +32,31 @@ async def test_listeners(page: Page, server: Server) -> None:
     log = []
     await page.goto(f"{server.PREFIX}/input/textarea.html")
     assert len(log) == 0
+
+
+async def test_once_listeners_should_fire_once(page: Page, server: Server) -> None:
+    log = []
+
+    def on_response(response: Response) -> None:
+        log.append(response)
+
+    page.once("response", on_response)
+    await page.goto(f"{server.PREFIX}/input/textarea.html")
+    await page.goto(f"{server.PREFIX}/input/textarea.html")
+    assert len(log) == 1
+    # Removing a listener that already fired is a no-op.
+    page.remove_listener("response", on_response)
+
+
+async def test_async_listeners_should_run_to_completion(
+    page: Page, server: Server
+) -> None:
+    done = asyncio.Event()
+
+    async def on_response(response: Response) -> None:
+        await response.finished()
+        done.set()
+
+    page.on("response", on_response)
+    await page.goto(server.EMPTY_PAGE)
+    await asyncio.wait_for(done.wait(), 5)
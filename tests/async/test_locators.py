@@ -190,6 +190,44 @@ async def test_locators_all_inner_texts(page: Page) -> None:
     assert await element.all_inner_texts() == ["A", "B", "C"]
 
 
+async def test_locators_extract_should_return_columns(page: Page) -> None:
+    await page.set_content(
+        """
+        <article><h2>First</h2><a href="/1">one</a></article>
+        <article><h2>Second</h2><a href="/2">two</a></article>
+        <article><h2>Third</h2></article>
+    """
+    )
+    result = await page.locator("article").extract(
+        {"title": "h2 >> text", "href": "a@href", "link": "a"}
+    )
+    assert result == {
+        "title": ["First", "Second", "Third"],
+        "href": ["/1", "/2", None],
+        "link": ["one", "two", None],
+    }
+
+
+async def test_locators_extract_should_return_rows_and_paginate(page: Page) -> None:
+    await page.set_content(
+        """
+        <ul>
+          <li data-id="1"><b>A</b></li>
+          <li data-id="2"><b>B</b></li>
+          <li data-id="3"><b>C</b></li>
+        </ul>
+    """
+    )
+    locator = page.locator("li")
+    assert await locator.extract(
+        {"id": "@data-id", "html": ">> html"}, layout="rows", offset=1, limit=1
+    ) == [{"id": "2", "html": "<b>B</b>"}]
+    assert await locator.extract({"name": "b"}, layout="rows", offset=2) == [
+        {"name": "C"}
+    ]
+    assert await page.locator("p").extract({"name": "b"}) == {"name": []}
+
+
 async def test_locators_should_query_existing_element(
     page: Page, server: Server
 ) -> None:
@@ -0,0 +1,187 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from playwright._impl._metrics import Histogram
+from playwright.async_api import (
+    ApiCallMetric,
+    ConsoleMessage,
+    Error,
+    InMemoryMetricsCollector,
+    MemoryBudget,
+    MetricsCollector,
+    Page,
+    Playwright,
+    StallMonitor,
+    StallWarning,
+)
+from tests.server import Server
+
+
+async def test_should_collect_api_call_metrics(
+    playwright: Playwright, page: Page, server: Server
+) -> None:
+    collector = InMemoryMetricsCollector()
+    playwright.set_metrics_collector(collector)
+    try:
+        await page.goto(server.EMPTY_PAGE)
+        await page.evaluate("1 + 2")
+        await page.evaluate("1 + 2")
+        with pytest.raises(Error):
+            await page.evaluate("() => { throw new Error('boom') }")
+    finally:
+        playwright.set_metrics_collector(None)
+    await page.evaluate("1 + 2")
+
+    snapshot = collector.snapshot()
+    assert snapshot["Page.goto"]["count"] == 1
+    assert snapshot["Page.goto"]["errors"] == 0
+    evaluate = snapshot["Page.evaluate"]
+    assert evaluate["count"] == 3
+    assert evaluate["errors"] == 1
+    assert evaluate["error_rate"] == pytest.approx(1 / 3)
+    assert evaluate["request_bytes"] > 0
+    assert evaluate["response_bytes"] > 0
+    latency = evaluate["latency"]
+    assert 0 < latency["min"] <= latency["p50"] <= latency["p99"] <= latency["max"]
+
+    collector.reset()
+    assert collector.snapshot() == {}
+
+
+async def test_should_pass_metrics_to_custom_collector(
+    playwright: Playwright, page: Page
+) -> None:
+    metrics = []
+
+    class Collector(MetricsCollector):
+        def record(self, metric: ApiCallMetric) -> None:
+            metrics.append(metric)
+
+    playwright.set_metrics_collector(Collector())
+    try:
+        await page.evaluate("1 + 2")
+    finally:
+        playwright.set_metrics_collector(None)
+    [metric] = metrics
+    assert metric.method == "Frame.evaluateExpression"
+    assert metric.api_name == "Page.evaluate"
+    assert metric.duration > 0
+    assert metric.error is None
+
+
+async def test_stall_monitor_should_name_blocking_handler(
+    playwright: Playwright, page: Page
+) -> None:
+    monitor = StallMonitor(handler_threshold=50)
+
+    def blocking_handler(message: ConsoleMessage) -> None:
+        time.sleep(0.1)
+
+    page.on("console", blocking_handler)
+    playwright.set_stall_monitor(monitor)
+    try:
+        with pytest.warns(StallWarning, match="blocking_handler"):
+            async with page.expect_console_message():
+                await page.evaluate("console.log('hello')")
+    finally:
+        playwright.set_stall_monitor(None)
+    snapshot = monitor.snapshot()
+    [stats] = [
+        stats
+        for name, stats in snapshot["handlers"].items()
+        if "blocking_handler" in name
+    ]
+    assert stats["stalls"] == 1
+    assert stats["max"] >= 100
+
+
+async def test_memory_budget_should_evict_finished_requests(
+    playwright: Playwright, page: Page, server: Server
+) -> None:
+    budget = MemoryBudget(max_objects=2)
+    playwright.set_memory_budget(budget)
+    try:
+        first = await page.goto(server.EMPTY_PAGE)
+        for _ in range(5):
+            await page.goto(server.EMPTY_PAGE)
+        snapshot = budget.snapshot()
+    finally:
+        playwright.set_memory_budget(None)
+    assert snapshot["evicted"] > 0
+    # Evicted objects that are still held keep working.
+    assert first
+    assert first.request.url == server.EMPTY_PAGE
+    await first.body()
+
+
+async def test_memory_budget_should_keep_redirect_chains_and_navigation_responses(
+    playwright: Playwright, page: Page, server: Server
+) -> None:
+    server.set_redirect("/foo.html", "/empty.html")
+    budget = MemoryBudget(max_objects=1)
+    playwright.set_memory_budget(budget)
+    try:
+        for _ in range(3):
+            response = await page.goto(server.PREFIX + "/foo.html")
+            assert response
+            assert response.url == server.EMPTY_PAGE
+            redirected_from = response.request.redirected_from
+            assert redirected_from
+            assert redirected_from.url == server.PREFIX + "/foo.html"
+        # The stylesheet finishes before goto() returns the document response.
+        response = await page.goto(server.PREFIX + "/one-style.html")
+        assert response
+        assert response.ok
+        assert budget.snapshot()["evicted"] > 0
+    finally:
+        playwright.set_memory_budget(None)
+
+
+async def test_memory_budget_should_evict_handles_and_keep_held_ones_usable(
+    playwright: Playwright, page: Page
+) -> None:
+    budget = MemoryBudget(max_objects=1)
+    playwright.set_memory_budget(budget)
+    try:
+        first = await page.evaluate_handle("() => ({ value: 42 })")
+        for _ in range(3):
+            await page.evaluate_handle("() => document.body")
+        # Handles created during a single call are all returned by its reply.
+        object = await page.evaluate_handle("() => ({ a: 1, b: 2, c: 3 })")
+        properties = await object.get_properties()
+        snapshot = budget.snapshot()
+    finally:
+        playwright.set_memory_budget(None)
+    assert snapshot["evicted"] >= 6
+    assert await first.json_value() == {"value": 42}
+    assert [await handle.json_value() for handle in properties.values()] == [1, 2, 3]
+
+
+def test_histogram_percentiles_should_be_accurate() -> None:
+    histogram = Histogram()
+    for value in range(1, 10001):
+        histogram.record(value / 10)
+    assert histogram.count == 10000
+    assert histogram.min == 0.1
+    assert histogram.max == 1000
+    assert histogram.mean == pytest.approx(500.05)
+    for percentile in (50, 90, 99):
+        assert histogram.percentile(percentile) == pytest.approx(
+            percentile * 10, rel=0.04
+        )
+    assert histogram.percentile(100) == 1000
@@ -132,6 +132,17 @@ async def test_close_should_terminate_network_waiters(
         assert "Timeout" not in error.message
 
 
+async def test_waiters_should_not_spawn_a_task_per_timeout(page: Page) -> None:
+    tasks_before = len(asyncio.all_tasks())
+    waiters = [page.expect_console_message() for _ in range(100)]
+    infos = [await waiter.__aenter__() for waiter in waiters]
+    assert len(asyncio.all_tasks()) - tasks_before < 10
+    await page.evaluate("console.log('hello')")
+    for waiter in waiters:
+        await waiter.__aexit__(None, None, None)
+    assert all([(await info.value).text == "hello" for info in infos])
+
+
 async def test_close_should_be_callable_twice(context: BrowserContext) -> None:
     page = await context.new_page()
     await asyncio.gather(
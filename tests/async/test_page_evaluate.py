@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import array
+import asyncio
+import json
 import math
 from datetime import datetime, timedelta, timezone
 from typing import Optional
@@ -73,7 +76,8 @@ async def test_evaluate_transfer_typed_arrays(page: Page) -> None:
         result = await page.evaluate(
             f"() => new {typed_array}([1{value_suffix}, 2{value_suffix}, 3{value_suffix}])"
         )
-        assert result == expected
+        assert isinstance(result, array.array)
+        assert result.tolist() == expected
 
     await test_typed_array("Int8Array", [1, 2, 3], None)
     await test_typed_array("Uint8Array", [1, 2, 3], None)
@@ -88,6 +92,16 @@ async def test_evaluate_transfer_typed_arrays(page: Page) -> None:
     await test_typed_array("BigUint64Array", [1, 2, 3], "n")
 
 
+async def test_evaluate_roundtrip_typed_arrays(page: Page) -> None:
+    value = array.array("f", [1.5, 2.5, 3.5])
+    assert await page.evaluate("a => a.constructor.name", value) == "Float32Array"
+    assert await page.evaluate("a => a", value) == value
+    assert (
+        await page.evaluate("a => a.b.length", {"b": array.array("B", range(256))})
+        == 256
+    )
+
+
 async def test_evaluate_transfer_bigint(page: Page) -> None:
     assert await page.evaluate("() => 42n") == 42
     assert await page.evaluate("a => a", 17) == 17
@@ -353,3 +367,20 @@ async def test_evaluate_jsonvalue_url(page: Page) -> None:
     url = urlparse("https://example.com/")
     result = await page.evaluate('() => ({ someKey: new URL("https://example.com/") })')
     assert result == {"someKey": url}
+
+
+async def test_should_return_large_results_alongside_small_ones(page: Page) -> None:
+    messages = []
+    page.on("console", lambda message: messages.append(message.text))
+    results = await asyncio.gather(
+        page.evaluate(
+            "JSON.stringify(Array.from({ length: 200000 }, (_, i) => ({ i })))"
+        ),
+        page.evaluate("'x'.repeat(5 * 1024 * 1024)"),
+        *(page.evaluate(f"console.log('{i}') || {i}") for i in range(20)),
+    )
+    items = [{"i": i} for i in range(200000)]
+    assert results[0] == json.dumps(items, separators=(",", ":"))
+    assert results[1] == "x" * 5 * 1024 * 1024
+    assert results[2:] == list(range(20))
+    assert messages == [str(i) for i in range(20)]
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import asyncio
+import threading
+import time
 
 import pytest
 
@@ -211,3 +213,67 @@ async def test_show_actions_should_accept_cursor_param(page: Page) -> None:
             pass
     finally:
         await page.screencast.stop()
+
+
+async def test_pipeline_should_deliver_frames_on_event_loop_thread(
+    page: Page, server: Server
+) -> None:
+    received: list = []
+    threads: set = set()
+
+    def on_frame(frame: ScreencastFrame) -> None:
+        threads.add(threading.get_ident())
+        received.append(frame["data"])
+
+    await page.screencast.start(on_frame=on_frame, queue_size=2)
+    try:
+        await page.goto(server.EMPTY_PAGE)
+        await page.evaluate("() => document.body.style.backgroundColor = 'red'")
+        for _ in range(100):
+            await ensure_some_frames(page)
+            if received:
+                break
+        stats = page.screencast.frame_stats()
+    finally:
+        await page.screencast.stop()
+    assert len(received) >= 1
+    assert all(isinstance(d, bytes) and len(d) > 0 for d in received)
+    assert threads == {threading.get_ident()}
+    assert stats["delivered"] >= 1
+    assert stats["received"] >= stats["delivered"]
+    assert stats["latency"]["max"] >= stats["latency"]["min"]
+
+
+async def test_pipeline_keep_latest_should_drop_stale_frames(
+    page: Page, server: Server
+) -> None:
+    delivered = 0
+
+    def on_frame(_: ScreencastFrame) -> None:
+        nonlocal delivered
+        delivered += 1
+        time.sleep(0.5)
+
+    await page.goto(server.EMPTY_PAGE)
+    await page.evaluate(
+        """() => {
+            const animate = () => {
+                document.body.style.backgroundColor =
+                    document.body.style.backgroundColor === "red" ? "blue" : "red";
+                requestAnimationFrame(animate);
+            };
+            requestAnimationFrame(animate);
+        }"""
+    )
+    await page.screencast.start(on_frame=on_frame, overflow="keep-latest")
+    try:
+        # The slow callback must not block the dispatcher.
+        for _ in range(20):
+            assert await page.evaluate("1 + 1") == 2
+            await page.wait_for_timeout(100)
+        stats = page.screencast.frame_stats()
+    finally:
+        await page.screencast.stop()
+    assert delivered >= 1
+    assert stats["dropped"] > 0
+    assert stats["queue_depth"] <= 1
@@ -93,3 +93,30 @@ async def test_should_infer_webp_screenshot_type_from_path(
     output_webp_file = tmp_path / "foo.webp"
     await page.screenshot(path=output_webp_file)
     assert_image_file_format(output_webp_file, "WEBP")
+
+
+async def test_should_return_raw_pixels(page: Page) -> None:
+    await page.set_viewport_size({"width": 100, "height": 50})
+    await page.set_content(
+        """
+        <style>body { margin: 0; background: rgb(255, 0, 0); }</style>
+        <div style="width: 20px; height: 10px; background: rgb(0, 0, 255)"></div>
+        """
+    )
+    image = await page.screenshot_raw(scale="css")
+    assert (image.width, image.height) == (100, 50)
+    assert len(image.data) == 100 * 50 * 4
+    assert image.data[:4] == bytes([0, 0, 255, 255])
+    assert image.data[-4:] == bytes([255, 0, 0, 255])
+
+    clipped = await page.screenshot_raw(
+        scale="css", clip={"x": 10, "y": 5, "width": 30, "height": 20}
+    )
+    assert (clipped.width, clipped.height) == (30, 20)
+    assert clipped.data[:4] == bytes([0, 0, 255, 255])
+
+    masked = await page.locator("div").screenshot_raw(
+        scale="css", mask=[page.locator("div")], mask_color="rgb(0, 255, 0)"
+    )
+    assert (masked.width, masked.height) == (20, 10)
+    assert masked.data == bytes([0, 255, 0, 255]) * 20 * 10
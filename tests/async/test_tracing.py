@@ -19,10 +19,15 @@ import zipfile
 from pathlib import Path
 from typing import AsyncContextManager, Callable
 
+import pytest
+
 from playwright.async_api import (
     Browser,
     BrowserContext,
     BrowserType,
+    CallbackTraceSink,
+    DirectoryTraceSink,
+    Error,
     Page,
     Playwright,
     Response,
@@ -443,3 +448,121 @@ async def test_should_record_a_zipped_har_for_apirequestcontext(
     assert any(
         e["request"]["url"] == server.PREFIX + "/simple.json" for e in log["entries"]
     )
+
+
+async def test_should_export_chunks_to_sink_in_background(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    uploaded: list = []
+
+    async def upload(name: str, path: Path) -> None:
+        with zipfile.ZipFile(path) as archive:
+            uploaded.append((name, archive.namelist()))
+
+    context = await browser.new_context()
+    page = await context.new_page()
+    await context.tracing.start(name="sink", sink=CallbackTraceSink(upload))
+    await page.goto(server.EMPTY_PAGE)
+    await context.tracing.stop_chunk()
+    await context.tracing.start_chunk(name="sink")
+    await page.goto(server.PREFIX + "/one-style.html")
+    await context.tracing.stop()
+    # Pending exports are flushed before the context closes.
+    await context.close()
+    assert [name for name, _ in uploaded] == ["sink-1.zip", "sink-2.zip"]
+    assert all("trace.trace" in entries for _, entries in uploaded)
+
+
+async def test_should_roll_over_chunks_by_size(
+    browser_type: BrowserType,
+    server: Server,
+    tmp_path: Path,
+    launch_arguments: dict,
+) -> None:
+    browser = await browser_type.launch(
+        traces_dir=tmp_path / "traces", **launch_arguments
+    )
+    context = await browser.new_context()
+    page = await context.new_page()
+    output = tmp_path / "chunks"
+    await context.tracing.start(
+        name="rollover",
+        snapshots=True,
+        sink=DirectoryTraceSink(output),
+        max_chunk_size=1,
+    )
+    for _ in range(3):
+        await page.goto(server.PREFIX + "/grid.html")
+        await asyncio.sleep(1.5)
+    await context.tracing.stop()
+    await context.close()
+    await browser.close()
+    chunks = sorted(output.iterdir())
+    assert len(chunks) > 1
+    for chunk in chunks:
+        with zipfile.ZipFile(chunk) as archive:
+            assert "trace.trace" in archive.namelist()
+
+
+async def test_recorder_should_only_export_kept_chunks(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    output = tmp_path / "kept"
+    context = await browser.new_context()
+    page = await context.new_page()
+    await context.tracing.start(
+        name="recorder",
+        snapshots=True,
+        sink=DirectoryTraceSink(output),
+        chunk_duration=200,
+        retain_chunks=2,
+        stack_sample_rate=0.5,
+    )
+    for _ in range(5):
+        await page.goto(server.EMPTY_PAGE)
+        await page.wait_for_timeout(250)
+    await context.tracing.keep_recent()
+    await page.goto(server.PREFIX + "/one-style.html")
+    # Chunks recorded after keep_recent() are dropped on stop.
+    await context.tracing.stop()
+    await context.close()
+    chunks = sorted(output.iterdir())
+    assert 1 <= len(chunks) <= 3
+    for chunk in chunks:
+        with zipfile.ZipFile(chunk) as archive:
+            assert "trace.trace" in archive.namelist()
+
+
+async def test_recorder_should_keep_chunks_on_error(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    output = tmp_path / "kept"
+    context = await browser.new_context()
+    page = await context.new_page()
+    await context.tracing.start(
+        sink=DirectoryTraceSink(output), retain_chunks=1, keep_on_error=True
+    )
+    await page.goto(server.EMPTY_PAGE)
+    with pytest.raises(Error):
+        await page.click("#missing", timeout=100)
+    await context.close()
+    assert [chunk.name for chunk in output.iterdir()] == ["trace-1.zip"]
+
+
+async def test_recorder_should_ignore_errors_in_other_contexts(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    output = tmp_path / "kept"
+    context = await browser.new_context()
+    other = await browser.new_context()
+    await context.tracing.start(
+        sink=DirectoryTraceSink(output), retain_chunks=1, keep_on_error=True
+    )
+    page = await other.new_page()
+    await page.goto(server.EMPTY_PAGE)
+    with pytest.raises(Error):
+        await page.click("#missing", timeout=100)
+    await other.close()
+    await context.tracing.stop()
+    await context.close()
+    assert not output.exists() or list(output.iterdir()) == []
@@ -17,6 +17,7 @@ from pathlib import Path
 import pytest
 
 from playwright.sync_api import BrowserContext, Error, Page
+from tests.server import Server
 
 
 def test_add_init_script_evaluate_before_anything_else_on_the_page(page: Page) -> None:
@@ -93,3 +94,26 @@ def test_add_init_script_returns_disposable(page: Page) -> None:
         assert page.evaluate("window.result") == 123
     page.goto("data:text/html,<script>window.result = window.injected</script>")
     assert page.evaluate("window.result") is None
+
+
+def test_register_function_should_call_by_id(
+    context: BrowserContext, server: Server
+) -> None:
+    page = context.new_page()
+    fn = context.register_function("([a, b]) => a * b")
+    assert page.call(fn, [6, 7]) == 42
+    page.goto(server.EMPTY_PAGE)
+    assert page.call(fn, [2, 3]) == 6
+
+
+def test_unregister_function_should_remove_its_init_script(
+    context: BrowserContext, server: Server
+) -> None:
+    page = context.new_page()
+    fn = context.register_function("() => 42")
+    page.goto(server.EMPTY_PAGE)
+    assert page.call(fn) == 42
+    context.unregister_function(fn)
+    page.goto(server.EMPTY_PAGE)
+    with pytest.raises(Error, match="is not registered"):
+        page.call(fn)
@@ -14,6 +14,7 @@
 
 import datetime
 import re
+from pathlib import Path
 
 import pytest
 
@@ -1098,6 +1099,26 @@ def test_soft_inside_scope_collects_failures(page: Page, server: Server) -> None
     assert all(isinstance(e, AssertionError) for e in errors)
 
 
+def test_expect_all_should_pass(page: Page) -> None:
+    page.set_content("<div>hello</div><span>world</span>")
+    with expect.all():
+        expect(page.locator("div")).to_have_text("hello")
+        expect(page.locator("span")).to_have_text("world")
+        expect(page.locator("p")).not_to_be_visible()
+
+
+def test_expect_all_should_report_all_failures(page: Page) -> None:
+    page.set_content("<div>hello</div>")
+    with pytest.raises(AssertionError) as excinfo:
+        with expect.all():
+            expect(page.locator("div")).to_have_text("nope", timeout=500)
+            expect(page.locator("div")).to_have_text("hello")
+            expect(page).to_have_title("neither", timeout=500)
+    assert "2 of 3 expectations failed" in str(excinfo.value)
+    assert "'nope'" in str(excinfo.value)
+    assert "'neither'" in str(excinfo.value)
+
+
 def test_assertions_should_include_aria_snapshot_in_separate_section(
     page: Page,
 ) -> None:
@@ -1116,3 +1137,46 @@ def test_assertions_should_include_aria_snapshot_in_separate_section(
     actual_line = message.split("\n")[1]
     assert 'heading "Page Heading"' not in actual_line
     assert message.index('heading "Page Heading"') > message.index("Aria snapshot:")
+
+
+def test_to_match_screenshot(page: Page, tmp_path: Path) -> None:
+    page.set_viewport_size({"width": 100, "height": 100})
+    page.set_content('<div style="width: 50px; height: 50px; background: blue"></div>')
+    with pytest.raises(AssertionError, match="A snapshot doesn't exist"):
+        expect(page).to_match_screenshot("page.png", snapshot_dir=tmp_path)
+    [golden] = tmp_path.glob("golden-*/page.png")
+    expect(page).to_match_screenshot("page.png", snapshot_dir=tmp_path)
+
+    page.evaluate("document.querySelector('div').style.width = '60px'")
+    with pytest.raises(AssertionError) as exc_info:
+        expect(page).to_match_screenshot(
+            "page.png", snapshot_dir=tmp_path, timeout=1000
+        )
+    assert "500 pixels (ratio 0.05 of all image pixels) are different" in str(
+        exc_info.value
+    )
+    assert golden.with_name("page-diff.png").exists()
+    assert golden.with_name("page-actual.png").exists()
+    expect(page).to_match_screenshot(
+        "page.png", snapshot_dir=tmp_path, max_diff_pixels=500
+    )
+
+
+def test_to_match_screenshot_with_locator_and_mask(page: Page, tmp_path: Path) -> None:
+    page.set_content(
+        '<section style="width: 40px; height: 40px; background: blue">'
+        '<div style="width: 20px; height: 20px; background: red"></div>'
+        "</section>"
+    )
+    with pytest.raises(AssertionError, match="A snapshot doesn't exist"):
+        expect(page.locator("section")).to_match_screenshot(
+            "section.png", snapshot_dir=tmp_path, mask=[page.locator("div")]
+        )
+    page.evaluate("document.querySelector('div').style.background = 'green'")
+    expect(page.locator("section")).to_match_screenshot(
+        "section.png", snapshot_dir=tmp_path, mask=[page.locator("div")]
+    )
+    with pytest.raises(AssertionError, match="400 pixels"):
+        expect(page.locator("section")).to_match_screenshot(
+            "section.png", snapshot_dir=tmp_path, timeout=1000
+        )
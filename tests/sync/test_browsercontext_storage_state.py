@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import json
+import os
+import time
 from pathlib import Path
 
 from playwright.sync_api import Browser, BrowserContext, Page, StorageState
@@ -193,3 +195,37 @@ def test_should_round_trip_webauthn_credentials_with_storage_state(
     assert context2.storage_state(credentials=True) == state
     context.close()
     context2.close()
+
+
+def test_should_reload_storage_state_file_after_it_changed(
+    browser: Browser, tmp_path: Path
+) -> None:
+    path = tmp_path / "storage-state.json"
+
+    def local_storage_from_file(value: str, age: float) -> str:
+        path.write_text(
+            json.dumps(
+                {
+                    "cookies": [],
+                    "origins": [
+                        {
+                            "origin": "https://www.example.com",
+                            "localStorage": [{"name": "name", "value": value}],
+                        }
+                    ],
+                }
+            )
+        )
+        mtime = time.time() - age
+        os.utime(path, (mtime, mtime))
+        context = browser.new_context(storage_state=path)
+        page = context.new_page()
+        page.route("**/*", lambda route: route.fulfill(body="<html></html>"))
+        page.goto("https://www.example.com")
+        result = page.evaluate("localStorage['name']")
+        context.close()
+        return result
+
+    assert local_storage_from_file("first", 60) == "first"
+    assert local_storage_from_file("first", 60) == "first"
+    assert local_storage_from_file("second", 30) == "second"
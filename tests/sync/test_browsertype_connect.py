@@ -249,3 +249,19 @@ def test_set_input_files_should_preserve_last_modified_timestamp(
     # rounds it to seconds in WebKit: 1696272058110 -> 1696272058000.
     for i in range(len(timestamps)):
         assert abs(timestamps[i] - expected_timestamps[i]) < 1000
+
+
+def test_should_connect_over_direct_websocket_transport(
+    server: Server, browser_type: BrowserType, launch_server: Callable[[], RemoteServer]
+) -> None:
+    remote_server = launch_server()
+    browser = browser_type.connect(
+        remote_server.ws_endpoint, transport="websocket", slow_mo=100
+    )
+    page = browser.new_page()
+    t1 = time.monotonic()
+    assert page.evaluate("11 * 11") == 121
+    assert (time.monotonic() - t1) >= 0.1
+    page.goto(server.EMPTY_PAGE)
+    browser.close()
+    assert not browser.is_connected()
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Dict, List, Optional, Tuple
+
 import pytest
 
 from playwright.sync_api import Browser, Error, Page
@@ -45,6 +47,26 @@ def test_should_receive_events(page: Page, server: Server) -> None:
     assert len(events) == 1
 
 
+@pytest.mark.only_browser("chromium")
+def test_should_send_many_commands_in_order(page: Page) -> None:
+    client = page.context.new_cdp_session(page)
+    commands: List[Tuple[str, Optional[Dict]]] = [
+        ("Runtime.evaluate", {"expression": f"{i} * 2", "returnByValue": True})
+        for i in range(50)
+    ]
+    commands.insert(10, ("Runtime.doesNotExist", None))
+    results = client.send_many(commands, concurrency=8)
+    assert len(results) == 51
+    assert isinstance(results[10], Error)
+    values = [
+        result["result"]["value"] for result in results if result is not results[10]
+    ]
+    assert values == [i * 2 for i in range(50)]
+    assert client.send_many([]) == []
+    with pytest.raises(Error, match="concurrency must be a positive number"):
+        client.send_many(commands, concurrency=0)
+
+
 @pytest.mark.only_browser("chromium")
 def test_should_be_able_to_detach_session(page: Page) -> None:
     client = page.context.new_cdp_session(page)
@@ -78,3 +100,32 @@ def test_should_detach_when_page_closes(browser: Browser) -> None:
     with pytest.raises(Error):
         session.detach()
     context.close()
+
+
+@pytest.mark.only_browser("chromium")
+def test_should_stream_filtered_events_in_batches(page: Page, server: Server) -> None:
+    client = page.context.new_cdp_session(page)
+    client.send("Runtime.enable")
+    stream = client.stream(
+        methods=["Runtime.consoleAPICalled"], max_batch=2, translate_guids=False
+    )
+    page.evaluate("() => { for (let i = 0; i < 5; i++) console.log(i) }")
+    values = []
+    with stream:
+        for batch in stream:
+            assert 1 <= len(batch) <= 2
+            for event in batch:
+                assert event["method"] == "Runtime.consoleAPICalled"
+                values.append(event["params"]["args"][0]["value"])
+            if len(values) == 5:
+                break
+    assert values == [0, 1, 2, 3, 4]
+    assert stream.dropped == 0
+
+
+@pytest.mark.only_browser("chromium")
+def test_stream_should_end_when_session_detaches(page: Page) -> None:
+    client = page.context.new_cdp_session(page)
+    stream = client.stream()
+    client.detach()
+    assert list(stream) == []
@@ -16,7 +16,7 @@ from typing import List
 
 import pytest
 
-from playwright.sync_api import ConsoleMessage, Page
+from playwright.sync_api import ConsoleMessage, Error, Page, Playwright
 from tests.server import Server
 
 
@@ -157,3 +157,24 @@ def test_console_should_not_throw_when_there_are_console_messages_in_detached_if
         )
     # 4. Connect to the popup and make sure it doesn't throw.
     assert popup.value.evaluate("1 + 1") == 2
+
+
+def test_console_should_release_arguments_of_old_messages(
+    playwright: Playwright, page: Page
+) -> None:
+    playwright.set_console_message_retention(2)
+    messages: List[ConsoleMessage] = []
+    page.on("console", lambda m: messages.append(m))
+    try:
+        page.evaluate("() => { for (let i = 0; i < 5; ++i) console.log({ i }); }")
+    finally:
+        playwright.set_console_message_retention(None)
+    assert len(messages) == 5
+    assert [m.args[0].json_value() for m in messages[3:]] == [{"i": 3}, {"i": 4}]
+    assert messages[0].text
+    with pytest.raises(Error, match="Arguments of this console message were released"):
+        messages[0].args
+    listed = page.console_messages()[-5:]
+    assert listed[4].args[0].json_value() == {"i": 4}
+    with pytest.raises(Error, match="Arguments of this console message were released"):
+        listed[0].args
@@ -31,3 +31,17 @@ def test_listeners(page: Page, server: Server) -> None:
     log = []
     page.goto(f"{server.PREFIX}/input/textarea.html")
     assert len(log) == 0
+
+
+def test_once_listeners_should_fire_once(page: Page, server: Server) -> None:
+    log = []
+
+    def on_response(response: Response) -> None:
+        log.append(response)
+
+    page.once("response", on_response)
+    page.goto(f"{server.PREFIX}/input/textarea.html")
+    page.goto(f"{server.PREFIX}/input/textarea.html")
+    assert len(log) == 1
+    # Removing a listener that already fired is a no-op.
+    page.remove_listener("response", on_response)
@@ -187,6 +187,21 @@ def test_locators_all_inner_texts(page: Page) -> None:
     assert element.all_inner_texts() == ["A", "B", "C"]
 
 
+def test_locators_extract_should_return_columns(page: Page) -> None:
+    page.set_content(
+        """
+        <article><h2>First</h2><a href="/1">one</a></article>
+        <article><h2>Second</h2></article>
+    """
+    )
+    assert page.locator("article").extract(
+        {"title": "h2 >> text", "href": "a@href"}
+    ) == {"title": ["First", "Second"], "href": ["/1", None]}
+    assert page.locator("article").extract({"title": "h2"}, layout="rows", limit=1) == [
+        {"title": "First"}
+    ]
+
+
 def test_locators_should_query_existing_element(page: Page, server: Server) -> None:
     page.goto(server.PREFIX + "/playground.html")
     page.set_content(
@@ -0,0 +1,53 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import array
+from typing import Optional
+
+from playwright.sync_api import Page
+
+
+def test_evaluate_transfer_typed_arrays(page: Page) -> None:
+    def test_typed_array(
+        typed_array: str, expected: list[float], value_suffix: Optional[str]
+    ) -> None:
+        value_suffix = "" if value_suffix is None else value_suffix
+        result = page.evaluate(
+            f"() => new {typed_array}([1{value_suffix}, 2{value_suffix}, 3{value_suffix}])"
+        )
+        assert isinstance(result, array.array)
+        assert result.tolist() == expected
+
+    test_typed_array("Int8Array", [1, 2, 3], None)
+    test_typed_array("Uint8Array", [1, 2, 3], None)
+    test_typed_array("Uint8ClampedArray", [1, 2, 3], None)
+    test_typed_array("Int16Array", [1, 2, 3], None)
+    test_typed_array("Uint16Array", [1, 2, 3], None)
+    test_typed_array("Int32Array", [1, 2, 3], None)
+    test_typed_array("Uint32Array", [1, 2, 3], None)
+    test_typed_array("Float32Array", [1.5, 2.5, 3.5], ".5")
+    test_typed_array("Float64Array", [1.5, 2.5, 3.5], ".5")
+    test_typed_array("BigInt64Array", [1, 2, 3], "n")
+    test_typed_array("BigUint64Array", [1, 2, 3], "n")
+
+
+def test_evaluate_roundtrip_typed_arrays(page: Page) -> None:
+    value = array.array("f", [1.5, 2.5, 3.5])
+    assert page.evaluate("a => a.constructor.name", value) == "Float32Array"
+    assert page.evaluate("a => a", value) == value
+    assert page.evaluate("a => a.b.length", {"b": array.array("B", range(256))}) == 256
+    # There is no clamped array.array, Uint8ClampedArray comes back as "B".
+    clamped = page.evaluate("() => new Uint8ClampedArray([1, 2])")
+    assert clamped.typecode == "B"
+    assert page.evaluate("a => a.constructor.name", clamped) == "Uint8Array"
@@ -19,10 +19,15 @@ import zipfile
 from pathlib import Path
 from typing import Callable, ContextManager
 
+import pytest
+
 from playwright.sync_api import (
     Browser,
     BrowserContext,
     BrowserType,
+    CallbackTraceSink,
+    DirectoryTraceSink,
+    Error,
     Page,
     Playwright,
     Response,
@@ -441,3 +446,100 @@ def test_should_record_a_zipped_har_for_apirequestcontext(
     assert any(
         e["request"]["url"] == server.PREFIX + "/simple.json" for e in log["entries"]
     )
+
+
+def test_should_export_chunks_to_sink_in_background(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    uploaded: list = []
+
+    def upload(name: str, path: Path) -> None:
+        with zipfile.ZipFile(path) as archive:
+            uploaded.append((name, archive.namelist()))
+
+    context = browser.new_context()
+    page = context.new_page()
+    context.tracing.start(name="sink", sink=CallbackTraceSink(upload))
+    page.goto(server.EMPTY_PAGE)
+    context.tracing.stop_chunk()
+    context.tracing.start_chunk(name="sink")
+    page.goto(server.PREFIX + "/one-style.html")
+    context.tracing.stop()
+    # Pending exports are flushed before the context closes.
+    context.close()
+    assert [name for name, _ in uploaded] == ["sink-1.zip", "sink-2.zip"]
+    assert all("trace.trace" in entries for _, entries in uploaded)
+
+
+def test_should_roll_over_chunks_by_size(
+    browser_type: BrowserType,
+    server: Server,
+    tmp_path: Path,
+    launch_arguments: dict,
+) -> None:
+    browser = browser_type.launch(traces_dir=tmp_path / "traces", **launch_arguments)
+    context = browser.new_context()
+    page = context.new_page()
+    output = tmp_path / "chunks"
+    context.tracing.start(
+        name="rollover",
+        snapshots=True,
+        sink=DirectoryTraceSink(output),
+        max_chunk_size=1,
+    )
+    for _ in range(3):
+        page.goto(server.PREFIX + "/grid.html")
+        page.wait_for_timeout(1500)
+    context.tracing.stop()
+    context.close()
+    browser.close()
+    chunks = sorted(output.iterdir())
+    assert len(chunks) > 1
+    for chunk in chunks:
+        with zipfile.ZipFile(chunk) as archive:
+            assert "trace.trace" in archive.namelist()
+
+
+def test_recorder_should_only_export_kept_chunks(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    output = tmp_path / "kept"
+    context = browser.new_context()
+    page = context.new_page()
+    context.tracing.start(
+        name="recorder",
+        snapshots=True,
+        sink=DirectoryTraceSink(output),
+        chunk_duration=200,
+        retain_chunks=2,
+        stack_sample_rate=0.5,
+    )
+    for _ in range(5):
+        page.goto(server.EMPTY_PAGE)
+        page.wait_for_timeout(250)
+    context.tracing.keep_recent()
+    page.goto(server.PREFIX + "/one-style.html")
+    # Chunks recorded after keep_recent() are dropped on stop.
+    context.tracing.stop()
+    context.close()
+    chunks = sorted(output.iterdir())
+    assert 1 <= len(chunks) <= 3
+    for chunk in chunks:
+        with zipfile.ZipFile(chunk) as archive:
+            assert "trace.trace" in archive.namelist()
+
+
+def test_recorder_should_keep_chunks_on_error(
+    browser: Browser, server: Server, tmp_path: Path
+) -> None:
+    output = tmp_path / "kept"
+    context = browser.new_context()
+    page = context.new_page()
+    context.tracing.start(
+        sink=DirectoryTraceSink(output), retain_chunks=1, keep_on_error=True
+    )
+    page.goto(server.EMPTY_PAGE)
+    with pytest.raises(Error):
+        page.click("#missing", timeout=100)
+    context.close()
+    assert [chunk.name for chunk in output.iterdir()] == ["trace-1.zip"]